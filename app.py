@@ -1,13 +1,17 @@
-
 import logging
 import cv2
 import time
+import threading
 import hjson
 import numpy as np
 
-from flask_socketio import SocketIO
+from flask import request
+from flask_socketio import SocketIO, join_room, leave_room
 from harvesterWrapper import HarvesterWrapper
-from cameraImg import CameraImg
+from cameraPipeline import CameraPipeline, channelRoom
+from metrics import METRICS, metricsText
+from measurementRecorder import readRange
+from streamClients import StreamClients, StreamParams
 
 class AbortedException(Exception):
     pass
@@ -21,61 +25,64 @@ class App():
         super().__init__()
 
         self.socketio = socketio
+        # camera slouzi k vyctu zarizeni, kazda spustena kamera dostane vlastni instanci (camera.newDevice)
         self.camera : HarvesterWrapper = camera
         self.config = config
-        self.currImage : CameraImg = None
 
-        # aktualne spustena kamera
-        self.captureDeviceName = ""
+        # spustene kamery: serial -> CameraPipeline (poradi spusteni, prvni = vychozi)
+        self.pipelines = {}
+        self.pipelinesLock = threading.Lock()
+
+        # odberatele kanalu (MEAS_DATA, PROFILE_DATA, SURFACE_DATA): sid -> {(kanal, serial) -> (decimace, fps, velikost)}
+        # klienti se stejnym kanalem, kamerou a odberem sdili room
+        self.subscribers = {}
+        self.subscribersLock = threading.Lock()
+
+        # pripojene streamy (vsechny kamery)
+        self.streamClients = StreamClients()
 
-        # aktualni devices a nodes kamery
+        # aktualni devices
         self.currDevices = []
-        self.currNodes = []
 
         with open(self.USER_CONFIG_FILE, "r") as f:
             self.userConfig = hjson.load(f)
 
+    def _getPipeline(self, serial=None) -> CameraPipeline:
+        """
+            Spustena kamera podle serial, bez serial prvni spustena (puvodni jednokamerove API)
+        """
+        with self.pipelinesLock:
+            if serial is None:
+                if len(self.pipelines) == 0:
+                    raise Exception("Capture not running")
+                return next(iter(self.pipelines.values()))
+            pipeline = self.pipelines.get(serial)
+        if pipeline is None:
+            raise Exception(f"Capture not running for camera: {serial}")
+        return pipeline
+
+    def _getSerial(self, data):
+        return data.get("serial") if isinstance(data, dict) else None
+
+    def getStream(self, kind, serial=None, params : StreamParams = None, remote=None):
+        """
+            Multipart stream kind ("main", "cut_horizontal", "cut_vertical") kamery serial
+            Klient je po dobu streamu v self.streamClients (GET_STREAM_CLIENTS)
+        """
+        # TODO
+        # dodelat nejaky prazdny image "Capture off"
+        try:
+            pipeline = self._getPipeline(serial)
+        except Exception as e:
+            logging.warning(f"Stream not available: {e}")
+            return
+        client = self.streamClients.add(pipeline.serial, kind, params or StreamParams(), remote)
+        try:
+            yield from pipeline.getStream(kind, client)
+        finally:
+            self.streamClients.remove(client)
+            logging.info(f"Stream {kind} ({pipeline.serial}) to {remote} closed: sent {client.sent}, dropped {client.dropped}, throttled {client.throttled}")
 
-    def getCutImage(self, type):
-        while True:
-            if self.currImage is not None:
-                imgToSend = self.currImage.cut_vertical if type=="vertical"else self.currImage.cut_horizontal
-                imgEnc = cv2.imencode("."+self.config["IMAGE_COMPRESSION"], imgToSend)
-                if imgEnc[0]:
-                    imageBytes = imgEnc[1].tobytes()
-                
-                res = bytes("--frame\r\n", encoding="utf-8")
-                res += bytes(f"Content-Type: image/{self.config['IMAGE_COMPRESSION']}\r\n\r\n", encoding="utf-8")
-                res += imageBytes
-                res += bytes("\r\n", encoding="utf-8")
-                yield res
-
-    def getImage(self):
-        while True:
-            image = self.camera.getImage()
-            imageBytes = b""
-            if image is not None:
-                self.currImage = CameraImg(
-                    image,
-                    self.config["PIXEL_SIZE"][self.captureDeviceName],
-                    self.config["PROCESSING"]["THRESHOLD_PERC"],
-                    self.config['IMAGE_MAX_W'],
-                    self.config['IMAGE_MAX_H']
-                )
-                imgEnc = cv2.imencode("."+self.config["IMAGE_COMPRESSION"], self.currImage.img_dst)
-                if imgEnc[0]:
-                    imageBytes = imgEnc[1].tobytes()
-                
-                res = bytes("--frame\r\n", encoding="utf-8")
-                res += bytes(f"Content-Type: image/{self.config['IMAGE_COMPRESSION']}\r\n\r\n", encoding="utf-8")
-                res += imageBytes
-                res += bytes("\r\n", encoding="utf-8")
-                yield res
-            else:
-                # TODO
-                # dodelat nejaky prazdny image "Capture off"
-                pass
-    
     def _formatException(self, e):
         return self.EXCEPTIONS_FUNC(e)
 
@@ -83,22 +90,44 @@ class App():
         with open(self.USER_CONFIG_FILE, "w") as f:
             f.write(hjson.dumps(self.userConfig, indent="\t"))
 
+    def _getCameraUserConfig(self, serial):
+        """
+            Nastaveni nodes kamery: spolecne CAMERA + zmeny pro konkretni kameru CAMERAS[serial]
+        """
+        userConfig = dict(self.userConfig["CAMERA"])
+        userConfig.update(self.userConfig.get("CAMERAS", {}).get(serial, {}))
+        return userConfig
+
+    def _getCaptures(self):
+        with self.pipelinesLock:
+            pipelines = list(self.pipelines.values())
+        return [{
+            "serial" : p.serial,
+            "model" : p.model,
+            "nodes" : p.nodes,
+        } for p in pipelines]
+
     def getInitState(self, unused):
-        capturing = self.camera.isCapturing()
-        if capturing:
-            data = {
-                "capturing" : True,
-                "devices" : self.currDevices,
-                "nodes" : self.currNodes,
-            }
-        else:
-            self.currDevices = self.camera.getDevices()
-            data = {
-                "capturing" : False,
-                "devices" : self.currDevices,
-                "nodes" : [],
-            }
         try:
+            captures = self._getCaptures()
+            if len(captures) > 0:
+                data = {
+                    "capturing" : True,
+                    "devices" : self.currDevices,
+                    # vychozi (prvni) kamera pro jednokamerove GUI
+                    "serial" : captures[0]["serial"],
+                    "nodes" : captures[0]["nodes"],
+                    "captures" : captures,
+                }
+            else:
+                self.currDevices = self.camera.getDevices()
+                data = {
+                    "capturing" : False,
+                    "devices" : self.currDevices,
+                    "serial" : None,
+                    "nodes" : [],
+                    "captures" : [],
+                }
             return {
                 "result" : True,
                 "data" : data
@@ -106,8 +135,8 @@ class App():
         except Exception as e:
             logging.exception(e)
             return {"result" : False, "data" : self._formatException(e)}
-        
-    
+
+
     def getConfig(self, unused):
         try:
             return {
@@ -117,7 +146,7 @@ class App():
         except Exception as e:
             logging.exception(e)
             return {"result" : False, "data" : self._formatException(e)}
-        
+
     def getDevices(self, unused):
         try:
             self.currDevices = self.camera.getDevices()
@@ -128,51 +157,320 @@ class App():
         except Exception as e:
             logging.exception(e)
             return {"result" : False, "data" : self._formatException(e)}
-        
-    def getMeasuringData(self, unused):
+
+    def getMeasuringData(self, data):
         try:
             return {
                 "result" : True,
-                "data" : self.currImage.get_calculated_data() if self.currImage else None
+                "data" : self._getPipeline(self._getSerial(data)).getMeasData()
             }
         except Exception as e:
             logging.exception(e)
             return {"result" : False, "data" : self._formatException(e)}
 
+    def _getSubscriptions(self, channel, serial):
+        key = (channel, serial)
+        with self.subscribersLock:
+            return set(subs[key] for subs in self.subscribers.values() if key in subs)
+
+    def _subscribe(self, channel, data, size=None):
+        """
+            Prihlaseni klienta ke kanalu kamery, data = {"decimation" : N, "fps" : F, "serial" : ...}
+            Posila se kazdy N-ty vysledek a nejvyse F zprav za sekundu (bez fps neomezeno), bez serial vychozi kamera
+            size = velikost mrizky (SURFACE_DATA), soucast odberu
+        """
+        try:
+            data = data or {}
+            decimation = max(int(data.get("decimation", 1)), 1)
+            fps = data.get("fps")
+            if fps is not None:
+                fps = float(fps)
+                if fps <= 0:
+                    raise Exception(f"Invalid fps: {fps}")
+            serial = data.get("serial")
+            if serial is None:
+                serial = self._getPipeline().serial
+            # odber (decimace, fps, velikost) - klienti se stejnym odberem sdili room
+            subscription = (decimation, fps, size)
+            with self.subscribersLock:
+                subs = self.subscribers.setdefault(request.sid, {})
+                old = subs.get((channel, serial))
+                if old is not None:
+                    leave_room(channelRoom(channel, serial, old))
+                join_room(channelRoom(channel, serial, subscription))
+                subs[(channel, serial)] = subscription
+            return {
+                "result" : True,
+                "data" : decimation
+            }
+        except Exception as e:
+            logging.exception(e)
+            return {"result" : False, "data" : self._formatException(e)}
+
+    def _unsubscribe(self, channel, data):
+        """
+            Odhlaseni od kanalu kamery data = {"serial" : ...}, bez serial od vsech kamer
+        """
+        try:
+            serial = self._getSerial(data)
+            with self.subscribersLock:
+                subs = self.subscribers.get(request.sid, {})
+                for key in list(subs):
+                    if key[0] == channel and (serial is None or key[1] == serial):
+                        leave_room(channelRoom(channel, key[1], subs.pop(key)))
+            return {
+                "result" : True,
+                "data" : None
+            }
+        except Exception as e:
+            logging.exception(e)
+            return {"result" : False, "data" : self._formatException(e)}
+
+    def subscribeMeasData(self, data):
+        return self._subscribe("MEAS_DATA", data)
+
+    def unsubscribeMeasData(self, data=None):
+        return self._unsubscribe("MEAS_DATA", data)
+
+    def subscribeProfiles(self, data):
+        """
+            PROFILE_DATA - profily rezu centroidem jako typed array (bytes) pro kresleni grafu v prohlizeci
+        """
+        return self._subscribe("PROFILE_DATA", data)
+
+    def unsubscribeProfiles(self, data=None):
+        return self._unsubscribe("PROFILE_DATA", data)
+
+    def subscribeSurface(self, data):
+        """
+            SURFACE_DATA - zmenseny obraz jako mrizka size x size (bytes) pro 3D graf
+            data = {"size" : N, "fps" : F, "decimation" : N, "serial" : ...}, bez size SURFACE_GRID.SIZE
+        """
+        data = data or {}
+        grid = self.config["SURFACE_GRID"]
+        try:
+            size = int(data.get("size", grid["SIZE"]))
+            if size < grid["MIN_SIZE"] or size > grid["MAX_SIZE"]:
+                raise Exception(f"Surface grid size out of range <{grid['MIN_SIZE']}, {grid['MAX_SIZE']}>: {size}")
+        except Exception as e:
+            logging.exception(e)
+            return {"result" : False, "data" : self._formatException(e)}
+        return self._subscribe("SURFACE_DATA", data, size)
+
+    def unsubscribeSurface(self, data=None):
+        return self._unsubscribe("SURFACE_DATA", data)
+
+    def clientDisconnected(self, sid):
+        # room opusti socketio samo
+        with self.subscribersLock:
+            self.subscribers.pop(sid, None)
+
+    def getMeasuringHistory(self, data):
+        """
+            Hromadne mereni pro grafy trendu, data = {"seconds" : S} a/nebo {"count" : N}, volitelne "serial"
+            Vraci slovnik sloupcu (timestamp, seq, centroid..., beam...)
+        """
+        try:
+            data = data or {}
+            pipeline = self._getPipeline(data.get("serial"))
+            return {
+                "result" : True,
+                "data" : pipeline.worker.history.getLastColumns(data.get("seconds"), data.get("count"))
+            }
+        except Exception as e:
+            logging.exception(e)
+            return {"result" : False, "data" : self._formatException(e)}
+
+    def getRecordedData(self, data):
+        """
+            Zaznamenana mereni z disku, data = {"start" : ts, "end" : ts, "serial" : ...} (time.time(), vse volitelne)
+            Vraci slovnik sloupcu
+        """
+        try:
+            assert self.config["RECORDER"]["ENABLED"], "Measurement recorder not enabled"
+            data = data or {}
+            records = readRange(self.config["RECORDER"]["DIRECTORY"], data.get("start"), data.get("end"), data.get("serial"))
+            return {
+                "result" : True,
+                "data" : {name : records[name].tolist() for name in records.dtype.names}
+            }
+        except Exception as e:
+            logging.exception(e)
+            return {"result" : False, "data" : self._formatException(e)}
+
+    def captureDarkFrame(self, data):
+        """
+            Dark frame pro aktualni expozici kamery, paprsek musi byt zakryty
+            data = {"serial" : ..., "frames" : N}, bez frames CALIBRATION.FRAMES
+        """
+        return self._captureCalibration("dark", data)
+
+    def captureFlatField(self, data):
+        """
+            Flat-field pro aktualni expozici kamery, senzor rovnomerne osvetleny
+        """
+        return self._captureCalibration("flat", data)
+
+    def _captureCalibration(self, kind, data):
+        try:
+            data = data or {}
+            return {
+                "result" : True,
+                "data" : self._getPipeline(self._getSerial(data)).captureCalibration(kind, data.get("frames"))
+            }
+        except Exception as e:
+            logging.exception(e)
+            return {"result" : False, "data" : self._formatException(e)}
+
+    def clearCalibration(self, data=None):
+        """
+            Smaze kalibraci aktualni expozice, data = {"serial" : ..., "kind" : "dark"/"flat"}, bez kind obe
+        """
+        try:
+            data = data or {}
+            return {
+                "result" : True,
+                "data" : self._getPipeline(self._getSerial(data)).clearCalibration(data.get("kind"))
+            }
+        except Exception as e:
+            logging.exception(e)
+            return {"result" : False, "data" : self._formatException(e)}
+
+    def getCalibration(self, data=None):
+        try:
+            return {
+                "result" : True,
+                "data" : self._getPipeline(self._getSerial(data)).getCalibration()
+            }
+        except Exception as e:
+            logging.exception(e)
+            return {"result" : False, "data" : self._formatException(e)}
+
+    def startFrameRecording(self, data):
+        try:
+            return {
+                "result" : True,
+                "data" : self._getPipeline(self._getSerial(data)).startFrameRecording()
+            }
+        except Exception as e:
+            logging.exception(e)
+            return {"result" : False, "data" : self._formatException(e)}
+
+    def stopFrameRecording(self, data):
+        try:
+            return {
+                "result" : True,
+                "data" : self._getPipeline(self._getSerial(data)).stopFrameRecording()
+            }
+        except Exception as e:
+            logging.exception(e)
+            return {"result" : False, "data" : self._formatException(e)}
+
+    def getMetrics(self, data=None):
+        """
+            Casy kroku kamery data = {"serial" : ...}, bez serial {serial : casy} vsech spustenych kamer
+        """
+        try:
+            serial = self._getSerial(data)
+            if serial is not None:
+                snapshot = self._getPipeline(serial).metrics.snapshot()
+            else:
+                with self.pipelinesLock:
+                    pipelines = list(self.pipelines.values())
+                snapshot = {pipeline.serial : pipeline.metrics.snapshot() for pipeline in pipelines}
+            return {
+                "result" : True,
+                "data" : snapshot
+            }
+        except Exception as e:
+            logging.exception(e)
+            return {"result" : False, "data" : self._formatException(e)}
+
+    def getStreamClients(self, unused):
+        """
+            Pripojene streamy s pocty odeslanych a vynechanych snimku
+        """
+        try:
+            return {
+                "result" : True,
+                "data" : self.streamClients.snapshot()
+            }
+        except Exception as e:
+            logging.exception(e)
+            return {"result" : False, "data" : self._formatException(e)}
+
+    def getMetricsText(self):
+        """
+            Casy kroku vsech spustenych kamer, odlisene label serial
+        """
+        with self.pipelinesLock:
+            pipelines = list(self.pipelines.values())
+        return metricsText([pipeline.metrics for pipeline in pipelines], METRICS.startTime)
+
     def updateNode(self, data):
         assert "value" in data and "node" in data, "Value or node not in data"
         value = data["value"]
         node = data["node"]
 
-        self.userConfig["CAMERA"][node["name"]] = value
-        self._saveUserConfig()
-
         try:
-            self.currNodes = self.camera.updateNode(node["name"], value)
+            pipeline = self._getPipeline(self._getSerial(data))
+
+            # nastaveni se uklada pro konkretni kameru
+            cameras = self.userConfig.setdefault("CAMERAS", {})
+            cameras.setdefault(pipeline.serial, {})[node["name"]] = value
+            self._saveUserConfig()
+
             return {
                 "result" : True,
-                "data" : self.currNodes
+                "data" : pipeline.updateNode(node["name"], value)
             }
         except Exception as e:
             logging.exception(e)
             return {"result" : False, "data" : self._formatException(e)}
-                    
+
     def startCapture(self, device):
         try:
-            self.currNodes = self.camera.startGrab(device, self.userConfig["CAMERA"])
-            self.captureDeviceName = device["model"]
+            serial = device["serial_number"]
+            with self.pipelinesLock:
+                old = self.pipelines.pop(serial, None)
+            if old is not None:
+                old.stop()
+
+            # kazda kamera ma vlastni grab thread a zpracovani, Harvester je sdileny
+            pipeline = CameraPipeline(self.camera.newDevice(), device, self.config, self.socketio, self._getSubscriptions)
+            try:
+                nodes = pipeline.start(self._getCameraUserConfig(serial))
+            except Exception:
+                # grab uz mohl bezet - uvolnit zarizeni i thready, jinak by kamera zustala obsazena
+                try:
+                    pipeline.stop()
+                except Exception as e:
+                    logging.warning(f"Cleanup after failed start of {serial} failed: {e}")
+                raise
+            with self.pipelinesLock:
+                self.pipelines[serial] = pipeline
             return {
                 "result" : True,
-                "data" : self.currNodes
+                "data" : nodes
             }
         except Exception as e:
             logging.exception(e)
             return {"result" : False, "data" : self._formatException(e)}
-        
-    def stopCapture(self, unused):
+
+    def stopCapture(self, data):
+        """
+            Zastavi kameru data = {"serial" : ...}, bez serial vsechny kamery
+        """
         try:
-            self.camera.stopGrab()
-            self.currNodes = []
+            serial = self._getSerial(data)
+            with self.pipelinesLock:
+                if serial is None:
+                    stopping = list(self.pipelines.values())
+                    self.pipelines.clear()
+                else:
+                    stopping = [self.pipelines.pop(serial)] if serial in self.pipelines else []
+            for pipeline in stopping:
+                pipeline.stop()
             return {
                 "result" : True,
                 "data" : None
@@ -180,11 +478,3 @@ class App():
         except Exception as e:
             logging.exception(e)
             return {"result" : False, "data" : self._formatException(e)}
-
-
-
-    
-                
-    
-    
-
@@ -0,0 +1,199 @@
+"""
+    Davkove mereni ulozenych snimku paprsku bez GUI
+
+    python batchProcess.py snimky/ video.avi img.png -o vysledky.csv -j 8 --model STC_CMC4MPOE
+    python batchProcess.py snimky/ -o vysledky.jsonl --pixel-size 5.5 --render out/
+
+    Vstupy: soubory obrazku, adresare (rekurzivne), videa a zaznamy raw snimku (FrameRecorder)
+    Zaznam raw snimku se prepocita snimek po snimku stejnou konverzi jako v HarvesterWrapper (regrese na realnych datech)
+    Vysledky se zapisuji prubezne ve stejnem poradi jako vstupy, CSV nebo JSON-lines podle pripony
+"""
+import argparse
+import csv
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+import cv2
+import hjson
+
+from cameraImg import CameraImg
+from frameRecorder import FrameRecording, isRecording
+from harvesterWrapper import convertFrame
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff")
+VIDEO_EXTENSIONS = (".avi", ".mp4", ".mkv", ".mov")
+
+# nastaveni mereni pro worker procesy (nastaveno v _initWorker)
+_settings = None
+# otevrene zaznamy raw snimku ve worker procesu
+_recordings = {}
+
+def iterInputs(paths):
+    """
+        Generator uloh (nazev, cislo snimku, cesta k obrazku nebo None, snimek nebo None)
+        Obrazky a zaznamy raw snimku cte az worker, snimky videa dekoduje hlavni proces
+    """
+    for path in paths:
+        if isRecording(path):
+            for frameIndex in range(len(FrameRecording(path))):
+                yield (path, frameIndex, path, None)
+        elif os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for file in sorted(files):
+                    if file.lower().endswith(IMAGE_EXTENSIONS):
+                        filePath = os.path.join(root, file)
+                        yield (filePath, 0, filePath, None)
+        elif path.lower().endswith(VIDEO_EXTENSIONS):
+            cap = cv2.VideoCapture(path)
+            if not cap.isOpened():
+                logging.error(f"Can not open video: {path}")
+                continue
+            frameIndex = 0
+            while True:
+                ok, frame = cap.read()
+                if not ok:
+                    break
+                yield (path, frameIndex, None, frame)
+                frameIndex += 1
+            cap.release()
+        else:
+            yield (path, 0, path, None)
+
+def _initWorker(settings):
+    global _settings
+    _settings = settings
+
+def loadRecordedFrame(path, frameIndex):
+    recording = _recordings.get(path)
+    if recording is None:
+        recording = _recordings[path] = FrameRecording(path)
+    (timestamp, data, width, height, pixelFormat, components) = recording[frameIndex]
+    return convertFrame(data, width, height, pixelFormat, components)
+
+def processItem(item):
+    name, frameIndex, path, image = item
+    res = {"source" : name, "frame" : frameIndex}
+    try:
+        if image is None and isRecording(path):
+            image = loadRecordedFrame(path, frameIndex)
+        elif image is None:
+            image = cv2.imread(path)
+            if image is None:
+                raise Exception(f"Can not read image: {path}")
+        ci = CameraImg(
+            image,
+            _settings["pixelSize"],
+            _settings["processing"]["THRESHOLD_PERC"],
+            _settings["maxWidth"],
+            _settings["maxHeight"],
+            profile_band=_settings["processing"]["PROFILE_BAND"],
+            smoothing=_settings["processing"]["SMOOTHING"]["TYPE"],
+            smoothing_kernel=_settings["processing"]["SMOOTHING"]["KERNEL"],
+            moments_iterations=_settings["processing"]["MOMENTS"]["ROI_ITERATIONS"],
+            moments_roi_factor=_settings["processing"]["MOMENTS"]["ROI_FACTOR"],
+            palette=_settings["palette"],
+            render=_settings["renderDir"] is not None
+        )
+        res.update(ci.get_calculated_data())
+        res["error"] = ""
+
+        if _settings["renderDir"] is not None:
+            stem = os.path.splitext(os.path.basename(name))[0]
+            outName = f"{stem}_{frameIndex:06d}.png" if path is None or isRecording(path) else f"{stem}.png"
+            cv2.imwrite(os.path.join(_settings["renderDir"], outName), ci.img_dst)
+    except Exception as e:
+        res["error"] = str(e)
+    return res
+
+class ResultWriter():
+    """
+        Prubezny zapis vysledku do CSV nebo JSON-lines
+    """
+    def __init__(self, f, format):
+        self.f = f
+        self.format = format
+        self.csvWriter = None
+
+    def write(self, res):
+        if self.format == "jsonl":
+            self.f.write(json.dumps(res) + "\n")
+            return
+        if self.csvWriter is None:
+            # chybne snimky nemaji data mereni - hlavicka az z prvniho uspesneho vysledku
+            if res["error"]:
+                logging.error(f"{res['source']}[{res['frame']}]: {res['error']}")
+                return
+            self.csvWriter = csv.DictWriter(self.f, fieldnames=list(res.keys()), restval="")
+            self.csvWriter.writeheader()
+        self.csvWriter.writerow(res)
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch beam measurement of saved images and videos")
+    parser.add_argument("inputs", nargs="+", help="image files, directories, video files or frame recordings")
+    parser.add_argument("-o", "--output", default="-", help="output .csv or .jsonl file, '-' = stdout (csv)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("-c", "--config", default="config.hjson", help="config file with PROCESSING settings")
+    parser.add_argument("--model", help="camera model - pixel size from PIXEL_SIZE in config")
+    parser.add_argument("--pixel-size", type=float, help="pixel size in um (overrides --model)")
+    parser.add_argument("--max-size", type=int, nargs=2, metavar=("W", "H"), help="processing size, default IMAGE_MAX_W/H")
+    parser.add_argument("--render", metavar="DIR", help="save rendered images to DIR")
+    parser.add_argument("--chunk", type=int, default=4, help="items sent to a worker at once")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)-8s] %(message)s", stream=sys.stderr)
+
+    with open(args.config, "r") as f:
+        config = hjson.load(f)
+
+    if args.pixel_size is not None:
+        pixelSize = args.pixel_size
+    elif args.model is not None:
+        pixelSize = config["PIXEL_SIZE"][args.model]
+    else:
+        parser.error("--pixel-size or --model is required")
+
+    if args.render is not None:
+        os.makedirs(args.render, exist_ok=True)
+
+    settings = {
+        "pixelSize" : pixelSize,
+        "processing" : config["PROCESSING"],
+        "maxWidth" : args.max_size[0] if args.max_size else config["IMAGE_MAX_W"],
+        "maxHeight" : args.max_size[1] if args.max_size else config["IMAGE_MAX_H"],
+        "palette" : config["PALETTE"],
+        "renderDir" : args.render,
+    }
+
+    format = "jsonl" if args.output.lower().endswith((".jsonl", ".json")) else "csv"
+    out = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    writer = ResultWriter(out, format)
+
+    count = 0
+    errors = 0
+    start = time.perf_counter()
+    lastReport = start
+    try:
+        with multiprocessing.Pool(args.jobs, initializer=_initWorker, initargs=(settings,)) as pool:
+            # imap zachova poradi vstupu
+            for res in pool.imap(processItem, iterInputs(args.inputs), chunksize=args.chunk):
+                writer.write(res)
+                count += 1
+                if res["error"]:
+                    errors += 1
+                now = time.perf_counter()
+                if now - lastReport > 5:
+                    logging.info(f"{count} images, {count / (now - start):.1f} img/s")
+                    lastReport = now
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    duration = time.perf_counter() - start
+    logging.info(f"Done: {count} images ({errors} errors) in {duration:.2f} s, {count / duration if duration > 0 else 0:.1f} img/s")
+
+if __name__ == "__main__":
+    main()
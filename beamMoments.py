@@ -0,0 +1,95 @@
+import math
+import cv2
+import numpy as np
+
+# Sirka paprsku z druhych momentu intenzity (D4sigma, ISO 11146)
+# Na rozdil od measure_beam_size (prechod polovicni intenzity v jednom radku/sloupci) pouziva vsechny
+# pixely paprsku - nezavisi na tvaru paprsku ani na sumu v jednom radku
+# Cena: prvni odhad 4 pruchody celym obrazem, pak odecteni pozadi + cv2.moments na kazdou iteraci ROI
+
+# uroven (relativne k maximu) pro prvni odhad - 1/e^2
+SEED_LEVEL = math.exp(-2)
+
+def estimate_background( gray, border=0.05 ):
+    """
+        Uroven pozadi jako prumer okrajoveho ramecku obrazu (border = sirka ramecku relativne k mensimu rozmeru)
+    """
+    (h, w) = gray.shape[:2]
+    b = max(1, int(min(h, w) * border))
+    total = (float(gray[:b, :].sum(dtype=np.float64)) + float(gray[h - b:, :].sum(dtype=np.float64)) +
+        float(gray[b:h - b, :b].sum(dtype=np.float64)) + float(gray[b:h - b, w - b:].sum(dtype=np.float64)))
+    count = 2 * b * w + 2 * b * (h - 2 * b)
+    return total / count
+
+def second_moments( signal ):
+    """
+        Centroid a druhe centralni momenty obrazu bez pozadi (float32, muze byt zaporny sum)
+        Vrati (cx, cy, sxx, syy, sxy) v px nebo None pokud signal chybi
+    """
+    M = cv2.moments(signal)
+    if M["m00"] <= 0:
+        return None
+    return (M["m10"] / M["m00"], M["m01"] / M["m00"], M["mu20"] / M["m00"], M["mu02"] / M["m00"], M["mu11"] / M["m00"])
+
+def measure_moments( gray, iterations=3, roi_factor=3.0, background=None ):
+    """
+        Centroid, sirky D4sigma, elipticita a natoceni paprsku z jedne sady momentu
+        Prvni odhad z pixelu nad 1/e^2 maxima v celem obraze (sum mimo paprsek by sirku zvetsil),
+        pak iterations-krat bez orezani hodnot v ROI = roi_factor * D4sigma okolo centroidu
+        Vrati dict v px obrazu gray nebo None pokud paprsek neni nalezen
+    """
+    if background is None:
+        background = estimate_background(gray)
+    (h, w) = gray.shape[:2]
+    roi = (0, 0, w, h)
+    signal = cv2.subtract(gray, background, dtype=cv2.CV_32F)
+    (_, maxVal, _, _) = cv2.minMaxLoc(signal)
+    if maxVal <= 0:
+        return None
+    cv2.threshold(signal, maxVal * SEED_LEVEL, 0, cv2.THRESH_TOZERO, dst=signal)
+
+    result = None
+    for i in range(iterations + 1):
+        (x0, y0, x1, y1) = roi
+        if i > 0:
+            signal = cv2.subtract(gray[y0:y1, x0:x1], background, dtype=cv2.CV_32F)
+        moments = second_moments(signal)
+        if moments is None:
+            break
+        (cx, cy, sxx, syy, sxy) = moments
+        # sum vetsi nez paprsek
+        if sxx <= 0 or syy <= 0:
+            break
+        # dalsi ROI: roi_factor * D4sigma (ISO 11146 doporucuje 3x), nejvyse cely obraz
+        rx = roi_factor * 2 * math.sqrt(sxx)
+        ry = roi_factor * 2 * math.sqrt(syy)
+        window = (int(x0 + cx - rx), int(y0 + cy - ry), int(math.ceil(x0 + cx + rx)) + 1, int(math.ceil(y0 + cy + ry)) + 1)
+        newRoi = (max(0, window[0]), max(0, window[1]), min(w, window[2]), min(h, window[3]))
+        # paprsek s okolim se do obrazu nevejde - sirka muze byt podhodnocena
+        truncated = newRoi != window
+        result = (x0 + cx, y0 + cy, sxx, syy, sxy, roi, truncated)
+        if (i > 0 and newRoi == roi) or newRoi[2] - newRoi[0] < 2 or newRoi[3] - newRoi[1] < 2:
+            break
+        roi = newRoi
+
+    if result is None:
+        return None
+    (cx, cy, sxx, syy, sxy, roi, truncated) = result
+    # hlavni osy - vlastni cisla kovariancni matice
+    half = (sxx + syy) / 2
+    diff = math.sqrt(((sxx - syy) / 2) ** 2 + sxy ** 2)
+    major = 4 * math.sqrt(half + diff)
+    minor = 4 * math.sqrt(max(half - diff, 0.0))
+    return {
+        'centroid_x' : cx,
+        'centroid_y' : cy,
+        'width' : 4 * math.sqrt(sxx),
+        'height' : 4 * math.sqrt(syy),
+        'major' : major,
+        'minor' : minor,
+        'ellipticity' : minor / major if major > 0 else 0.0,
+        # uhel hlavni osy od osy x ve stupnich, y obrazu dolu (po smeru hodinovych rucicek)
+        'orientation_deg' : math.degrees(0.5 * math.atan2(2 * sxy, sxx - syy)),
+        'roi' : roi,
+        'truncated' : truncated,
+    }
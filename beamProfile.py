@@ -0,0 +1,69 @@
+import numpy as np
+
+def get_profiles( gray, cx, cy, band=0 ):
+    """
+        Horizontalni a vertikalni profil intenzity pres bod (cx, cy) jako numpy pole
+        band > 0 = prumer z 2*band+1 radku/sloupcu okolo centroidu (float32)
+    """
+    if band <= 0:
+        return gray[cy, :], gray[:, cx]
+    rows = gray[max(0, cy - band):cy + band + 1, :]
+    cols = gray[:, max(0, cx - band):cx + band + 1]
+    return rows.mean(axis=0, dtype=np.float32), cols.mean(axis=1, dtype=np.float32)
+
+def find_edges( profile, center, level ):
+    """
+        Nejblizsi prechody profilu pod level vlevo a vpravo od center
+        Vrati (left, right) se subpixelovou interpolaci, None pokud prechod chybi
+    """
+    below = profile < level
+    if below[center]:
+        return None, None
+
+    left = None
+    idx = np.flatnonzero(below[:center])
+    if idx.size:
+        i = idx[-1]
+        p0 = float(profile[i])
+        p1 = float(profile[i + 1])
+        left = i + (level - p0) / (p1 - p0)
+
+    right = None
+    idx = np.flatnonzero(below[center:])
+    if idx.size:
+        i = center + idx[0]
+        p0 = float(profile[i - 1])
+        p1 = float(profile[i])
+        right = (i - 1) + (p0 - level) / (p0 - p1)
+
+    return left, right
+
+def profile_width( profile, center, level ):
+    """
+        Sirka profilu nad level okolo center
+        Vrati (start, width) - start prvni pixel nad level (None pokud neni), width (float) 0.0 pokud chybi nektery prechod
+    """
+    left, right = find_edges(profile, center, level)
+    start = int(left) + 1 if left is not None else None
+    if left is None or right is None:
+        return start, 0.0
+    return start, float(right - left)
+
+def measure_beam_size( gray, cx, cy, lightLevel, band=0 ):
+    """
+        Sirka/vyska paprsku z profilu radku a sloupce centroidu
+        Vrati (left, width, top, height), width/height 0 pokud chybi prechod na nektere strane
+    """
+    horizontal, vertical = get_profiles(gray, cx, cy, band)
+    left, bw = profile_width(horizontal, cx, lightLevel)
+    top, bh = profile_width(vertical, cy, lightLevel)
+    return left, bw, top, bh
+
+def profile_polyline( profile, height ):
+    """
+        Body profilu pro cv2.polylines do grafu vysokeho height px (0 dole)
+    """
+    pts = np.empty((profile.shape[0], 2), dtype=np.int32)
+    pts[:, 0] = np.arange(profile.shape[0])
+    pts[:, 1] = height - np.rint(profile).astype(np.int32)
+    return pts
@@ -0,0 +1,70 @@
+# rezerva okna pro D4sigma (pohyb paprsku mezi snimky, rozdil centroidu prahu a momentu)
+MOMENTS_MARGIN = 1.2
+# vetsi vyrez (podil plochy snimku) v plnem rozliseni je pomalejsi nez mereni v celem zmensenem obraze
+# (benchmark.py: tracked vs total)
+MAX_AREA = 0.6
+
+class BeamTracker():
+    """
+        Pamatuje si polohu a velikost paprsku z posledniho snimku (v pixelech puvodniho obrazu)
+        a urcuje z nich vyrez (ROI) pro mereni dalsiho snimku
+        Vyrez obsahuje i okoli paprsku pro D4sigma (moments_roi_factor x D4sigma), jinak by se D4sigma
+        meril v celem zmensenem obraze
+        Kdyz paprsek ve vyrezu neni, CameraImg meri v celem obraze a tracker se tim znovu nastavi
+    """
+    def __init__(self, windowFactor=3.0, minWindow=64):
+        # velikost okna = windowFactor * velikost paprsku, minimalne minWindow px
+        self.windowFactor = windowFactor
+        self.minWindow = minWindow
+        self.reset()
+
+    def reset(self):
+        self.center = None
+        self.size = None
+        # okno measure_moments z posledniho D4sigma (sirka, vyska), None = neni
+        self.momentsSize = None
+
+    def getRoi(self, shape):
+        """
+            Vyrez (x0, y0, x1, y1) pro obraz daneho shape, None = merit v celem obraze
+        """
+        if self.center is None:
+            return None
+        h = shape[0]
+        w = shape[1]
+        (momentsW, momentsH) = self.momentsSize if self.momentsSize is not None else (0, 0)
+        halfW = max(self.minWindow, self.windowFactor * self.size[0], MOMENTS_MARGIN * momentsW) / 2
+        halfH = max(self.minWindow, self.windowFactor * self.size[1], MOMENTS_MARGIN * momentsH) / 2
+        x0 = max(0, int(self.center[0] - halfW))
+        y0 = max(0, int(self.center[1] - halfH))
+        x1 = min(w, int(self.center[0] + halfW) + 1)
+        y1 = min(h, int(self.center[1] + halfH) + 1)
+        # vyrez pres (skoro) cely obraz nema smysl
+        if (x1 - x0) * (y1 - y0) > MAX_AREA * w * h:
+            return None
+        return (x0, y0, x1, y1)
+
+    def update(self, cameraImg):
+        """
+            Prevezme vysledek mereni z CameraImg (ROI i cely obraz)
+        """
+        if cameraImg.centroid_x_px is None or cameraImg.beam_width_px == 0 or cameraImg.beam_height_px == 0:
+            # paprsek ztracen nebo bez platne velikosti - dalsi snimek v celem obraze
+            self.reset()
+            return
+
+        f = cameraImg.resizeFactor
+        if cameraImg.roi is not None:
+            self.center = cameraImg.roi_centroid_native
+            self.size = cameraImg.roi_beam_size_native
+        else:
+            self.center = (cameraImg.centroid_x_px / f, cameraImg.centroid_y_px / f)
+            self.size = (cameraImg.beam_width_px / f, cameraImg.beam_height_px / f)
+
+        m = cameraImg.moments
+        if m is None:
+            self.momentsSize = None
+        else:
+            # D4sigma je v px zobrazeni
+            factor = cameraImg.moments_roi_factor / f
+            self.momentsSize = (factor * m['width'], factor * m['height'])
@@ -0,0 +1,261 @@
+"""
+    Benchmark zpracovani CameraImg po jednotlivych krocich na umelych snimcich
+
+    python benchmark.py                                  # vse, vysledek do benchmarks/<timestamp>.json
+    python benchmark.py --sizes VGA 4MP --depths mono8 --repeat 20
+    python benchmark.py --compare benchmarks/stary.json  # porovnat s predchozim behem na stejnem stroji
+    python benchmark.py --encoders --sizes 4MP           # jen srovnani encoderu streamu (cas + velikost dat)
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import cv2
+import hjson
+import numpy as np
+
+import timeHelper
+from cameraImg import CameraImg
+from beamTracker import BeamTracker
+from beamMoments import measure_moments
+from frameAveraging import FrameAverager
+from smoothing import smooth, SMOOTHING_BACKENDS
+from palettes import apply_palette
+from encoders import Encoding, isAvailable
+from syntheticBeam import beam_image, SENSOR_SIZES, BEAM_SHAPES
+
+DEPTHS = ("mono8", "bgr8", "mono16")
+RESULTS_DIR = "benchmarks"
+
+# varianty pro --encoders: (encoder, quality, png compression)
+ENCODER_VARIANTS = (
+    ("jpg", 90, None),
+    ("jpg", 75, None),
+    ("turbojpeg", 90, None),
+    ("turbojpeg", 75, None),
+    ("png", None, 1),
+    ("png", None, 3),
+    ("webp", 90, None),
+    ("webp", 75, None),
+)
+
+def timeit(func, repeat):
+    """
+        Casy jednotlivych volani v ms
+    """
+    func() # zahrati (cache, alokace)
+    times = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+def stageFunctions(img, settings):
+    """
+        Jednotlive kroky CameraImg jako samostatne volatelne funkce
+        Vraci seznam (nazev kroku, funkce)
+    """
+    processing = settings["processing"]
+    maxW = settings["maxWidth"]
+    maxH = settings["maxHeight"]
+
+    def process(**kwargs):
+        return CameraImg(img, settings["pixelSize"], processing["THRESHOLD_PERC"], maxW, maxH,
+            profile_band=processing["PROFILE_BAND"],
+            smoothing=processing["SMOOTHING"]["TYPE"],
+            smoothing_kernel=processing["SMOOTHING"]["KERNEL"],
+            moments_iterations=processing["MOMENTS"]["ROI_ITERATIONS"],
+            moments_roi_factor=processing["MOMENTS"]["ROI_FACTOR"],
+            palette=settings["palette"],
+            **kwargs)
+
+    ci = process()
+    kernel = processing["SMOOTHING"]["KERNEL"]
+    # mereni ve sledovanem ROI (PROCESSING.TRACKING) bez obrazu zobrazeni, tracker z mereni v celem obraze
+    tracking = processing["TRACKING"]
+    tracker = BeamTracker(tracking["WINDOW_FACTOR"], tracking["MIN_WINDOW"])
+    tracker.update(ci)
+
+    def threshold():
+        (_, maxVal, _, _) = cv2.minMaxLoc(ci.img_gray_proc)
+        th = maxVal - (maxVal/100.*ci.treshold_proc)
+        cv2.threshold(ci.img_gray_proc, th, maxVal, cv2.THRESH_TOZERO)
+
+    def cuts():
+        ci.profile_horizontal = None
+        ci.cut_horizontal = np.zeros((280, ci.img_src.shape[1], 3), np.uint8)
+        ci.cut_vertical = np.zeros((280, ci.img_src.shape[0], 3), np.uint8)
+        ci.draw_centroid_cut()
+
+    # casove prumerovani plneho snimku (PROCESSING.AVERAGING), okno uz zaplnene
+    averagers = {mode : FrameAverager(mode, 4) for mode in ("mean", "ema")}
+    for averager in averagers.values():
+        for i in range(averager.window):
+            averager.add(img)
+
+    stages = [
+        ("average:mean", lambda: averagers["mean"].add(img)),
+        ("average:ema", lambda: averagers["ema"].add(img)),
+        ("resize", lambda: ci.resizeToMaxDimensions(img, maxW, maxH)),
+        ("gray", lambda: cv2.cvtColor(ci.img_src, cv2.COLOR_BGR2GRAY)),
+    ]
+    for backend in SMOOTHING_BACKENDS:
+        stages.append(("blur:" + backend, lambda backend=backend: smooth(ci.img_gray_orig, backend, kernel)))
+    stages += [
+        ("threshold", threshold),
+        ("moments", ci.get_centroid_pos),
+    ]
+    if ci.centroid_x_px is not None:
+        stages += [
+            ("beam_size", lambda: ci.calc_beam_size(lightLevel=ci.maxVal/2)),
+            ("d4s", lambda: measure_moments(ci.img_gray_orig, ci.moments_iterations, ci.moments_roi_factor)),
+            ("measures", ci.draw_measures),
+            ("cuts", cuts),
+        ]
+    encoding = Encoding(settings["format"], settings["quality"], settings["pngCompression"])
+    stages += [
+        ("colorize", lambda: apply_palette(ci.img_gray_orig, ci.palette)),
+        ("encode:main", lambda: encoding.encode(ci.img_dst)),
+        ("encode:cut", lambda: encoding.encode(ci.cut_horizontal)),
+        ("total", process),
+    ]
+    if ci.centroid_x_px is not None:
+        stages.append(("tracked", lambda: process(tracker=tracker, render=False, display_data=False)))
+    return stages
+
+def encoderFunctions(img, settings):
+    """
+        Kodovani hotovych obrazu streamu (main, cut) vsemi dostupnymi encodery
+        Funkce vraci zakodovana data (velikost se uklada do vysledku)
+    """
+    processing = settings["processing"]
+    ci = CameraImg(img, settings["pixelSize"], processing["THRESHOLD_PERC"], settings["maxWidth"], settings["maxHeight"],
+        profile_band=processing["PROFILE_BAND"],
+        smoothing=processing["SMOOTHING"]["TYPE"],
+        smoothing_kernel=processing["SMOOTHING"]["KERNEL"],
+        moments_iterations=processing["MOMENTS"]["ROI_ITERATIONS"],
+        moments_roi_factor=processing["MOMENTS"]["ROI_FACTOR"],
+        palette=settings["palette"])
+    stages = []
+    for (name, quality, compression) in ENCODER_VARIANTS:
+        if not isAvailable(name):
+            print(f"Encoder {name} not available, skipped", file=sys.stderr)
+            continue
+        encoding = Encoding(name, quality or 90, compression or 1)
+        variant = name + (f"-q{quality}" if quality else f"-c{compression}")
+        stages += [
+            ("encoder:" + variant + ":main", lambda encoding=encoding: encoding.encode(ci.img_dst)),
+            ("encoder:" + variant + ":cut", lambda encoding=encoding: encoding.encode(ci.cut_horizontal)),
+        ]
+    return stages
+
+def runBenchmark(args, settings):
+    results = []
+    for shape in args.shapes:
+        for size in args.sizes:
+            for depth in args.depths:
+                (w, h) = SENSOR_SIZES[size]
+                img = beam_image(w, h, shape, depth, seed=0, cx=w*0.55, cy=h*0.45, angle=30)
+                case = f"{shape}/{size}/{depth}"
+                stages = encoderFunctions(img, settings) if args.encoders else stageFunctions(img, settings)
+                for (stage, func) in stages:
+                    try:
+                        times = timeit(func, args.repeat)
+                        output = func()
+                    except Exception as e:
+                        print(f"{case:28s} {stage:18s} FAILED: {e}", file=sys.stderr)
+                        continue
+                    res = {
+                        "case" : case,
+                        "shape" : shape,
+                        "size" : size,
+                        "depth" : depth,
+                        "stage" : stage,
+                        "n" : len(times),
+                        "median_ms" : float(np.median(times)),
+                        "min_ms" : float(np.min(times)),
+                        "mean_ms" : float(np.mean(times)),
+                        "p95_ms" : float(np.percentile(times, 95)),
+                    }
+                    # encodery - velikost zakodovanych dat
+                    payload = ""
+                    if isinstance(output, bytes):
+                        res["bytes"] = len(output)
+                        payload = f" {len(output) / 1024:9.1f} kB"
+                    results.append(res)
+                    print(f"{case:28s} {stage:18s} {res['median_ms']:9.3f} ms{payload}", file=sys.stderr)
+    return results
+
+def compareResults(old, new):
+    """
+        Tabulka median casu stary/novy beh pro spolecne kroky
+    """
+    oldMap = {(r["case"], r["stage"]) : r for r in old["results"]}
+    print(f"{'case':28s} {'stage':18s} {'old ms':>9s} {'new ms':>9s} {'ratio':>7s}")
+    for r in new["results"]:
+        o = oldMap.get((r["case"], r["stage"]))
+        if o is None:
+            continue
+        ratio = r["median_ms"] / o["median_ms"] if o["median_ms"] > 0 else float("nan")
+        print(f"{r['case']:28s} {r['stage']:18s} {o['median_ms']:9.3f} {r['median_ms']:9.3f} {ratio:7.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="CameraImg pipeline benchmark on synthetic beams")
+    parser.add_argument("--sizes", nargs="+", default=list(SENSOR_SIZES), choices=list(SENSOR_SIZES))
+    parser.add_argument("--depths", nargs="+", default=list(DEPTHS), choices=list(DEPTHS))
+    parser.add_argument("--shapes", nargs="+", default=list(BEAM_SHAPES), choices=list(BEAM_SHAPES))
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("-c", "--config", default="config.hjson")
+    parser.add_argument("-o", "--output", help="result file, default benchmarks/<timestamp>.json")
+    parser.add_argument("--compare", help="previous result file to compare with")
+    parser.add_argument("--encoders", action="store_true", help="compare stream image encoders (time and payload size) instead of pipeline stages")
+    args = parser.parse_args()
+
+    with open(args.config, "r") as f:
+        config = hjson.load(f)
+
+    settings = {
+        "pixelSize" : next(iter(config["PIXEL_SIZE"].values())),
+        "processing" : config["PROCESSING"],
+        "maxWidth" : config["IMAGE_MAX_W"],
+        "maxHeight" : config["IMAGE_MAX_H"],
+        "palette" : config["PALETTE"],
+        "format" : config["IMAGE_COMPRESSION"],
+        "quality" : config["JPG_QUALITY"],
+        "pngCompression" : config["PNG_COMPRESSION"],
+    }
+
+    # jednovlaknove kvuli porovnatelnosti behu
+    cv2.setNumThreads(1)
+
+    data = {
+        "meta" : {
+            "timestamp" : timeHelper.getTimestampNiceVersion(),
+            "platform" : platform.platform(),
+            "processor" : platform.processor(),
+            "python" : platform.python_version(),
+            "numpy" : np.__version__,
+            "opencv" : cv2.__version__,
+            "repeat" : args.repeat,
+            "settings" : settings,
+        },
+        "results" : runBenchmark(args, settings),
+    }
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, timeHelper.getTimestamp(millis=False) + ".json")
+    with open(output, "w") as f:
+        json.dump(data, f, indent=1)
+    print(f"Results saved: {output}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            compareResults(json.load(f), data)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+import glob
+import logging
+import os
+import threading
+import cv2
+import numpy as np
+
+# Kalibrace snimku pred zpracovanim pro kazdou kameru (serial) a expozici
+#   dark - prumer snimku bez paprsku (offset senzoru, okolni svetlo), v typu snimku (uint8/uint16)
+#   flat - zisk float32 = prumer / (flat - dark) ze snimku rovnomerne osvetleneho senzoru (volitelne)
+# Ulozeni: CALIBRATION.DIRECTORY (vedle userSettings.hjson) jako <druh>_<serial>_<expozice>.npy
+# Korekce snimku: cv2.subtract se saturaci (1 pruchod) + s flat cv2.multiply (2. pruchod)
+# do predalokovaneho bufferu, mapy jsou v pameti pro kazdou pouzitou expozici
+
+CALIBRATION_KINDS = ("dark", "flat")
+
+def exposureKey(value):
+    """
+        Expozice jako cast nazvu souboru, napr. 4000.0 -> "4000"
+    """
+    if value is None:
+        return "default"
+    try:
+        return f"{float(value):g}"
+    except (TypeError, ValueError):
+        return str(value)
+
+class FrameCalibration():
+    """
+        Kalibracni mapy jedne kamery, aktivni jsou mapy aktualni expozice (setExposure)
+        apply vola zpracovani snimku, capture/clear se volaji ze socket eventu (jiny thread)
+    """
+    def __init__(self, directory, serial, maxGain=4.0):
+        self.directory = directory
+        self.serial = serial
+        # flat-field nezesili vic nez maxGain (tmave okraje, vadne pixely)
+        self.maxGain = maxGain
+        self.exposure = exposureKey(None)
+        # expozice -> {druh -> mapa nebo None}, nacteno z disku pri prvnim pouziti
+        self.maps = {}
+        # aktivni (dark, gain) - meni se jednim prirazenim, apply bere vzdy konzistentni dvojici
+        self.active = (None, None)
+        self.lock = threading.Lock()
+        self.out = None
+        self.mismatchWarned = False
+
+    def _path(self, kind, exposure):
+        return os.path.join(self.directory, f"{kind}_{self.serial}_{exposure}.npy")
+
+    def _getMaps(self, exposure):
+        maps = self.maps.get(exposure)
+        if maps is None:
+            maps = {}
+            for kind in CALIBRATION_KINDS:
+                path = self._path(kind, exposure)
+                maps[kind] = None
+                if os.path.isfile(path):
+                    try:
+                        maps[kind] = np.load(path)
+                        logging.info(f"Calibration loaded: {path}")
+                    except Exception as e:
+                        logging.warning(f"Can not load calibration {path}: {e}")
+            self.maps[exposure] = maps
+        return maps
+
+    def _activate(self):
+        maps = self._getMaps(self.exposure)
+        self.active = (maps["dark"], maps["flat"])
+        self.mismatchWarned = False
+
+    def setExposure(self, value):
+        with self.lock:
+            self.exposure = exposureKey(value)
+            self._activate()
+
+    def isActive(self):
+        (dark, gain) = self.active
+        return dark is not None or gain is not None
+
+    def apply(self, image):
+        """
+            Opraveny snimek (buffer platny do dalsiho volani), bez kalibrace puvodni snimek
+        """
+        (dark, gain) = self.active
+        if dark is None and gain is None:
+            return image
+        for m in (dark, gain):
+            if m is not None and m.shape != image.shape:
+                if not self.mismatchWarned:
+                    logging.warning(f"Calibration {m.shape} does not match frame {image.shape}, not applied")
+                    self.mismatchWarned = True
+                return image
+        if self.out is None or self.out.shape != image.shape or self.out.dtype != image.dtype:
+            self.out = np.empty_like(image)
+
+        src = image
+        if dark is not None:
+            cv2.subtract(image, dark, dst=self.out)
+            src = self.out
+        if gain is not None:
+            cv2.multiply(src, gain, dst=self.out, dtype=cv2.CV_8U if self.out.dtype == np.uint8 else cv2.CV_16U)
+        return self.out
+
+    def _captureMean(self, camera, frames, timeout):
+        """
+            Prumer frames po sobe jdoucich snimku z kamery jako float32 a typ snimku
+        """
+        acc = None
+        dtype = None
+        lastSeq = 0
+        for i in range(frames):
+            frame = camera.acquireImage(lastSeq, timeout)
+            if frame is None:
+                raise Exception("No frame from camera during calibration")
+            lastSeq = frame.seq
+            with frame:
+                if acc is None:
+                    acc = np.zeros(frame.image.shape, np.float32)
+                    dtype = frame.image.dtype
+                cv2.accumulate(frame.image, acc)
+        acc *= 1.0 / frames
+        return acc, dtype
+
+    def capture(self, camera, kind, frames=16, timeout=5.0):
+        """
+            Nasnima a ulozi mapu kind ("dark", "flat") pro aktualni expozici, vrati status
+            dark: zakryty paprsek, flat: rovnomerne osvetleny senzor (odecte se dark, pokud existuje)
+        """
+        if kind not in CALIBRATION_KINDS:
+            raise Exception(f"Unknown calibration: {kind}")
+        (mean, dtype) = self._captureMean(camera, frames, timeout)
+        with self.lock:
+            maps = self._getMaps(self.exposure)
+            if kind == "dark":
+                data = np.clip(np.rint(mean), 0, np.iinfo(dtype).max).astype(dtype)
+            else:
+                dark = maps["dark"]
+                if dark is not None and dark.shape == mean.shape:
+                    mean -= dark
+                # pixely bez signalu se nezesiluji
+                valid = mean > mean.max() * 0.01
+                if not valid.any():
+                    raise Exception("Flat field frame has no signal")
+                data = np.ones(mean.shape, np.float32)
+                data[valid] = mean[valid].mean() / mean[valid]
+                np.clip(data, 0.0, self.maxGain, out=data)
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._path(kind, self.exposure)
+            np.save(path, data)
+            maps[kind] = data
+            self._activate()
+        logging.info(f"Calibration {kind} saved: {path} ({frames} frames)")
+        return self.status()
+
+    def clear(self, kind=None):
+        """
+            Smaze mapu kind (None = obe) pro aktualni expozici
+        """
+        with self.lock:
+            maps = self._getMaps(self.exposure)
+            for k in (CALIBRATION_KINDS if kind is None else (kind,)):
+                if k not in CALIBRATION_KINDS:
+                    raise Exception(f"Unknown calibration: {k}")
+                path = self._path(k, self.exposure)
+                if os.path.isfile(path):
+                    os.remove(path)
+                maps[k] = None
+            self._activate()
+        return self.status()
+
+    def status(self):
+        (dark, gain) = self.active
+        stored = sorted(os.path.basename(p) for p in glob.glob(os.path.join(self.directory, f"*_{self.serial}_*.npy")))
+        return {
+            "serial" : self.serial,
+            "exposure" : self.exposure,
+            "dark" : dark is not None,
+            "flat" : gain is not None,
+            "stored" : stored,
+        }
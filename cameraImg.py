@@ -1,3 +1,4 @@
+import math
 import pprint
 import time
 import os
@@ -5,33 +6,68 @@ import cv2
 import numpy as np
 import logging
 import sys
+from beamProfile import get_profiles, measure_beam_size, profile_polyline
+from beamMoments import measure_moments
+from smoothing import smooth
+from overlayCache import OverlayCache, composite
+from palettes import apply_palette
+from metrics import METRICS
+
+# meritka zavisi jen na rozmerech obrazu a parametrech mereni - kresli se jednou pro vsechny snimky
+MEASURES_CACHE = OverlayCache()
+
+# polozky get_calculated_data() z mereni pomoci momentu (measure_moments)
+D4S_FIELDS = (
+    'd4s_centroid_x_px',
+    'd4s_centroid_y_px',
+    'd4s_width_px',
+    'd4s_height_px',
+    'd4s_width_um',
+    'd4s_height_um',
+    'd4s_major_um',
+    'd4s_minor_um',
+    'ellipticity',
+    'orientation_deg',
+)
 
 class CameraImg:
 
-    def __init__( self, img_src, pixel_size, treshold_proc, maxWidth, maxHeight, center_x_um=0, center_y_um=0):
+    def __init__( self, img_src, pixel_size, treshold_proc, maxWidth, maxHeight, center_x_um=0, center_y_um=0, tracker=None, profile_band=0, smoothing="gaussian", smoothing_kernel=25, palette="default", render=True, render_cuts=True, display_data=True, moments_iterations=3, moments_roi_factor=3.0, metrics=METRICS):
         self.pixel_size = pixel_size
         self.treshold_proc = treshold_proc
+        # pocet radku/sloupcu na kazdou stranu centroidu prumerovanych do profilu
+        self.profile_band = profile_band
+        # vyhlazeni pred prahovanim, viz smoothing.py
+        self.smoothing = smoothing
+        self.smoothing_kernel = smoothing_kernel
+        # barevna paleta zobrazeni, viz palettes.py
+        self.palette = palette
+        # iterace ROI a velikost ROI (nasobek D4sigma) pro mereni pomoci momentu, viz beamMoments.py
+        self.moments_iterations = moments_iterations
+        self.moments_roi_factor = moments_roi_factor
         self.center_x_um = center_x_um
         self.center_y_um = center_y_um
 
-        self.resizeFactor, self.img_src = self.resizeToMaxDimensions(img_src, maxWidth, maxHeight)
-        self.cut_horizontal = np.zeros((280, self.img_src.shape[1], 3))
-        self.cut_vertical = np.zeros((280, self.img_src.shape[0], 3))
-
-        self.img_dst = np.copy(self.img_src)
-
-        # neni nutne - jeste nasleduce gaussian na img_gray
-        # self.img_src = cv2.medianBlur(self.img_src, 5)
-
-        self.img_gray_orig = cv2.cvtColor(self.img_src, cv2.COLOR_BGR2GRAY)
-        self.img_gray_proc = cv2.GaussianBlur(self.img_gray_orig, (25,25), 0)
-
-        (_, self.maxVal, _, _) = cv2.minMaxLoc(self.img_gray_proc)
-        #print("maxLoc:" + str(maxLoc))
-        #cv2.circle(self.img_gray, maxLoc, 5, (255, 0, 0), 2)
-
-        th = self.maxVal - (self.maxVal/100.*self.treshold_proc)
-        ret, self.img_calc = cv2.threshold(self.img_gray_proc, th, self.maxVal, cv2.THRESH_TOZERO)
+        # casy kroku do metrics (Metrics kamery, v procesu StageTimes)
+        self.metrics = metrics
+        t = time.perf_counter()
+        # rozmery zobrazeni - souradnice a sirky v px jsou vzdy v tomto meritku
+        self.resizeFactor = self.getResizeFactor(img_src, maxWidth, maxHeight)
+        self.width = int(img_src.shape[1] * self.resizeFactor)
+        self.height = int(img_src.shape[0] * self.resizeFactor)
+
+        # zmenseny snimek, sedy a vyhlazeny obraz zobrazeni (prepare_display)
+        # pri mereni ve sledovanem ROI jen pokud je potreba render, display_data (get_profile_data, get_surface_data)
+        # nebo D4sigma v celem obraze - jinak se cely snimek vubec nezmensuje
+        self.img_src = None
+        self.img_gray_orig = None
+        self.img_gray_proc = None
+
+        # obrazy pro zobrazeni - jen pokud render=True (jinak jen mereni)
+        # rezy (cut_*) jen pokud navic render_cuts=True, jinak jen profily (get_profile_data)
+        self.img_dst = None
+        self.cut_horizontal = None
+        self.cut_vertical = None
 
         # priprava promennych na vypocty
         self.centroid_x_px = None
@@ -39,52 +75,124 @@ class CameraImg:
         self.centroid_center_dist_x_px = 0
         self.centroid_center_dist_y_px = 0
 
-        self.beam_width_px = 0
-        self.beam_height_px = 0
+        self.beam_width_px = 0.0
+        self.beam_height_px = 0.0
         self.beam_height_top_px = 0
         self.beam_width_left_px = 0
         self.beam_volume_px = 0
 
+        # D4sigma z momentu (measure_moments) v px zobrazeni, None pokud paprsek neni nalezen
+        self.moments = None
+
+        # profily intenzity v radku a sloupci centroidu (img_gray_proc)
+        self.profile_horizontal = None
+        self.profile_vertical = None
+
         self.line_width = 1
         self.line_width_centroid_cut = 1
         self.font_size = 0.3
         self.font_line_width = 1
 
-        # vypocet centoridu
-        self.get_centroid_pos()
-        
-        # priprava image pro zobrazeni
-        w = self.img_src.shape[0]
-        h = self.img_src.shape[1]
-        hsv = np.full((w,h,3),255,"uint16")
-        hsv[:,:,0] = ((255-self.img_gray_orig.astype("uint16"))*160/256+150)%180
-        hsv[:,:,2] = np.sqrt(self.img_gray_orig.astype("uint16"))*16
-        self.img_dst = cv2.cvtColor(hsv.astype("uint8"),cv2.COLOR_HSV2BGR)
-
-        # beam size + kresleni
+        # sledovane ROI - mereni jen v okoli posledniho centroidu v plnem rozliseni
+        self.roi = None
+        tracked = False
+        if tracker is not None:
+            self.roi = tracker.getRoi(img_src.shape)
+            if self.roi is not None:
+                tracked = self.measure_roi(img_src, self.roi)
+                if not tracked:
+                    self.roi = None
+                t = self.metrics.since("roi", t)
+
+        if not tracked or render or display_data or self.moments is None:
+            t = self.prepare_display(img_src, t)
+
+        if tracked and self.moments is None:
+            # okoli paprsku pro D4sigma se do vyrezu neveslo - v celem obraze zobrazeni
+            self.moments = measure_moments(self.img_gray_orig, self.moments_iterations, self.moments_roi_factor)
+            t = self.metrics.since("d4s", t)
+
+        if not tracked:
+            (_, self.maxVal, _, _) = cv2.minMaxLoc(self.img_gray_proc)
+            #print("maxLoc:" + str(maxLoc))
+            #cv2.circle(self.img_gray, maxLoc, 5, (255, 0, 0), 2)
+
+            th = self.maxVal - (self.maxVal/100.*self.treshold_proc)
+            ret, self.img_calc = cv2.threshold(self.img_gray_proc, th, self.maxVal, cv2.THRESH_TOZERO)
+            t = self.metrics.since("threshold", t)
+
+            # vypocet centoridu
+            self.get_centroid_pos()
+            t = self.metrics.since("moments", t)
+            if self.centroid_x_px is not None:
+                self.calc_beam_size(lightLevel=self.maxVal/2) #zavisi na centroidu!
+                t = self.metrics.since("beam_size", t)
+                # momenty z nevyhlazeneho obrazu - vyhlazeni by sirku zvetsilo
+                self.moments = measure_moments(self.img_gray_orig, self.moments_iterations, self.moments_roi_factor)
+                t = self.metrics.since("d4s", t)
+
+        if tracker is not None:
+            tracker.update(self)
+
+        if not render:
+            return
+
+        if render_cuts:
+            self.cut_horizontal = np.zeros((280, self.width, 3), np.uint8)
+            self.cut_vertical = np.zeros((280, self.height, 3), np.uint8)
+
+        # priprava image pro zobrazeni - jeden pruchod LUT palety
+        self.img_dst = apply_palette(self.img_gray_orig, self.palette)
+        t = self.metrics.since("colorize", t)
+
+        # kresleni
         if self.centroid_x_px is not None:
-            self.calc_beam_size(lightLevel=self.maxVal/2) #zavisi na centroidu!
+            self.calc_profiles()
             self.draw_measures()
             self.draw_centroid()
-            self.draw_centroid_cut()
+            self.draw_roi()
+            t = self.metrics.since("measures", t)
+            if render_cuts:
+                self.draw_centroid_cut()
+                self.metrics.since("cuts", t)
             # self.draw_beam_size()
         else:
             cv2.putText(self.img_dst, "Centroid not found.", (10, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
 
-    def resizeToMaxDimensions(self, image, maxWidth, maxHeight):
+    def getResizeFactor(self, image, maxWidth, maxHeight):
         f1 = maxWidth / image.shape[1]
         f2 = maxHeight / image.shape[0]
-        f = min(f1, f2)  # resizing factor
+        return min(f1, f2)  # resizing factor
+
+    def resizeToMaxDimensions(self, image, maxWidth, maxHeight):
+        f = self.getResizeFactor(image, maxWidth, maxHeight)
         dim = (int(image.shape[1] * f), int(image.shape[0] * f))
         resized = cv2.resize(image, dim, interpolation = cv2.INTER_AREA)
         return f, resized
     
+    def prepare_display( self, img_src, t ):
+        """
+            Zmenseny snimek (img_src), sedy (img_gray_orig) a vyhlazeny (img_gray_proc) obraz zobrazeni
+            Vrati cas pro dalsi krok metrik
+        """
+        self.img_src = cv2.resize(img_src, (self.width, self.height), interpolation = cv2.INTER_AREA)
+        t = self.metrics.since("resize", t)
+
+        # neni nutne - jeste nasleduce gaussian na img_gray
+        # self.img_src = cv2.medianBlur(self.img_src, 5)
+
+        self.img_gray_orig = cv2.cvtColor(self.img_src, cv2.COLOR_BGR2GRAY)
+        t = self.metrics.since("gray", t)
+        # rezy, profily a 3D graf ze stejne vyhlazeneho obrazu s trackingem i bez nej
+        self.img_gray_proc = smooth(self.img_gray_orig, self.smoothing, self.smoothing_kernel)
+        return self.metrics.since("blur", t)
+
     def pixToUm(self, pixVal):
         return pixVal * (self.pixel_size / self.resizeFactor)
     
 
     def get_calculated_data(self):
-        return {
+        data = {
             'centroid_x_px' : self.centroid_x_px if self.centroid_x_px is not None else 0,
             'centroid_y_px' : self.centroid_y_px if self.centroid_y_px is not None else 0,
             'centroid_center_dist_x_px' : self.centroid_center_dist_x_px,
@@ -97,6 +205,24 @@ class CameraImg:
             'beam_height_um' : round(self.pixToUm(self.beam_height_px)),
             'beam_volume_px' : self.beam_volume_px,
         }
+        # D4sigma (druhe momenty, ISO 11146) - 0 pokud paprsek neni nalezen
+        m = self.moments
+        if m is None:
+            data.update(dict.fromkeys(D4S_FIELDS, 0))
+            return data
+        data.update({
+            'd4s_centroid_x_px' : m['centroid_x'],
+            'd4s_centroid_y_px' : m['centroid_y'],
+            'd4s_width_px' : m['width'],
+            'd4s_height_px' : m['height'],
+            'd4s_width_um' : round(self.pixToUm(m['width'])),
+            'd4s_height_um' : round(self.pixToUm(m['height'])),
+            'd4s_major_um' : round(self.pixToUm(m['major'])),
+            'd4s_minor_um' : round(self.pixToUm(m['minor'])),
+            'ellipticity' : m['ellipticity'],
+            'orientation_deg' : m['orientation_deg'],
+        })
+        return data
 
     def get_centroid_pos( self ):
         # calculate moments of binary image
@@ -113,39 +239,12 @@ class CameraImg:
 
 
     def calc_beam_size( self, lightLevel=128):
-        w = self.img_gray_proc.shape[1]
-        h = self.img_gray_proc.shape[0]
-        bw = 0
-        bwValidMin = False
-        bwValidMax = False
-        for i in range( self.centroid_x_px, 0, -1 ):
-            if self.img_gray_proc[self.centroid_y_px][i] < lightLevel:
-                bwValidMin = True
-                break
-            self.beam_width_left_px = i
-            bw += 1
-        for i in range( self.centroid_x_px, w, 1 ):
-            if self.img_gray_proc[self.centroid_y_px][i] < lightLevel:
-                bwValidMax = True
-                break
-            bw += 1
-        self.beam_width_px = bw if (bwValidMin and bwValidMax) else 0
-
-        bh = 0
-        bhValidMin = False
-        bhValidMax = False
-        for i in range( self.centroid_y_px, 0, -1 ):
-            if self.img_gray_proc[i][self.centroid_x_px] < lightLevel:
-                bhValidMin = True
-                break
-            self.beam_height_top_px = i
-            bh += 1
-        for i in range( self.centroid_y_px, h, 1 ):
-            if self.img_gray_proc[i][self.centroid_x_px] < lightLevel:
-                bhValidMax = True
-                break
-            bh += 1
-        self.beam_height_px = bh if (bhValidMin and bhValidMax) else 0
+        (left, self.beam_width_px, top, self.beam_height_px) = measure_beam_size(
+            self.img_gray_proc, self.centroid_x_px, self.centroid_y_px, lightLevel, self.profile_band)
+        if left is not None:
+            self.beam_width_left_px = left
+        if top is not None:
+            self.beam_height_top_px = top
 
         x1 = self.beam_width_left_px
         x2 = self.beam_width_left_px + self.beam_width_px
@@ -155,6 +254,137 @@ class CameraImg:
         # aa = self.img_gray[y1:y2,x1:x2]
         # self.beam_volume_px = np.sum(aa)
 
+    def measure_roi( self, img_native, roi ):
+        """
+            Centroid + beam size jen ve vyrezu roi=(x0,y0,x1,y1) puvodniho (nezmenseneho) obrazu
+            Vysledky prepocte do souradnic zobrazeni (width x height)
+            Vrati False pokud paprsek ve vyrezu neni cely - pak je nutne hledat v celem obraze
+        """
+        (x0, y0, x1, y1) = roi
+        crop = img_native[y0:y1, x0:x1]
+        gray = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY) if crop.ndim == 3 else crop
+
+        # vyhlazeni jako v obrazu zobrazeni: vyrez zmenseny do meritka zobrazeni, smoothing_kernel a zpet
+        # do plneho rozliseni (jadro prepoctene na plne rozliseni by bylo 1/resizeFactor-krat vetsi a pomalejsi)
+        f = self.resizeFactor
+        if f < 1.0 and self.smoothing != "none" and self.smoothing_kernel > 1:
+            small = cv2.resize(gray, (max(1, int(gray.shape[1] * f)), max(1, int(gray.shape[0] * f))), interpolation=cv2.INTER_AREA)
+            small = smooth(small, self.smoothing, self.smoothing_kernel)
+            gray_proc = cv2.resize(small, (gray.shape[1], gray.shape[0]), interpolation=cv2.INTER_LINEAR)
+        else:
+            gray_proc = smooth(gray, self.smoothing, self.smoothing_kernel)
+
+        (_, maxVal, _, _) = cv2.minMaxLoc(gray_proc)
+        th = maxVal - (maxVal/100.*self.treshold_proc)
+        ret, calc = cv2.threshold(gray_proc, th, maxVal, cv2.THRESH_TOZERO)
+        M = cv2.moments(calc)
+        if M["m00"] <= 0:
+            return False
+
+        cx = int(M["m10"] / M["m00"])
+        cy = int(M["m01"] / M["m00"])
+        (left, bw, top, bh) = measure_beam_size(gray_proc, cx, cy, maxVal/2, int(self.profile_band / self.resizeFactor))
+        # paprsek presahuje okraj vyrezu nebo neni nalezen
+        if bw == 0 or bh == 0:
+            return False
+
+        self.maxVal = maxVal
+        self.roi_centroid_native = (x0 + M["m10"] / M["m00"], y0 + M["m01"] / M["m00"])
+        self.roi_beam_size_native = (bw, bh)
+
+        self.centroid_x_px = int(self.roi_centroid_native[0] * f)
+        self.centroid_y_px = int(self.roi_centroid_native[1] * f)
+        w = self.width
+        h = self.height
+        self.centroid_center_dist_x_px = -((w / 2) - self.roi_centroid_native[0] * f)
+        self.centroid_center_dist_y_px = (h / 2) - self.roi_centroid_native[1] * f
+
+        # sirky v px zobrazeni (float jako pri mereni v celem obraze) - pixToUm pak odpovida plnemu rozliseni
+        self.beam_width_px = bw * f
+        self.beam_height_px = bh * f
+        self.beam_width_left_px = int((x0 + (left if left is not None else cx)) * f)
+        self.beam_height_top_px = int((y0 + (top if top is not None else cy)) * f)
+
+        self.moments = self.measure_moments_native(img_native, roi, gray)
+        return True
+
+    def measure_moments_native( self, img_native, roi, gray, grow=2 ):
+        """
+            Momenty (measure_moments) ve vyrezu roi puvodniho obrazu (gray = sedy vyrez) prepoctene do px zobrazeni
+            Pokud se okoli paprsku potrebne pro D4sigma do vyrezu nevejde, vyrez se zvetsi (nejvyse grow-krat)
+            Orezani okrajem snimku nevadi (v celem obraze by bylo stejne)
+            Vrati None pokud se okoli paprsku nevejde ani pak - D4sigma se pak meri v celem obraze zobrazeni
+        """
+        (h, w) = img_native.shape[:2]
+        for attempt in range(grow + 1):
+            (x0, y0, x1, y1) = roi
+            moments = measure_moments(gray, self.moments_iterations, self.moments_roi_factor)
+            if moments is None or not moments['truncated']:
+                break
+            # okno measure_moments (moments_roi_factor x D4sigma okolo centroidu) v souradnicich snimku
+            cx = x0 + moments['centroid_x']
+            cy = y0 + moments['centroid_y']
+            rx = self.moments_roi_factor * moments['width'] / 2
+            ry = self.moments_roi_factor * moments['height'] / 2
+            grown = (
+                min(x0, max(0, int(cx - rx) - 1)),
+                min(y0, max(0, int(cy - ry) - 1)),
+                max(x1, min(w, int(math.ceil(cx + rx)) + 2)),
+                max(y1, min(h, int(math.ceil(cy + ry)) + 2)),
+            )
+            if grown == roi:
+                break
+            if attempt == grow:
+                return None
+            roi = grown
+            crop = img_native[grown[1]:grown[3], grown[0]:grown[2]]
+            gray = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY) if crop.ndim == 3 else crop
+        if moments is None:
+            return None
+
+        # uhel a elipticita se prepoctem nemeni
+        f = self.resizeFactor
+        for key in ('width', 'height', 'major', 'minor'):
+            moments[key] *= f
+        moments['centroid_x'] = (x0 + moments['centroid_x']) * f
+        moments['centroid_y'] = (y0 + moments['centroid_y']) * f
+        (rx0, ry0, rx1, ry1) = moments['roi']
+        moments['roi'] = (int((x0 + rx0) * f), int((y0 + ry0) * f), int((x0 + rx1) * f), int((y0 + ry1) * f))
+        return moments
+
+    def get_profile_data(self):
+        """
+            Profily rezu centroidem pro kresleni v prohlizeci (PROFILE_DATA)
+            horizontal/vertical jako bytes typed array (dtype "uint8" nebo "float32"), meritko osy x v um/px
+        """
+        data = {
+            'found' : self.centroid_x_px is not None,
+            'width' : self.width,
+            'height' : self.height,
+            'um_per_px' : self.pixel_size / self.resizeFactor,
+            'center_x_um' : self.center_x_um,
+            'center_y_um' : self.center_y_um,
+        }
+        if self.centroid_x_px is None:
+            return data
+        self.calc_profiles()
+        (horizontal, vertical) = (self.profile_horizontal, self.profile_vertical)
+        if horizontal.dtype != np.uint8:
+            (horizontal, vertical) = (horizontal.astype(np.float32), vertical.astype(np.float32))
+        data.update({
+            'centroid_x_px' : self.centroid_x_px,
+            'centroid_y_px' : self.centroid_y_px,
+            'dtype' : horizontal.dtype.name,
+            'horizontal' : np.ascontiguousarray(horizontal).tobytes(),
+            'vertical' : np.ascontiguousarray(vertical).tobytes(),
+        })
+        return data
+
+    def calc_profiles( self ):
+        if self.profile_horizontal is None:
+            self.profile_horizontal, self.profile_vertical = get_profiles(
+                self.img_gray_proc, self.centroid_x_px, self.centroid_y_px, self.profile_band)
+
     def draw_centroid( self ):
         if self.centroid_x_px is not None:
             h = self.img_dst.shape[0]
@@ -166,28 +396,15 @@ class CameraImg:
     def draw_centroid_cut( self ):
         if self.centroid_x_px is None:
             return
-        
-        h = self.img_src.shape[0]
-        w = self.img_src.shape[1]
-        lx = []
-        ly = []
+        self.calc_profiles()
 
         # nejprve mrizka, pak signal
         self.draw_measures_cut(self.cut_horizontal)
         self.draw_measures_cut(self.cut_vertical)
 
-        # TO DO optimalizovat z cyklu
-        for x in range(0,w):
-            lx.append(self.img_gray_proc[self.centroid_y_px][x])
-        for y in range(0,h):
-            ly.append(self.img_gray_proc[y][self.centroid_x_px])
-
-        for x in range(0,w-1):
-            #self.img_dst[lx[x]][x] = (0,255,0)
-            cv2.line(self.cut_horizontal, (x,self.cut_horizontal.shape[0]-lx[x]), (x+1,self.cut_horizontal.shape[0]-lx[x+1]), (255, 255, 255), self.line_width_centroid_cut) 
-        for y in range(0,h-1):
-            #self.img_dst[y][ly[y]] = (0,0,255 )
-            cv2.line(self.cut_vertical, (y, self.cut_vertical.shape[0]-ly[y]), (y+1, self.cut_vertical.shape[0]-ly[y+1]), (255, 255, 255), self.line_width_centroid_cut) 
+        # kazdy profil jednim volanim polylines
+        cv2.polylines(self.cut_horizontal, [profile_polyline(self.profile_horizontal, self.cut_horizontal.shape[0])], False, (255, 255, 255), self.line_width_centroid_cut)
+        cv2.polylines(self.cut_vertical, [profile_polyline(self.profile_vertical, self.cut_vertical.shape[0])], False, (255, 255, 255), self.line_width_centroid_cut)
 
         # cv2.imshow("v", self.cut_vertical)
         # cv2.imshow("h", self.cut_horizontal)
@@ -201,22 +418,35 @@ class CameraImg:
                 (self.beam_width_left_px+self.beam_width_px,self.beam_height_top_px+self.beam_height_px),
                 (255,255,255),2) 
 
+    def draw_roi( self ):
+        if self.roi is None:
+            return
+        f = self.resizeFactor
+        (x0, y0, x1, y1) = self.roi
+        cv2.rectangle(self.img_dst, (int(x0*f), int(y0*f)), (int(x1*f), int(y1*f)), (120,120,120), self.line_width)
+
     def draw_measures( self ):
         if self.centroid_x_px is None:
             return
-        h = self.img_dst.shape[0]
-        w = self.img_dst.shape[1]
+        key = ("measures", self.img_dst.shape, self.pixel_size, self.resizeFactor, self.center_x_um, self.center_y_um,
+            self.line_width, self.font_size, self.font_line_width)
+        layer, mask = MEASURES_CACHE.get(key, lambda: self.render_measures(np.zeros(self.img_dst.shape, self.img_dst.dtype)))
+        composite(self.img_dst, layer, mask)
+
+    def render_measures( self, target ):
+        h = target.shape[0]
+        w = target.shape[1]
 
         zero_x = -1*round(self.center_x_um/(self.pixel_size/self.resizeFactor))
         zero_y = -1*round(self.center_y_um/(self.pixel_size/self.resizeFactor))
 
         #cross
-        #cv2.line(self.img_dst, (int(w/2)+zero_x,0), (int(w/2)+zero_x,h), (150,150,150), self.line_width) 
-        #cv2.line(self.img_dst, (0,int(h/2)+zero_y), (w,int(h/2)+zero_y), (150,150,150), self.line_width) 
+        #cv2.line(target, (int(w/2)+zero_x,0), (int(w/2)+zero_x,h), (150,150,150), self.line_width) 
+        #cv2.line(target, (0,int(h/2)+zero_y), (w,int(h/2)+zero_y), (150,150,150), self.line_width) 
         cross_sz = int(h / 40 )
         meas_big_line_size = int(h / 80 )
-        cv2.line(self.img_dst, (int(w/2)+zero_x,int(h/2)+zero_y-cross_sz), (int(w/2)+zero_x,int(h/2)+zero_y+cross_sz), (255,255,255), self.line_width) 
-        cv2.line(self.img_dst, (int(w/2)+zero_x-cross_sz,int(h/2)+zero_y), (int(w/2)+zero_x+cross_sz,int(h/2)+zero_y), (255,255,255), self.line_width) 
+        cv2.line(target, (int(w/2)+zero_x,int(h/2)+zero_y-cross_sz), (int(w/2)+zero_x,int(h/2)+zero_y+cross_sz), (255,255,255), self.line_width) 
+        cv2.line(target, (int(w/2)+zero_x-cross_sz,int(h/2)+zero_y), (int(w/2)+zero_x+cross_sz,int(h/2)+zero_y), (255,255,255), self.line_width) 
 
         # nezaokrouhlovat! - zaokrouhlit az uvnitr pred vykreslenim
         # ve for cyklu pokud se pouzije zaokrouhlene jako step, tak se vyscita chyba
@@ -231,16 +461,16 @@ class CameraImg:
         start = round((((w/2)+zero_x) % big_step) - big_step)
         for i in np.arange(start,w,big_step):
             x = round(i)
-            cv2.line(self.img_dst, (x,w), (x,h-meas_big_line_size), (255,255,255), self.line_width) 
+            cv2.line(target, (x,w), (x,h-meas_big_line_size), (255,255,255), self.line_width) 
             txt_sz = cv2.getTextSize(str(label), cv2.FONT_HERSHEY_SIMPLEX, self.font_size, self.font_line_width)
-            cv2.putText(self.img_dst, str(label), (int(x - txt_sz[0][0]/2), h - (meas_big_line_size + 5)),cv2.FONT_HERSHEY_SIMPLEX, self.font_size, (255, 255, 255), self.font_line_width)
+            cv2.putText(target, str(label), (int(x - txt_sz[0][0]/2), h - (meas_big_line_size + 5)),cv2.FONT_HERSHEY_SIMPLEX, self.font_size, (255, 255, 255), self.font_line_width)
             cnt = 0
             # kratke carky - kazda pata vetsi
             # zaokrouhlit az uvnitr cyklu po prenasobeni
             for j in range(10):
                 x2 = round(j * small_step)
                 ln_len = meas_big_line_size if cnt == 5 else int(meas_big_line_size / 2)
-                cv2.line(self.img_dst, (x+x2,w), (x+x2,h-ln_len), (255,255,255), self.line_width) 
+                cv2.line(target, (x+x2,w), (x+x2,h-ln_len), (255,255,255), self.line_width) 
                 cnt += 1
             label += 1000
 
@@ -253,22 +483,28 @@ class CameraImg:
         start = int((((h/2)+zero_y) % big_step) - big_step)
         for i in np.arange(start,h,big_step):
             y = round(i)
-            cv2.line(self.img_dst, (0,y), (meas_big_line_size,y), (255,255,255), self.line_width) 
+            cv2.line(target, (0,y), (meas_big_line_size,y), (255,255,255), self.line_width) 
             txt_sz = cv2.getTextSize(str(label), cv2.FONT_HERSHEY_SIMPLEX, self.font_size, self.font_line_width)
-            cv2.putText(self.img_dst, str(label), (meas_big_line_size+5, int(y + txt_sz[0][1]/2)),cv2.FONT_HERSHEY_SIMPLEX, self.font_size, (255, 255, 255), self.font_line_width)
+            cv2.putText(target, str(label), (meas_big_line_size+5, int(y + txt_sz[0][1]/2)),cv2.FONT_HERSHEY_SIMPLEX, self.font_size, (255, 255, 255), self.font_line_width)
             cnt = 0
             # kratke carky - kazda pata vetsi
             for j in range(10):
                 y2 = round(j * small_step)
                 ln_len = meas_big_line_size if cnt == 5 else int(meas_big_line_size / 2)
-                cv2.line(self.img_dst, (0,y+y2), (ln_len,y+y2), (255,255,255), self.line_width) 
+                cv2.line(target, (0,y+y2), (ln_len,y+y2), (255,255,255), self.line_width) 
                 cnt += 1
             label -= 1000
+        return target
 
     def draw_measures_cut(self, target):
         if self.centroid_x_px is None:
             return
-        
+        key = ("measures_cut", target.shape, target.dtype.str, self.pixel_size, self.resizeFactor, self.center_x_um,
+            self.line_width, self.font_size, self.font_line_width)
+        layer, mask = MEASURES_CACHE.get(key, lambda: self.render_measures_cut(np.zeros(target.shape, target.dtype)))
+        composite(target, layer, mask)
+
+    def render_measures_cut(self, target):
         h = target.shape[0]
         w = target.shape[1]
 
@@ -306,7 +542,7 @@ class CameraImg:
             cv2.line(target, (0,h-y), (w,h-y), color, self.line_width) 
             txt_sz = cv2.getTextSize(str(label), cv2.FONT_HERSHEY_SIMPLEX, self.font_size, self.font_line_width)
             cv2.putText(target, str(y), (2, int(h - (y + txt_sz[0][1] + 2))), cv2.FONT_HERSHEY_SIMPLEX, self.font_size, color, self.font_line_width)
-
+        return target
 
     def draw_info( self, print_info ):
         h = self.img_dst.shape[0]
@@ -323,17 +559,23 @@ class CameraImg:
     def draw_info_small( self, txt, col ):
         cv2.putText(self.img_dst, str(txt), (20, 10),cv2.FONT_HERSHEY_SIMPLEX, 0.4, col, 1)
 
-    def get_graph_surface_data( self ):
-            small = cv2.resize(self.img_gray_proc, (60, 60)) 
-            h = small.shape[0]
-            w = small.shape[1]
-            out = []
-            for y in range(0,h):
-                rr = []
-                for x in range(0,w):
-                    rr.append(small[y][x])
-                out.append(rr)
-            return out
+    def get_surface_data( self, size=64 ):
+        """
+            Mrizka pro 3D graf (SURFACE_DATA) jako bytes typed array po radcich, dtype "uint8" nebo "float32"
+            um_per_cell = velikost bunky mrizky v um (x, y)
+        """
+        grid = cv2.resize(self.img_gray_proc, (size, size), interpolation=cv2.INTER_AREA)
+        if grid.dtype != np.uint8:
+            grid = grid.astype(np.float32)
+        um_per_px = self.pixel_size / self.resizeFactor
+        return {
+            'size' : size,
+            'dtype' : grid.dtype.name,
+            'data' : grid.tobytes(),
+            'width' : self.width,
+            'height' : self.height,
+            'um_per_cell' : [um_per_px * self.width / size, um_per_px * self.height / size],
+        }
 
 
 def img_resize( img, sz = 1 ):
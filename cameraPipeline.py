@@ -0,0 +1,262 @@
+import logging
+import threading
+import time
+
+from harvesterWrapper import HarvesterWrapper
+from processingWorker import ProcessingWorker
+from processPool import ProcessPoolWorker
+from encodeCache import EncodeCache
+from encoders import Encoding, STREAM_KINDS
+from metrics import Metrics
+from measurementRecorder import MeasurementRecorder
+from frameRecorder import FrameRecorder
+from calibration import FrameCalibration
+from streamClients import StreamClient, StreamParams
+
+class CameraPipeline():
+    """
+        Vse pro jednu spustenou kameru: grab thread (camera), zpracovani (worker),
+        cache zakodovanych snimku, zaznamy a rozesilani mereni
+        Kazda kamera ma vlastni thready, App drzi pipeline podle serial number
+    """
+    def __init__(self, camera : HarvesterWrapper, deviceInfo, config, socketio, subscriptionsFunc):
+        self.camera : HarvesterWrapper = camera
+        self.deviceInfo = deviceInfo
+        self.serial = deviceInfo["serial_number"]
+        self.model = deviceInfo["model"]
+        self.config = config
+        self.socketio = socketio
+        # casy kroku teto kamery (grab, zpracovani, kodovani, odeslani)
+        self.metrics = Metrics(labels={"serial" : self.serial})
+        self.camera.metrics = self.metrics
+        # subscriptionsFunc(channel, serial) -> mnozina odberu (decimace, fps, velikost) kanalu (CHANNELS)
+        self.subscriptionsFunc = subscriptionsFunc
+
+        # trvaly zapis mereni
+        self.recorder = None
+        if config["RECORDER"]["ENABLED"]:
+            self.recorder = MeasurementRecorder(config["RECORDER"])
+
+        # jedno zpracovani snimku sdilene vsemi klienty - v threadu nebo v procesech (PROCESSING.EXECUTION)
+        if config["PROCESSING"]["EXECUTION"]["MODE"] == "process":
+            self.worker = ProcessPoolWorker(camera, config, self.recorder)
+        else:
+            self.worker = ProcessingWorker(camera, config, self.recorder)
+        self.worker.metrics = self.metrics
+        # mrizky SURFACE_DATA se pocitaji jen v odebiranych velikostech
+        self.worker.surfaceSizesFunc = lambda: {s[2] for s in subscriptionsFunc("SURFACE_DATA", self.serial)}
+        # profily jen pokud nekdo odebira PROFILE_DATA
+        self.worker.profilesFunc = lambda: len(subscriptionsFunc("PROFILE_DATA", self.serial)) > 0
+        # zakodovane snimky sdilene vsemi klienty stejneho streamu
+        self.encodeCache = EncodeCache(config["ENCODE_CACHE_SIZE"], self.metrics)
+        # vychozi encoder jednotlivych streamu (IMAGE_COMPRESSION, STREAM_COMPRESSION)
+        self.encodings = {kind : Encoding.fromConfig(config, kind) for kind in STREAM_KINDS}
+        # zaznam raw snimku z kamery
+        self.frameRecorder = FrameRecorder(config["FRAME_RECORDER"])
+        # dark/flat kalibrace pro aktualni expozici, pouziva ji zpracovani snimku
+        calibrationConfig = config["CALIBRATION"]
+        self.calibration = FrameCalibration(calibrationConfig["DIRECTORY"], self.serial, calibrationConfig["FLAT_MAX_GAIN"])
+        self.worker.calibration = self.calibration
+
+        self.publishThread = None
+        self.publishStoppedEvent = threading.Event()
+
+        # aktualni nodes kamery
+        self.nodes = []
+
+    def start(self, userConfig):
+        self.nodes = self.camera.startGrab(self.deviceInfo, userConfig)
+        self.calibration.setExposure(self._getNodeValue(self.config["CALIBRATION"]["EXPOSURE_NODE"]))
+        if self.recorder is not None:
+            self.recorder.start(self.serial)
+        self.worker.start(self.config["PIXEL_SIZE"][self.model])
+        self._startPublishing()
+        return self.nodes
+
+    def stop(self):
+        self._stopPublishing()
+        if self.camera.frameRecorder is not None:
+            self.stopFrameRecording()
+        self.worker.stop()
+        if self.recorder is not None:
+            self.recorder.stop()
+        self.camera.stopGrab()
+        self.nodes = []
+
+    def isCapturing(self):
+        return self.camera.isCapturing()
+
+    def updateNode(self, nodeName, value):
+        self.nodes = self.camera.updateNode(nodeName, value)
+        # prumer snimku s jinou expozici/gainem by mereni zkreslil
+        if nodeName in self.config["PROCESSING"]["AVERAGING"]["RESET_NODES"]:
+            logging.debug(f"Frame averaging reset after {nodeName} change")
+            self.worker.resetAveraging()
+        # kalibrace pro novou expozici (hodnotu mohla kamera upravit)
+        if nodeName == self.config["CALIBRATION"]["EXPOSURE_NODE"]:
+            self.calibration.setExposure(self._getNodeValue(nodeName))
+        return self.nodes
+
+    def _getNodeValue(self, nodeName):
+        for node in self.nodes:
+            if node.get("name") == nodeName:
+                return node.get("value")
+        return None
+
+    def captureCalibration(self, kind, frames=None):
+        """
+            Nasnima dark frame / flat-field ("dark", "flat") pro aktualni expozici, vrati status kalibrace
+        """
+        if not self.isCapturing():
+            raise Exception("Camera is not capturing")
+        if frames is None:
+            frames = self.config["CALIBRATION"]["FRAMES"]
+        status = self.calibration.capture(self.camera, kind, int(frames))
+        self.worker.resetAveraging()
+        return status
+
+    def clearCalibration(self, kind=None):
+        status = self.calibration.clear(kind)
+        self.worker.resetAveraging()
+        return status
+
+    def getCalibration(self):
+        return self.calibration.status()
+
+    def startFrameRecording(self):
+        path = self.frameRecorder.start(self.serial)
+        self.camera.frameRecorder = self.frameRecorder
+        return path
+
+    def stopFrameRecording(self):
+        self.camera.frameRecorder = None
+        return self.frameRecorder.stop()
+
+    def _getStreamChunk(self, result, kind, params : StreamParams):
+        encoding = self.encodings[kind].withQuality(params.quality)
+        size = params.getSize()
+        # varianta klienta muze byt zmensena a zakodovana uz pri zpracovani (processPool)
+        encoded = result.getEncoded(kind, size, params.quality)
+        return self.encodeCache.getChunk(
+            result.seq, kind,
+            result.getImage(kind) if encoded is None else None,
+            encoding, encoded, size
+        )
+
+    def getStream(self, kind, client : StreamClient):
+        """
+            Generator multipart dilu streamu kind ("main", "cut_horizontal", "cut_vertical") pro jednoho klienta
+            Posila se vzdy posledni vysledek (latest wins), nic se nehromadi - dalsi dil se pripravi
+            az po zapsani predchoziho do socketu, pomaly klient snimky vynecha (client.dropped)
+            client.params.fps omezuje frekvenci, w/h/q urcuji variantu sdilenou klienty v encodeCache
+        """
+        # rezy se renderuji (a v procesech streamy zmensuji a koduji) jen kdyz je pripojeny jejich stream
+        variant = (client.params.getSize(), client.params.quality)
+        self.worker.addStreamClient(kind, 1, variant)
+        try:
+            yield from self._streamResults(kind, client)
+        finally:
+            self.worker.addStreamClient(kind, -1, variant)
+
+    def _streamResults(self, kind, client : StreamClient):
+        interval = 1.0 / client.params.fps if client.params.fps else 0.0
+        lastIndex = None
+        throttled = False
+        for result in self.worker.subscribe():
+            if lastIndex is not None:
+                missed = max(result.index - lastIndex - 1, 0)
+                if throttled:
+                    client.throttled += missed
+                else:
+                    client.dropped += missed
+            lastIndex = result.index
+            # vysledek zpracovany pred pripojenim streamu (v procesech i pred pripojenim varianty w/h/q)
+            if not result.hasImage(kind, client.params.getSize(), client.params.quality):
+                continue
+
+            chunk = self._getStreamChunk(result, kind, client.params)
+            t = time.perf_counter()
+            # generator pokracuje az po zapsani dilu do socketu
+            yield chunk
+            now = self.metrics.since("send", t)
+            if result.frameTimestamp is not None:
+                self.metrics.since("latency", result.frameTimestamp)
+            client.sent += 1
+            client.sentBytes += len(chunk)
+            client.lastSendMs = (now - t) * 1000
+            client.lastSent = time.time()
+
+            # omezeni fps - cekani se pocita od zacatku odesilani
+            wait = t + interval - now
+            throttled = wait > 0
+            if throttled and self.worker.stoppedEvent.wait(wait):
+                break
+
+    def getMeasData(self):
+        result = self.worker.getResult()
+        return result.measData if result is not None else None
+
+    def _startPublishing(self):
+        self._stopPublishing()
+        self.publishStoppedEvent.clear()
+        self.publishThread = threading.Thread(target=self._publishingWork, name=f"publish_{self.serial}")
+        self.publishThread.daemon = True
+        self.publishThread.start()
+
+    def _stopPublishing(self):
+        self.publishStoppedEvent.set()
+        if self.publishThread is not None:
+            self.publishThread.join()
+            self.publishThread = None
+
+    def _publishingWork(self):
+        """
+            Posila data kazdeho zpracovaneho snimku odberatelum kanalu (MEAS_DATA, PROFILE_DATA, SURFACE_DATA)
+            Jedna zprava na room (kanal + serial + odber), ne na klienta
+        """
+        lastSeq = 0
+        counter = 0
+        # room -> cas posledni zpravy, pro omezeni fps
+        lastPublished = {}
+        while not self.publishStoppedEvent.is_set():
+            result = self.worker.waitForResult(lastSeq, self.worker.WAIT_TIMEOUT)
+            if result is None:
+                continue
+            lastSeq = result.seq
+            counter += 1
+            now = time.time()
+
+            for (channel, getData) in CHANNELS.items():
+                for subscription in self.subscriptionsFunc(channel, self.serial):
+                    (decimation, fps, size) = subscription
+                    if counter % decimation != 0:
+                        continue
+                    room = channelRoom(channel, self.serial, subscription)
+                    # tolerance 5 ms, aby fps blizke fps kamery nevynechavalo kazdy druhy snimek
+                    if fps is not None and now - lastPublished.get(room, 0) < 1.0 / fps - 0.005:
+                        continue
+                    data = getData(result, subscription)
+                    # vysledek zpracovany pred prihlasenim odberu
+                    if data is None:
+                        continue
+                    payload = dict(data)
+                    payload["serial"] = self.serial
+                    payload["seq"] = result.seq
+                    payload["timestamp"] = result.timestamp
+                    lastPublished[room] = now
+                    try:
+                        self.socketio.emit(channel, payload, to=room)
+                    except Exception as e:
+                        logging.exception(f"Exception during sending {channel}")
+
+# kanaly posilane po zpracovanem snimku: nazev eventu -> data z ProcessedFrame podle odberu (decimace, fps, velikost)
+# PROFILE_DATA a SURFACE_DATA obsahuji pole jako bytes - socketio je posila jako binarni prilohy (ArrayBuffer v prohlizeci)
+CHANNELS = {
+    "MEAS_DATA" : lambda result, subscription: result.measData,
+    "PROFILE_DATA" : lambda result, subscription: result.profileData,
+    "SURFACE_DATA" : lambda result, subscription: result.surfaceData.get(subscription[2]),
+}
+
+def channelRoom(channel, serial, subscription):
+    (decimation, fps, size) = subscription
+    return f"{channel}_{serial}_{decimation}_{fps}_{size}"
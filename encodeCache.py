@@ -0,0 +1,94 @@
+import threading
+import time
+import cv2
+from collections import OrderedDict
+from metrics import METRICS
+from encoders import Encoding
+
+def fitImage(image, maxWidth=None, maxHeight=None):
+    """
+        Zmensi obraz do maxWidth x maxHeight se zachovanim pomeru stran, nezvetsuje
+    """
+    (h, w) = image.shape[:2]
+    f = min(maxWidth / w if maxWidth else 1.0, maxHeight / h if maxHeight else 1.0)
+    if f >= 1.0:
+        return image
+    return cv2.resize(image, (max(int(w * f), 1), max(int(h * f), 1)), interpolation=cv2.INTER_AREA)
+
+def multipartChunk(imageBytes, contentType):
+    """
+        Jeden dil multipart/x-mixed-replace streamu vcetne boundary a hlavicek
+    """
+    res = bytes("--frame\r\n", encoding="utf-8")
+    res += bytes(f"Content-Type: {contentType}\r\n\r\n", encoding="utf-8")
+    res += imageBytes
+    res += bytes("\r\n", encoding="utf-8")
+    return res
+
+class EncodeCache():
+    """
+        Cache hotovych multipart dilu podle (seq snimku, typ streamu, encoder s parametry, velikost)
+        N klientu stejne varianty streamu sdili jedno zmenseni, kodovani a jeden bytes objekt
+        Stejny klic koduje vzdy jen jeden thread, ostatni pockaji na vysledek
+    """
+    def __init__(self, maxItems=16, metrics=METRICS):
+        self.maxItems = maxItems
+        self.metrics = metrics
+        self.lock = threading.Lock()
+        self.items = OrderedDict()
+        # klice ktere se prave koduji -> Event
+        self.pending = {}
+
+    def get(self, key, encodeFunc):
+        """
+            Vrati ulozeny dil pro key, pripadne ho vytvori zavolanim encodeFunc()
+        """
+        while True:
+            with self.lock:
+                if key in self.items:
+                    self.items.move_to_end(key)
+                    return self.items[key]
+                event = self.pending.get(key)
+                if event is None:
+                    event = threading.Event()
+                    self.pending[key] = event
+                    break
+            # koduje jiny thread
+            event.wait()
+
+        try:
+            chunk = encodeFunc()
+            with self.lock:
+                self.items[key] = chunk
+                while len(self.items) > self.maxItems:
+                    self.items.popitem(last=False)
+            return chunk
+        finally:
+            with self.lock:
+                del self.pending[key]
+            event.set()
+
+    def getChunk(self, seq, kind, image, encoding : Encoding, encoded=None, size=None):
+        """
+            Multipart dil pro obraz image ze snimku seq
+            encoded = obraz uz zakodovany jinde (processPool), pak se image nekoduje
+            size = (maxWidth, maxHeight) zmenseni pred kodovanim, None = puvodni velikost
+        """
+        key = (seq, kind, encoding, size)
+        def encode():
+            t = time.perf_counter()
+            img = image
+            if size is not None and encoded is None:
+                img = fitImage(image, *size)
+                t = self.metrics.since("scale:" + kind, t)
+            imageBytes = encoding.encode(img) if encoded is None else encoded
+            chunk = multipartChunk(imageBytes, encoding.contentType)
+            # cas kodovani v procesu se zapisuje s vysledkem zpracovani
+            if encoded is None:
+                self.metrics.since("encode:" + kind, t)
+            return chunk
+        return self.get(key, encode)
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
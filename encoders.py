@@ -0,0 +1,129 @@
+import logging
+import cv2
+import numpy as np
+
+# Kodovani obrazu streamu
+# Encoder se vybira v config.hjson IMAGE_COMPRESSION (vsechny streamy) a STREAM_COMPRESSION (jednotlive streamy)
+#
+# Srovnani na 600x600 BGR snimku paprsku se sumem (main) a 280x600 rezu (cut), 1 vlakno:
+#   jpg q90          1.2 ms   23 kB    cut 0.7 ms  21 kB
+#   jpg q90 optimize 2.1 ms   20 kB    (optimalizace Huffman tabulek - vypnuta, 2x pomalejsi)
+#   png level 3     42 ms    221 kB    cut 6 ms    5 kB   (vychozi OpenCV)
+#   png level 1     27 ms    255 kB    cut 6 ms    6 kB
+#   webp q90        37 ms      9 kB    cut 17 ms   6 kB   - nejmensi, pro pomale site
+#   turbojpeg       podle HW ~0.5-1x casu OpenCV jpg (PyTurboJPEG + libjpeg-turbo, volitelne)
+# png je na zasumenem obraze pomale a velke, hodi se hlavne pro rezy (cut_*)
+# Casy jsou orientacni, zalezi na HW - vlastni mereni: python benchmark.py --encoders
+
+# streamy, ktere lze kodovat
+STREAM_KINDS = ("main", "cut_horizontal", "cut_vertical")
+
+try:
+    import turbojpeg
+except ImportError:
+    turbojpeg = None
+
+# instance TurboJPEG (nacita sdilenou knihovnu libjpeg-turbo), vytvori se pri prvnim pouziti
+_turbo = None
+
+def _getTurbo():
+    global _turbo
+    if _turbo is None:
+        _turbo = turbojpeg.TurboJPEG()
+    return _turbo
+
+def encode_jpg(image, quality, compression):
+    params = [cv2.IMWRITE_JPEG_QUALITY, int(quality), cv2.IMWRITE_JPEG_OPTIMIZE, 0]
+    ok, buf = cv2.imencode(".jpg", image, params)
+    return buf.tobytes() if ok else b""
+
+def encode_turbojpeg(image, quality, compression):
+    if image.ndim == 2:
+        (pixelFormat, subsample) = (turbojpeg.TJPF_GRAY, turbojpeg.TJSAMP_GRAY)
+    else:
+        (pixelFormat, subsample) = (turbojpeg.TJPF_BGR, turbojpeg.TJSAMP_420)
+    return _getTurbo().encode(np.ascontiguousarray(image), quality=int(quality), pixel_format=pixelFormat,
+        jpeg_subsample=subsample, flags=turbojpeg.TJFLAG_FASTDCT)
+
+def encode_png(image, quality, compression):
+    ok, buf = cv2.imencode(".png", image, [cv2.IMWRITE_PNG_COMPRESSION, int(compression)])
+    return buf.tobytes() if ok else b""
+
+def encode_webp(image, quality, compression):
+    ok, buf = cv2.imencode(".webp", image, [cv2.IMWRITE_WEBP_QUALITY, int(quality)])
+    return buf.tobytes() if ok else b""
+
+# nazev -> (funkce(image, quality, compression), MIME typ, pouziva quality)
+ENCODERS = {
+    "jpg" : (encode_jpg, "image/jpeg", True),
+    "turbojpeg" : (encode_turbojpeg, "image/jpeg", True),
+    "png" : (encode_png, "image/png", False),
+    "webp" : (encode_webp, "image/webp", True),
+}
+
+def isAvailable(name):
+    if name == "turbojpeg":
+        if turbojpeg is None:
+            return False
+        try:
+            _getTurbo()
+        except Exception as e:
+            logging.warning(f"libjpeg-turbo not available: {e}")
+            return False
+    return name in ENCODERS
+
+class Encoding():
+    """
+        Encoder s parametry pro jeden stream, hashovatelny (klic EncodeCache)
+        quality = kvalita jpg/turbojpeg/webp (1-100), compression = uroven komprese png (0-9)
+    """
+    def __init__(self, name="jpg", quality=90, compression=1):
+        if name not in ENCODERS:
+            raise Exception(f"Unknown image encoder: {name}")
+        if name == "turbojpeg" and not isAvailable(name):
+            logging.warning("Encoder turbojpeg not available (pip install PyTurboJPEG + libjpeg-turbo), using jpg")
+            name = "jpg"
+        (self.func, self.contentType, usesQuality) = ENCODERS[name]
+        self.name = name
+        # nepouzite parametry nejsou soucasti klice
+        self.quality = int(quality) if usesQuality else None
+        self.compression = int(compression) if name == "png" else None
+
+    @staticmethod
+    def fromConfig(config, kind=None):
+        """
+            Encoder streamu kind podle IMAGE_COMPRESSION, STREAM_COMPRESSION, JPG_QUALITY, PNG_COMPRESSION
+        """
+        name = config["IMAGE_COMPRESSION"]
+        if kind is not None:
+            name = config.get("STREAM_COMPRESSION", {}).get(kind, name)
+        return Encoding(name, config["JPG_QUALITY"], config.get("PNG_COMPRESSION", 1))
+
+    def withQuality(self, quality):
+        """
+            Stejny encoder s jinou kvalitou (?q= klienta), png se nemeni
+        """
+        if quality is None or self.quality is None or quality == self.quality:
+            return self
+        return Encoding(self.name, quality)
+
+    def key(self):
+        return (self.name, self.quality, self.compression)
+
+    def __eq__(self, other):
+        return isinstance(other, Encoding) and self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def __repr__(self):
+        return f"Encoding{self.key()}"
+
+    def encode(self, image):
+        """
+            Zakoduje obraz, vrati bytes (prazdne pri chybe)
+            Obraz jiny nez uint8 (napr. float rezy) se prevede se saturaci
+        """
+        if image.dtype != np.uint8:
+            image = cv2.convertScaleAbs(image)
+        return self.func(image, self.quality, self.compression)
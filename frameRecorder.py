@@ -0,0 +1,200 @@
+import glob
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import numpy as np
+
+import timeHelper
+
+MAGIC = b"CPFRAM01"
+# zarovnani oblasti dat v souboru (stranka)
+ALIGN = 4096
+MANIFEST = "recording.json"
+
+def _aligned(n):
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+def isRecording(path):
+    return os.path.isfile(os.path.join(path, MANIFEST))
+
+class FrameChunk():
+    """
+        Jeden soubor zaznamu - snimky se stejnym formatem a rozmerem
+        Rozlozeni: MAGIC, delka JSON (uint32), JSON hlavicka | timestamps f8[capacity] | snimky [capacity, frameBytes]
+        Oblasti jsou zarovnane na ALIGN, soubor se pri zavreni zkrati na skutecny pocet snimku
+    """
+    def __init__(self, path, header, mode):
+        self.path = path
+        self.header = header
+        self.dtype = np.dtype(header["dtype"])
+        self.frameShape = tuple(header["frameShape"])
+        self.frameBytes = int(np.prod(self.frameShape)) * self.dtype.itemsize
+        self.capacity = header["capacity"]
+        self.tsOffset = header["tsOffset"]
+        self.dataOffset = header["dataOffset"]
+
+        size = os.path.getsize(path)
+        self.timestamps = np.memmap(path, dtype="<f8", mode=mode, offset=self.tsOffset, shape=(self.capacity,))
+        frames = self.capacity if mode == "r+" else max(min(self.capacity, (size - self.dataOffset) // self.frameBytes), 0)
+        self.frames = None
+        if frames > 0:
+            self.frames = np.memmap(path, dtype=self.dtype, mode=mode, offset=self.dataOffset, shape=(frames,) + self.frameShape)
+        # pri cteni: snimky s platnym casem (neuplny zaznam po padu ma nulove casy)
+        self.count = 0 if mode == "r+" else int(np.count_nonzero(self.timestamps[:frames] > 0))
+
+    @staticmethod
+    def create(path, data, width, height, pixelFormat, componentsPerPixel, capacity):
+        header = {
+            "pixelFormat" : pixelFormat,
+            "width" : int(width),
+            "height" : int(height),
+            "components" : int(componentsPerPixel),
+            "dtype" : np.dtype(data.dtype).str,
+            "frameShape" : list(data.shape),
+            "capacity" : int(capacity),
+        }
+        headerBytes = len(json.dumps(header)) + 128
+        header["tsOffset"] = _aligned(len(MAGIC) + 4 + headerBytes)
+        header["dataOffset"] = _aligned(header["tsOffset"] + capacity * 8)
+        frameBytes = data.nbytes
+        with open(path, "wb") as f:
+            raw = json.dumps(header).encode("utf-8")
+            f.write(MAGIC)
+            f.write(struct.pack("<I", len(raw)))
+            f.write(raw)
+            f.truncate(header["dataOffset"] + capacity * frameBytes)
+        return FrameChunk(path, header, "r+")
+
+    @staticmethod
+    def open(path):
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise Exception(f"Not a frame recording chunk: {path}")
+            (length,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(length).decode("utf-8"))
+        return FrameChunk(path, header, "r")
+
+    def matches(self, data, width, height, pixelFormat):
+        return self.header["pixelFormat"] == pixelFormat and self.header["width"] == width and \
+            self.header["height"] == height and data.dtype == self.dtype and data.shape == self.frameShape
+
+    def isFull(self):
+        return self.count >= self.capacity
+
+    def append(self, data, timestamp):
+        self.frames[self.count] = data
+        self.timestamps[self.count] = timestamp
+        self.count += 1
+
+    def close(self):
+        """
+            Zapis na disk a zkraceni souboru na skutecny pocet snimku
+        """
+        self.timestamps.flush()
+        self.frames.flush()
+        self.timestamps = None
+        self.frames = None
+        with open(self.path, "r+b") as f:
+            f.truncate(self.dataOffset + self.count * self.frameBytes)
+
+class FrameRecorder():
+    """
+        Zaznam raw snimku z kamery (pred konverzi pixel formatu) do adresare <DIRECTORY>/frames_<serial>_<timestamp>
+        Snimky se kopiruji do memory-mapped chunku, zapis na disk resi OS
+        Prehrani: FrameRecording, SimulatedCamera (SIMULATION.RECORDING), batchProcess.py
+    """
+    def __init__(self, config):
+        self.config = config
+        self.lock = threading.Lock()
+        self.path = None
+        self.chunk : FrameChunk = None
+        self.chunkIndex = 0
+        self.frames = 0
+        self.limitReached = False
+
+    def start(self, serial):
+        with self.lock:
+            self.path = os.path.join(self.config["DIRECTORY"], f"frames_{serial}_{timeHelper.getTimestamp()}")
+            os.makedirs(self.path, exist_ok=True)
+            with open(os.path.join(self.path, MANIFEST), "w") as f:
+                json.dump({"serial" : serial, "created" : timeHelper.getTimestampNiceVersion()}, f)
+            self.chunk = None
+            self.chunkIndex = 0
+            self.frames = 0
+            self.limitReached = False
+        logging.info(f"Recording frames to: {self.path}")
+        return self.path
+
+    def stop(self):
+        with self.lock:
+            self._closeChunk()
+            self.path = None
+        logging.info(f"Frame recording stopped, {self.frames} frames")
+        return self.frames
+
+    def add(self, data, width, height, pixelFormat, componentsPerPixel, timestamp=None):
+        """
+            Vola grab thread s raw daty bufferu kamery
+        """
+        with self.lock:
+            if self.path is None:
+                return
+            if self.frames >= self.config["MAX_FRAMES"]:
+                if not self.limitReached:
+                    self.limitReached = True
+                    logging.warning(f"Frame recording limit reached ({self.frames} frames)")
+                return
+            try:
+                if self.chunk is None or self.chunk.isFull() or not self.chunk.matches(data, width, height, pixelFormat):
+                    self._closeChunk()
+                    chunkPath = os.path.join(self.path, f"chunk_{self.chunkIndex:05d}.frames")
+                    self.chunk = FrameChunk.create(chunkPath, data, width, height, pixelFormat, componentsPerPixel, self.config["CHUNK_FRAMES"])
+                    self.chunkIndex += 1
+                self.chunk.append(data, time.time() if timestamp is None else timestamp)
+                self.frames += 1
+            except Exception as e:
+                logging.exception("Exception during recording frame, recording stopped")
+                self._closeChunk()
+                self.path = None
+
+    def _closeChunk(self):
+        if self.chunk is not None:
+            self.chunk.close()
+            self.chunk = None
+
+class FrameRecording():
+    """
+        Cteni zaznamu FrameRecorder bez nacitani do pameti
+        recording[i] = (timestamp, data, width, height, pixelFormat, componentsPerPixel)
+        data jsou raw jako z bufferu kamery -> harvesterWrapper.convertFrame
+    """
+    def __init__(self, path):
+        if not isRecording(path):
+            raise Exception(f"Not a frame recording: {path}")
+        self.path = path
+        with open(os.path.join(path, MANIFEST), "r") as f:
+            self.manifest = json.load(f)
+        self.chunks = [FrameChunk.open(p) for p in sorted(glob.glob(os.path.join(path, "chunk_*.frames")))]
+        self.chunks = [c for c in self.chunks if c.count > 0]
+        counts = np.array([c.count for c in self.chunks], dtype=np.int64)
+        self.starts = np.concatenate(([0], np.cumsum(counts)))
+        self.timestamps = np.concatenate([np.asarray(c.timestamps[:c.count]) for c in self.chunks]) if len(self.chunks) else np.zeros(0)
+
+    def __len__(self):
+        return int(self.starts[-1])
+
+    def __getitem__(self, index):
+        if index < 0 or index >= len(self):
+            raise IndexError(index)
+        c = int(np.searchsorted(self.starts, index, side="right")) - 1
+        chunk = self.chunks[c]
+        h = chunk.header
+        return (float(self.timestamps[index]), chunk.frames[index - self.starts[c]],
+            h["width"], h["height"], h["pixelFormat"], h["components"])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
@@ -0,0 +1,128 @@
+import logging
+import threading
+import time
+import numpy as np
+
+class FrameSlot():
+    def __init__(self):
+        self.buffer = None
+        # generace slotu = seq snimku ktery v nem je, 0 = prave se prepisuje
+        self.seq = 0
+        self.readers = 0
+        # cas prichodu snimku (time.perf_counter)
+        self.timestamp = 0.0
+
+class FrameRef():
+    """
+        Pujceny snimek z FrameRing bez kopirovani
+        Po pouziti nutne uvolnit (release / with blok)
+    """
+    def __init__(self, ring, slot : FrameSlot):
+        self.ring = ring
+        self.slot = slot
+        self.seq = slot.seq
+        self.timestamp = slot.timestamp
+        self.image = slot.buffer
+        self.released = False
+        self.overwritten = False
+
+    def release(self):
+        """
+            Vrati True pokud snimek nebyl behem cteni prepsan
+        """
+        if not self.released:
+            self.released = True
+            self.ring._release(self)
+        return not self.overwritten
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+class FrameRing():
+    """
+        Predalokovany kruhovy buffer snimku
+        Grab thread plni sloty na miste (beginWrite / commitWrite),
+        ctenari si snimky pujcuji bez kopie (waitForFrame)
+        Slot s ctenarem se prepise jen pokud jsou obsazene vsechny sloty - pak se to hlasi
+    """
+    def __init__(self, size=4):
+        assert size >= 2, "Frame ring needs at least 2 slots"
+        self.slots = [FrameSlot() for i in range(size)]
+        self.condition = threading.Condition()
+        self.seq = 0
+        self.latest : FrameSlot = None
+        self.writeSlot : FrameSlot = None
+        self.nextIndex = 0
+
+        # pocet prepsani slotu ktery mel jeste ctenare
+        self.overwrites = 0
+
+    def beginWrite(self, shape, dtype):
+        """
+            Vrati buffer slotu do ktereho zapsat dalsi snimek
+        """
+        with self.condition:
+            slot = None
+            for i in range(len(self.slots)):
+                candidate = self.slots[(self.nextIndex + i) % len(self.slots)]
+                if candidate.readers == 0 and candidate is not self.latest:
+                    slot = candidate
+                    break
+            if slot is None:
+                # vsechny sloty drzi ctenari - prepsat nejstarsi
+                slot = self.slots[self.nextIndex]
+                if slot is self.latest:
+                    slot = self.slots[(self.nextIndex + 1) % len(self.slots)]
+                self.overwrites += 1
+                logging.warning(f"Frame ring slot overwritten while still in use (readers={slot.readers})")
+            self.nextIndex = (self.slots.index(slot) + 1) % len(self.slots)
+
+            slot.seq = 0
+            if slot.buffer is None or slot.buffer.shape != tuple(shape) or slot.buffer.dtype != dtype:
+                slot.buffer = np.empty(shape, dtype=dtype)
+            self.writeSlot = slot
+            return slot.buffer
+
+    def commitWrite(self, timestamp=None):
+        """
+            Zverejni posledni zapsany slot, vrati jeho seq
+            timestamp = cas prichodu snimku (time.perf_counter) pro mereni latence
+        """
+        with self.condition:
+            self.seq += 1
+            self.writeSlot.seq = self.seq
+            self.writeSlot.timestamp = time.perf_counter() if timestamp is None else timestamp
+            self.latest = self.writeSlot
+            self.writeSlot = None
+            self.condition.notify_all()
+            return self.seq
+
+    def waitForFrame(self, lastSeq, timeout=None):
+        """
+            Ceka na snimek novejsi nez lastSeq, vrati FrameRef nebo None pri timeoutu
+        """
+        with self.condition:
+            self.condition.wait_for(lambda: self.latest is not None and self.latest.seq > lastSeq, timeout)
+            if self.latest is None or self.latest.seq <= lastSeq:
+                return None
+            return self._acquire()
+
+    def clear(self):
+        with self.condition:
+            self.latest = None
+            self.condition.notify_all()
+
+    def _acquire(self):
+        if self.latest is None:
+            return None
+        self.latest.readers += 1
+        return FrameRef(self, self.latest)
+
+    def _release(self, ref : FrameRef):
+        with self.condition:
+            ref.slot.readers -= 1
+            if ref.slot.seq != ref.seq:
+                ref.overwritten = True
@@ -6,6 +6,8 @@ import time
 import hjson
 import threading
 import queue
+from frameRing import FrameRing, FrameRef
+from metrics import METRICS
 from pyee.asyncio import AsyncIOEventEmitter
 from harvesters.util.pfnc import mono_location_formats, \
     rgb_formats, bgr_formats, \
@@ -18,6 +20,52 @@ ACCESS_STATUSES = {
     3 : "UNREACHABLE",
     4 : "BUSY",
 }
+def convertFrame(data, width, height, data_format, componentsPerPixel, allocate=np.empty):
+    """
+        Prevede raw data snimku z kamery na 3 kanalovy obraz
+        allocate(shape, dtype) vrati cilovy buffer (slot ringu, np.empty...)
+    """
+    # Reshape the image to rgb always
+    if data_format in mono_location_formats:
+        content = data.reshape(height, width)
+        dst = allocate((height, width, 3), content.dtype)
+        cv2.cvtColor(content, cv2.COLOR_GRAY2BGR, dst=dst)
+    else:
+        if data_format in rgb_formats or \
+                data_format in rgba_formats or \
+                data_format in bgr_formats or \
+                data_format in bgra_formats or \
+                data_format in bayer_location_formats:
+            content = data.reshape(
+                height, width,
+                int(componentsPerPixel)  # Set of R, G, B, and Alpha
+            )
+            if data_format in bgr_formats:
+                # Swap every R and B:
+                dst = allocate(content.shape, content.dtype)
+                np.copyto(dst, content[:, :, ::-1])
+
+            elif data_format=="BayerBG8":
+                dst = allocate((height, width, 3), content.dtype)
+                cv2.cvtColor(content, cv2.COLOR_BAYER_BG2RGB, dst=dst)
+            elif data_format=="BayerRG8":
+                dst = allocate((height, width, 3), content.dtype)
+                cv2.cvtColor(content, cv2.COLOR_BayerRG2RGB, dst=dst)
+            elif data_format=="BayerGB8":
+                dst = allocate((height, width, 3), content.dtype)
+                cv2.cvtColor(content, cv2.COLOR_BayerGB2RGB, dst=dst)
+            elif data_format=="BayerGR8": 
+                dst = allocate((height, width, 3), content.dtype)
+                cv2.cvtColor(content, cv2.COLOR_BayerGR2RGB, dst=dst)
+            elif data_format in bayer_location_formats:
+                raise Exception("Bayer pixel format not implemented")
+            else:
+                dst = allocate(content.shape, content.dtype)
+                np.copyto(dst, content)
+        else:
+            raise Exception("Pixel format not implemented")
+    return dst
+
 class HarvesterWrapper(AsyncIOEventEmitter):
     config = None
 
@@ -25,14 +73,28 @@ class HarvesterWrapper(AsyncIOEventEmitter):
     ia = None
 
     grabThread = None
-    grabStoppedEvent = threading.Event()
+    grabStoppedEvent = None
+    # volitelny zaznam raw snimku (FrameRecorder), nastavuje CameraPipeline
+    frameRecorder = None
+    # casy kroku kamery (Metrics), nastavuje CameraPipeline
+    metrics = METRICS
 
-    def __init__(self, config):
+    def __init__(self, config, harvester=None):
+        """
+            harvester = sdileny Harvester jine instance (dalsi kamera), jinak se vytvori novy
+        """
         super().__init__()
 
         self.config = config
-        self.imageLock = threading.Lock()
-        self.image = None
+        # predalokovane sloty na snimky, plnene grab threadem bez kopirovani
+        # seq snimku roste monotonne i pres stop/start grabu
+        self.ring = FrameRing(self.config["FRAME_RING_SIZE"])
+        # vlastni pro kazdou instanci - kazda kamera ma svuj grab thread
+        self.grabStoppedEvent = threading.Event()
+
+        if harvester is not None:
+            self.harvester = harvester
+            return
 
         self.harvester = Harvester()
         for cti in self.config["CTI"]:
@@ -51,6 +113,12 @@ class HarvesterWrapper(AsyncIOEventEmitter):
         # model STC_CMC4MPOE
         # serial 15D2184
 
+    def newDevice(self):
+        """
+            Nova instance pro dalsi kameru se sdilenym Harvester
+        """
+        return HarvesterWrapper(self.config, self.harvester)
+
     def isCapturing(self):
         return self.ia is not None and self.ia.is_acquiring()
 
@@ -68,11 +136,22 @@ class HarvesterWrapper(AsyncIOEventEmitter):
         return res
     
     def getImage(self):
-        with self.imageLock:
-            if self.image is None:
-                return None
-            else:
-                return np.copy(self.image)
+        """
+            Kopie posledniho snimku (nebo None)
+        """
+        ref = self.acquireImage(0, 0)
+        if ref is None:
+            return None
+        with ref:
+            return np.copy(ref.image)
+
+    def acquireImage(self, lastSeq, timeout=None) -> FrameRef:
+        """
+            Ceka na snimek novejsi nez lastSeq (blokujici, bez zateze CPU)
+            Vrati pujceny snimek bez kopie (FrameRef), pri timeoutu nebo zastaveni grabu None
+            Snimek se nesmi menit a po pouziti se musi uvolnit
+        """
+        return self.ring.waitForFrame(lastSeq, timeout)
 
     def updateNode(self, nodeName, value):
         self._setNode(nodeName, value, throw=True)
@@ -123,7 +202,7 @@ class HarvesterWrapper(AsyncIOEventEmitter):
         # ulozit konfigurovatelne nodes
         userNodes = self.getUserConfigNodes()
 
-        self.grabThread = threading.Thread(target=self._grabbingWork)
+        self.grabThread = threading.Thread(target=self._grabbingWork, name=f"grab_{deviceInfo['serial_number']}")
         self.grabThread.setDaemon(True)
         self.grabThread.start()
 
@@ -132,18 +211,23 @@ class HarvesterWrapper(AsyncIOEventEmitter):
 
     def stopGrab(self):
         self.grabStoppedEvent.set()
-        self.grabThread.join() #zajisti ze se fce vrati az po skonceni read threadu
+        if self.grabThread is not None:
+            self.grabThread.join() #zajisti ze se fce vrati az po skonceni read threadu
+            self.grabThread = None
 
         if self.ia:
             self.ia.destroy()
+            self.ia = None
 
-        self.image = None
+        self.ring.clear()
 
     def _grabbingWork(self):
         self.ia.start()
         while not self.grabStoppedEvent.isSet():
             try:
+                t = time.perf_counter()
                 with self.ia.fetch(timeout=self.config["FRAME_READ_TIMEOUT"]) as buffer:
+                    arrival = self.metrics.since("fetch", t)
                     # Work with the Buffer object. It consists of everything you need.
                     payload = buffer.payload
                     component = payload.components[0]
@@ -151,53 +235,33 @@ class HarvesterWrapper(AsyncIOEventEmitter):
                     height = component.height
                     data_format = component.data_format
 
-                    # Reshape the image to rgb always
-                    if data_format in mono_location_formats:
-                        content = component.data.reshape(height, width)
-                        tmp = np.zeros((content.shape[0], content.shape[1], 3), dtype=content.dtype)
-                        tmp[:,:,0] = content
-                        tmp[:,:,1] = content
-                        tmp[:,:,2] = content
-                        content = tmp
-                    else:
-                        if data_format in rgb_formats or \
-                                data_format in rgba_formats or \
-                                data_format in bgr_formats or \
-                                data_format in bgra_formats or \
-                                data_format in bayer_location_formats:
-                            content = component.data.reshape(
-                                height, width,
-                                int(component.num_components_per_pixel)  # Set of R, G, B, and Alpha
-                            )
-                            if data_format in bgr_formats:
-                                # Swap every R and B:
-                                content = content[:, :, ::-1]
-
-                            elif data_format=="BayerBG8":
-                                content = cv2.cvtColor(content, cv2.COLOR_BAYER_BG2RGB)
-                            elif data_format=="BayerRG8":
-                                content = cv2.cvtColor(content, cv2.COLOR_BayerRG2RGB)
-                            elif data_format=="BayerGB8":
-                                content = cv2.cvtColor(content, cv2.COLOR_BayerGB2RGB)
-                            elif data_format=="BayerGR8": 
-                                content = cv2.cvtColor(content, cv2.COLOR_BayerGR2RGB)
-                            else:
-                                raise Exception("Bayer pixel format not implemented")                         
-                        else:
-                            raise Exception("Pixel format not implemented")
-                        
-                    logging.info(f"Grabbed dimensions: {content.shape}")
-
-                    self.emit("image", content)
-                    # self.queue.put(content)
-                    with self.imageLock:
-                        self.image = np.copy(content)
+                    self._storeFrame(component.data, width, height, data_format, component.num_components_per_pixel, arrival)
 
             except Exception as e:
                 logging.exception("Exception during acquiring image")
 
         self.ia.stop()
 
+    def _storeFrame(self, data, width, height, data_format, componentsPerPixel, arrival=None):
+        """
+            Prevede raw data snimku z kamery na 3 kanaly primo do slotu ringu a zverejni ho
+            arrival = cas prichodu bufferu (time.perf_counter)
+        """
+        arrival = time.perf_counter() if arrival is None else arrival
+        if self.frameRecorder is not None:
+            self.frameRecorder.add(data, width, height, data_format, componentsPerPixel)
+
+        # vysledek se zapisuje primo do slotu ringu, bez mezikopii
+        dst = convertFrame(data, width, height, data_format, componentsPerPixel, self.ring.beginWrite)
+
+        logging.debug(f"Grabbed dimensions: {dst.shape}")
+        self.metrics.since("convert", arrival)
+
+        self.ring.commitWrite(arrival)
+        # handler dostane buffer slotu - platny jen behem volani
+        self.emit("image", dst)
+        return dst
+
     def _harvestNodesToPython(self, nodes):
         resultArr = []
         for node in nodes:
@@ -0,0 +1,68 @@
+import threading
+import numpy as np
+
+# polozky get_calculated_data() ukladane do historie
+HISTORY_FIELDS = (
+    "centroid_x_px",
+    "centroid_y_px",
+    "centroid_center_dist_x_um",
+    "centroid_center_dist_y_um",
+    "beam_width_px",
+    "beam_height_px",
+    "beam_width_um",
+    "beam_height_um",
+    "d4s_width_um",
+    "d4s_height_um",
+    "ellipticity",
+    "orientation_deg",
+)
+
+HISTORY_DTYPE = np.dtype(
+    [("timestamp", np.float64), ("seq", np.int64)] +
+    [(name, np.float64) for name in HISTORY_FIELDS]
+)
+
+class MeasurementHistory():
+    """
+        Kruhovy buffer poslednich size mereni v predalokovanem strukturovanem poli
+        Zapisuje processing thread, cte se hromadne pro grafy trendu (posledni N sekund)
+    """
+    def __init__(self, size=36000):
+        self.records = np.zeros(size, dtype=HISTORY_DTYPE)
+        self.index = 0
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def add(self, seq, timestamp, measData):
+        with self.lock:
+            self.records[self.index] = (timestamp, seq) + tuple(measData[name] for name in HISTORY_FIELDS)
+            self.index = (self.index + 1) % self.records.shape[0]
+            self.count = min(self.count + 1, self.records.shape[0])
+
+    def clear(self):
+        with self.lock:
+            self.index = 0
+            self.count = 0
+
+    def getLast(self, seconds=None, count=None):
+        """
+            Kopie mereni serazena podle casu - poslednich seconds sekund a/nebo poslednich count zaznamu
+        """
+        with self.lock:
+            if self.count < self.records.shape[0]:
+                records = self.records[:self.count].copy()
+            else:
+                records = np.concatenate((self.records[self.index:], self.records[:self.index]))
+        if seconds is not None and records.shape[0] > 0:
+            start = np.searchsorted(records["timestamp"], records["timestamp"][-1] - seconds, side="left")
+            records = records[start:]
+        if count is not None:
+            records = records[max(records.shape[0] - int(count), 0):]
+        return records
+
+    def getLastColumns(self, seconds=None, count=None):
+        """
+            Jako getLast, ale jako slovnik sloupcu (seznamu) pro JSON
+        """
+        records = self.getLast(seconds, count)
+        return {name : records[name].tolist() for name in HISTORY_DTYPE.names}
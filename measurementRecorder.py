@@ -0,0 +1,257 @@
+import glob
+import json
+import logging
+import os
+import queue
+import struct
+import threading
+import time
+import numpy as np
+
+import timeHelper
+
+MAGIC = b"CPMEAS01"
+
+# polozky get_calculated_data() ukladane do zaznamu
+RECORD_FIELDS = (
+    "centroid_x_px",
+    "centroid_y_px",
+    "centroid_center_dist_x_px",
+    "centroid_center_dist_y_px",
+    "centroid_center_dist_x_um",
+    "centroid_center_dist_y_um",
+    "beam_width_px",
+    "beam_height_px",
+    "beam_width_um",
+    "beam_height_um",
+    "beam_volume_px",
+    "d4s_width_um",
+    "d4s_height_um",
+    "ellipticity",
+    "orientation_deg",
+)
+
+RECORD_DTYPE = np.dtype(
+    [("timestamp", "<f8"), ("seq", "<i8")] +
+    [(name, "<f4") for name in RECORD_FIELDS]
+)
+
+def writeHeader(f, serial):
+    """
+        Hlavicka souboru: MAGIC, delka JSON (uint32), JSON s popisem zaznamu
+        Za hlavickou nasleduji zaznamy pevne delky RECORD_DTYPE
+    """
+    header = json.dumps({
+        "serial" : serial,
+        "created" : timeHelper.getTimestampNiceVersion(),
+        "dtype" : RECORD_DTYPE.descr,
+    }).encode("utf-8")
+    f.write(MAGIC)
+    f.write(struct.pack("<I", len(header)))
+    f.write(header)
+
+def readHeader(path):
+    """
+        Vrati (hlavicka jako dict, dtype zaznamu, offset prvniho zaznamu)
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise Exception(f"Not a measurement record file: {path}")
+        (length,) = struct.unpack("<I", f.read(4))
+        header = json.loads(f.read(length).decode("utf-8"))
+    dtype = np.dtype([tuple(field) for field in header["dtype"]])
+    return header, dtype, len(MAGIC) + 4 + length
+
+def openRecords(path):
+    """
+        Zaznamy souboru jako memmap (bez nacteni do pameti), neuplny posledni zaznam se ignoruje
+    """
+    (header, dtype, offset) = readHeader(path)
+    count = (os.path.getsize(path) - offset) // dtype.itemsize
+    if count <= 0:
+        return header, np.zeros(0, dtype=dtype)
+    return header, np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+
+def toRecordDtype(records):
+    """
+        Kopie zaznamu v aktualnim RECORD_DTYPE - starsi soubory nemaji novejsi polozky (budou 0)
+    """
+    if records.dtype == RECORD_DTYPE:
+        return np.array(records)
+    converted = np.zeros(records.shape[0], dtype=RECORD_DTYPE)
+    for name in RECORD_DTYPE.names:
+        if name in records.dtype.names:
+            converted[name] = records[name]
+    return converted
+
+def readRange(directory, start=None, end=None, serial=None):
+    """
+        Zaznamy s timestamp v intervalu <start, end) ze vsech souboru v directory (serazene podle casu)
+        start/end = time.time(), None = bez omezeni
+    """
+    parts = []
+    for path in sorted(glob.glob(os.path.join(directory, "meas_*.bin"))):
+        try:
+            (header, records) = openRecords(path)
+        except Exception as e:
+            logging.warning(f"Can not read measurement records {path}: {e}")
+            continue
+        if serial is not None and header["serial"] != serial:
+            continue
+        if records.shape[0] == 0:
+            continue
+        timestamps = records["timestamp"]
+        if (start is not None and timestamps[-1] < start) or (end is not None and timestamps[0] >= end):
+            continue
+        i0 = 0 if start is None else np.searchsorted(timestamps, start, side="left")
+        i1 = records.shape[0] if end is None else np.searchsorted(timestamps, end, side="left")
+        if i1 > i0:
+            parts.append(toRecordDtype(records[i0:i1]))
+    if len(parts) == 0:
+        return np.zeros(0, dtype=RECORD_DTYPE)
+    if len(parts) == 1:
+        return parts[0]
+    # soubory jsou serazene podle serialu, zaznamy vice kamer se prolinaji v case
+    records = np.concatenate(parts)
+    return records[np.argsort(records["timestamp"], kind="stable")]
+
+class MeasurementRecorder():
+    """
+        Zapis vsech mereni do binarnich souboru se zaznamy pevne delky
+        Processing thread jen zapise zaznam do predalokovane davky (add),
+        plne davky zapisuje do souboru vlastni thread
+        Soubory meas_<serial>_<timestamp>.bin se rotuji podle velikosti a stari
+    """
+    # max cekani na zapisovaci thread pri stop (zaseknuty disk)
+    STOP_TIMEOUT = 5.0
+
+    def __init__(self, config):
+        self.directory = config["DIRECTORY"]
+        self.maxBytes = config["MAX_FILE_MB"] * 1024 * 1024
+        self.maxSeconds = config["MAX_FILE_MINUTES"] * 60
+        self.batchSize = config["BATCH_SIZE"]
+        self.flushSeconds = config["FLUSH_SECONDS"]
+
+        self.serial = None
+        self.lock = threading.Lock()
+        self.batch = np.zeros(self.batchSize, dtype=RECORD_DTYPE)
+        self.batchCount = 0
+        # plne davky k zapisu, omezena delka aby pri zaseknutem disku nerostla pamet
+        self.batches = queue.Queue(maxsize=64)
+        # pocet zahozenych zaznamu pri plne fronte
+        self.dropped = 0
+        # zapisovaci thread skoncil chybou - dalsi zaznamy se zahazuji
+        self.failed = False
+
+        self.file = None
+        self.fileBytes = 0
+        self.fileStart = 0
+
+        self.thread = None
+
+    def isRunning(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self, serial):
+        if self.isRunning():
+            self.stop()
+        os.makedirs(self.directory, exist_ok=True)
+        self.serial = serial
+        # nova fronta - ve stare muze po spadlem threadu zustat neprectena data
+        self.batches = queue.Queue(maxsize=64)
+        self.batchCount = 0
+        self.failed = False
+        self.thread = threading.Thread(target=self._writingWork, name="measRecorder")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        """
+            Zapise zbyvajici zaznamy a zavre soubor
+        """
+        if self.thread is None:
+            return
+        if self._checkWriter():
+            with self.lock:
+                self._queueBatch()
+            # None = konec zapisu
+            try:
+                self.batches.put(None, timeout=self.STOP_TIMEOUT)
+            except queue.Full:
+                logging.warning("Measurement recorder queue full on stop")
+            self.thread.join(self.STOP_TIMEOUT)
+            if self.thread.is_alive():
+                logging.warning("Measurement recorder thread did not finish in time")
+        self.thread = None
+
+    def add(self, seq, timestamp, measData):
+        if self.thread is None or not self._checkWriter():
+            return
+        with self.lock:
+            self.batch[self.batchCount] = (timestamp, seq) + tuple(measData[name] for name in RECORD_FIELDS)
+            self.batchCount += 1
+            if self.batchCount >= self.batchSize:
+                self._queueBatch()
+
+    def _checkWriter(self):
+        """
+            False pokud zapisovaci thread skoncil (chyba zapisu), zaloguje se jen jednou
+        """
+        if self.thread.is_alive():
+            return True
+        if not self.failed:
+            self.failed = True
+            logging.error("Measurement recorder thread is not running, records are dropped")
+        return False
+
+    def _queueBatch(self):
+        # volat pod self.lock
+        if self.batchCount == 0:
+            return
+        try:
+            self.batches.put_nowait(self.batch[:self.batchCount])
+            self.batch = np.zeros(self.batchSize, dtype=RECORD_DTYPE)
+        except queue.Full:
+            self.dropped += self.batchCount
+            logging.warning(f"Measurement recorder queue full, {self.batchCount} records dropped (total {self.dropped})")
+        self.batchCount = 0
+
+    def _writingWork(self):
+        try:
+            while True:
+                try:
+                    records = self.batches.get(timeout=self.flushSeconds)
+                except queue.Empty:
+                    # nic plneho - zapsat rozpracovanou davku aby data na disku nezaostavala
+                    with self.lock:
+                        self._queueBatch()
+                    continue
+                if records is None:
+                    break
+                self._writeBatch(records)
+        except Exception as e:
+            logging.exception("Exception during writing measurement records")
+        finally:
+            self._closeFile()
+
+    def _writeBatch(self, records):
+        if self.file is None or self.fileBytes >= self.maxBytes or time.time() - self.fileStart >= self.maxSeconds:
+            self._openFile()
+        data = records.tobytes()
+        self.file.write(data)
+        self.file.flush()
+        self.fileBytes += len(data)
+
+    def _openFile(self):
+        self._closeFile()
+        path = os.path.join(self.directory, f"meas_{self.serial}_{timeHelper.getTimestamp()}.bin")
+        self.file = open(path, "wb")
+        writeHeader(self.file, self.serial)
+        self.fileBytes = self.file.tell()
+        self.fileStart = time.time()
+        logging.info(f"Recording measurements to: {path}")
+
+    def _closeFile(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
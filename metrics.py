@@ -0,0 +1,133 @@
+import threading
+import time
+import numpy as np
+
+class RollingHistogram():
+    """
+        Poslednich size vzorku v predalokovanem poli, percentily se pocitaji az pri cteni
+    """
+    def __init__(self, size=1024):
+        self.values = np.zeros(size, dtype=np.float64)
+        self.index = 0
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def add(self, value):
+        with self.lock:
+            self.values[self.index] = value
+            self.index = (self.index + 1) % self.values.shape[0]
+            self.count += 1
+
+    def snapshot(self):
+        with self.lock:
+            n = min(self.count, self.values.shape[0])
+            values = self.values[:n].copy()
+            count = self.count
+        if n == 0:
+            return {"count" : count, "p50" : 0.0, "p95" : 0.0, "p99" : 0.0, "mean" : 0.0, "max" : 0.0}
+        (p50, p95, p99) = np.percentile(values, (50, 95, 99))
+        return {
+            "count" : count,
+            "p50" : float(p50),
+            "p95" : float(p95),
+            "p99" : float(p99),
+            "mean" : float(values.mean()),
+            "max" : float(values.max()),
+        }
+
+class Metrics():
+    """
+        Casy jednotlivych kroku zpracovani v ms
+        Kazda kamera (CameraPipeline) ma vlastni Metrics s labels = {"serial" : ...}
+        Pouziti:
+            t = time.perf_counter()
+            ... krok ...
+            t = metrics.since("krok", t)
+    """
+    def __init__(self, size=1024, labels=None):
+        self.size = size
+        self.histograms = {}
+        self.lock = threading.Lock()
+        self.startTime = time.time()
+        # labels pro textovy format, napr. {"serial" : "..."}
+        self.labels = labels if labels is not None else {}
+
+    def _get(self, name):
+        hist = self.histograms.get(name)
+        if hist is None:
+            with self.lock:
+                hist = self.histograms.setdefault(name, RollingHistogram(self.size))
+        return hist
+
+    def add(self, name, ms):
+        self._get(name).add(ms)
+
+    def addAll(self, samples):
+        """
+            Zapise casy (jmeno, ms) namerene jinde, napr. StageTimes z worker procesu
+        """
+        for (name, ms) in samples:
+            self._get(name).add(ms)
+
+    def since(self, name, start):
+        """
+            Zapise cas od start (time.perf_counter) a vrati aktualni cas pro dalsi krok
+        """
+        now = time.perf_counter()
+        self._get(name).add((now - start) * 1000)
+        return now
+
+    def snapshot(self):
+        with self.lock:
+            names = sorted(self.histograms)
+        return {name : self.histograms[name].snapshot() for name in names}
+
+    def textLines(self):
+        """
+            Radky vsech kroku v textovem formatu Prometheus vcetne labels
+        """
+        labels = "".join(f'{key}="{value}",' for (key, value) in self.labels.items())
+        lines = []
+        for name, s in self.snapshot().items():
+            for q in ("50", "95", "99"):
+                lines.append(f'camera_stage_ms{{{labels}stage="{name}",quantile="0.{q}"}} {s["p" + q]:.3f}')
+            lines.append(f'camera_stage_ms_count{{{labels}stage="{name}"}} {s["count"]}')
+            lines.append(f'camera_stage_ms_max{{{labels}stage="{name}"}} {s["max"]:.3f}')
+        return lines
+
+    def toText(self):
+        """
+            Prosty textovy format (kompatibilni s Prometheus)
+        """
+        return metricsText([self], self.startTime)
+
+class StageTimes():
+    """
+        Casy kroku jednoho snimku (stejne since/add jako Metrics) pro zpracovani v jinem procesu
+        samples = [(jmeno, ms)] se vrati s vysledkem a zapisou pres Metrics.addAll
+    """
+    def __init__(self):
+        self.samples = []
+
+    def add(self, name, ms):
+        self.samples.append((name, ms))
+
+    def since(self, name, start):
+        now = time.perf_counter()
+        self.samples.append((name, (now - start) * 1000))
+        return now
+
+def metricsText(registries, startTime):
+    """
+        Textovy format Prometheus pro vice Metrics (kamer) odlisenych labels
+    """
+    lines = [
+        "# TYPE camera_stage_ms summary",
+        f"camera_uptime_seconds {time.time() - startTime:.0f}",
+    ]
+    for metrics in registries:
+        lines.extend(metrics.textLines())
+    return "\n".join(lines) + "\n"
+
+# vychozi registr procesu (benchmark, zpracovani mimo CameraPipeline)
+METRICS = Metrics()
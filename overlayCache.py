@@ -0,0 +1,45 @@
+import threading
+import cv2
+import numpy as np
+from collections import OrderedDict
+
+class OverlayCache():
+    """
+        Cache predkreslenych vrstev (obraz + maska) podle parametru ze kterych se kresli
+        Pri zmene kteregokoli parametru vznikne novy klic = automaticka invalidace
+    """
+    def __init__(self, maxItems=8):
+        self.maxItems = maxItems
+        self.lock = threading.Lock()
+        self.items = OrderedDict()
+
+    def get(self, key, renderFunc):
+        """
+            Vrati (layer, mask) pro key, pripadne je vytvori z renderFunc() -> layer
+            Vrstvy jsou sdilene, nesmi se menit
+        """
+        with self.lock:
+            if key in self.items:
+                self.items.move_to_end(key)
+                return self.items[key]
+
+        layer = renderFunc()
+        mask = (np.any(layer != 0, axis=2) if layer.ndim == 3 else layer != 0).astype(np.uint8)
+        layer.setflags(write=False)
+        mask.setflags(write=False)
+
+        with self.lock:
+            self.items[key] = (layer, mask)
+            while len(self.items) > self.maxItems:
+                self.items.popitem(last=False)
+        return layer, mask
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
+
+def composite(target, layer, mask):
+    """
+        Prenese vrstvu do target jednim maskovanym kopirovanim
+    """
+    cv2.copyTo(layer, mask, target)
@@ -0,0 +1,54 @@
+import cv2
+import numpy as np
+
+# Barevne palety pro zobrazeni sedeho obrazu
+# Vystup zavisi jen na 8bit hodnote sede, proto se paleta spocita jednou (256 BGR barev)
+# a na obraz se aplikuje jednim pruchodem LUT
+
+def _palette_default(gray):
+    # puvodni vypocet pres HSV - hue podle intenzity, value odmocnina intenzity
+    hsv = np.full((gray.shape[0], gray.shape[1], 3), 255, "uint16")
+    hsv[:,:,0] = ((255-gray.astype("uint16"))*160/256+150)%180
+    hsv[:,:,2] = np.sqrt(gray.astype("uint16"))*16
+    return cv2.cvtColor(hsv.astype("uint8"), cv2.COLOR_HSV2BGR)
+
+def _palette_gray(gray):
+    return cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
+
+def _palette_colormap(colormap):
+    return lambda gray: cv2.applyColorMap(gray, colormap)
+
+PALETTES = {
+    "default" : _palette_default,
+    "gray" : _palette_gray,
+    "jet" : _palette_colormap(cv2.COLORMAP_JET),
+    "inferno" : _palette_colormap(cv2.COLORMAP_INFERNO),
+    "viridis" : _palette_colormap(cv2.COLORMAP_VIRIDIS),
+}
+if hasattr(cv2, "COLORMAP_TURBO"):
+    PALETTES["turbo"] = _palette_colormap(cv2.COLORMAP_TURBO)
+
+_luts = {}
+
+def get_palette_lut(name):
+    """
+        Tabulka 256x1 BGR pro cv2.applyColorMap, pocitana jednou pro kazdou paletu
+    """
+    lut = _luts.get(name)
+    if lut is None:
+        if name not in PALETTES:
+            raise Exception(f"Unknown palette: {name}")
+        # kazda hodnota jako cely radek - cvtColor pak pocita stejnou (SIMD) cestou jako pro velky obraz
+        gray = np.repeat(np.arange(256, dtype=np.uint8), 64).reshape(256, 64)
+        lut = np.ascontiguousarray(PALETTES[name](gray)[:, :1, :])
+        _luts[name] = lut
+    return lut
+
+def apply_palette(gray, name="default"):
+    """
+        Sedy obraz -> BGR obraz v dane palete
+        Vice nez 8bit obraz se zobrazi v rozsahu datoveho typu
+    """
+    if gray.dtype != np.uint8:
+        gray = cv2.convertScaleAbs(gray, alpha=255.0 / np.iinfo(gray.dtype).max)
+    return cv2.applyColorMap(gray, get_palette_lut(name))
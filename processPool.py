@@ -0,0 +1,261 @@
+"""
+    Zpracovani snimku v procesech (PROCESSING.EXECUTION.MODE = "process")
+
+    Snimek se z ringu kamery zkopiruje do sdilene pameti (SharedSlot), worker proces z ni primo
+    spocita CameraImg a vrati jen mereni a zakodovane obrazy streamu - server proces (Flask,
+    Socket.IO) tak nedeli GIL se zpracovanim.
+    V behu je nejvyse tolik snimku kolik je workeru, dalsi se bere vzdy nejnovejsi snimek
+    (zastarale se zahodi), vysledky se predavaji ve stejnem poradi jako snimky.
+"""
+import concurrent.futures
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+from collections import OrderedDict
+from multiprocessing import shared_memory
+import numpy as np
+
+from cameraImg import CameraImg
+from encodeCache import fitImage
+from encoders import Encoding, STREAM_KINDS
+from metrics import StageTimes
+from processingWorker import ProcessingWorker, ProcessedFrame
+
+# --- worker proces ---
+
+# nastaveni zpracovani (nastaveno v _initWorker)
+_settings = None
+# pripojene sdilene pameti podle jmena
+_attached = OrderedDict()
+
+def _initWorker(settings):
+    global _settings
+    _settings = settings
+
+def _ping():
+    return True
+
+def _attach(name):
+    shm = _attached.get(name)
+    if shm is not None:
+        _attached.move_to_end(name)
+        return shm
+    # pamet vlastni (a maze) server proces, spawn worker sdili jeho resource tracker
+    shm = shared_memory.SharedMemory(name=name)
+    _attached[name] = shm
+    # sloty se pri zmene rozmeru snimku vytvari znovu - stare odpojit
+    while len(_attached) > 2 * _settings["slots"]:
+        (oldName, oldShm) = _attached.popitem(last=False)
+        oldShm.close()
+    return shm
+
+def processFrame(name, shape, dtype, tracker, streams, profiles, surfaceSizes):
+    """
+        Zpracuje snimek ze sdilene pameti name, zakoduje jen odebirane streamy
+        streams = {stream : mnozina variant (size, quality)} - kazda varianta se zmensi a zakoduje jednou
+        profiles = odebira nekdo PROFILE_DATA (jinak profileData = None)
+        Vrati dict: measData, profileData, surfaceData, encoded = {(stream, size, quality) : zakodovany obraz},
+        tracker = stav po zpracovani, processMs = cas zpracovani v ms, stages = casy kroku pro Metrics kamery
+    """
+    t = time.perf_counter()
+    stages = StageTimes()
+    image = np.ndarray(shape, dtype=np.dtype(dtype), buffer=_attach(name).buf)
+    cameraImg = CameraImg(
+        image,
+        _settings["pixelSize"],
+        _settings["processing"]["THRESHOLD_PERC"],
+        _settings["maxWidth"],
+        _settings["maxHeight"],
+        tracker=tracker,
+        profile_band=_settings["processing"]["PROFILE_BAND"],
+        smoothing=_settings["processing"]["SMOOTHING"]["TYPE"],
+        smoothing_kernel=_settings["processing"]["SMOOTHING"]["KERNEL"],
+        moments_iterations=_settings["processing"]["MOMENTS"]["ROI_ITERATIONS"],
+        moments_roi_factor=_settings["processing"]["MOMENTS"]["ROI_FACTOR"],
+        palette=_settings["palette"],
+        render=len(streams) > 0,
+        render_cuts=any(kind != "main" for kind in streams),
+        display_data=profiles or len(surfaceSizes) > 0,
+        metrics=stages
+    )
+    del image
+    encoded = {}
+    for (kind, variants) in streams.items():
+        img = cameraImg.img_dst if kind == "main" else getattr(cameraImg, kind)
+        if img is None:
+            continue
+        # zmenseny obraz sdileny variantami stejne velikosti
+        scaled = {None : img}
+        for (size, quality) in variants:
+            te = time.perf_counter()
+            if size not in scaled:
+                scaled[size] = fitImage(img, *size)
+                te = stages.since("scale:" + kind, te)
+            encoding = _settings["encodings"][kind].withQuality(quality)
+            encoded[(kind, size, quality)] = encoding.encode(scaled[size])
+            stages.since("encode:" + kind, te)
+    return {
+        "measData" : cameraImg.get_calculated_data(),
+        "profileData" : cameraImg.get_profile_data() if profiles else None,
+        "surfaceData" : {size : cameraImg.get_surface_data(size) for size in surfaceSizes},
+        "encoded" : encoded,
+        "tracker" : tracker,
+        "processMs" : (time.perf_counter() - t) * 1000,
+        "stages" : stages.samples,
+    }
+
+# --- server proces ---
+
+class SharedSlot():
+    """
+        Sdilena pamet pro jeden snimek, pri vetsim snimku se vytvori znovu
+    """
+    def __init__(self):
+        self.shm = None
+
+    def write(self, image):
+        """
+            Zkopiruje image do sdilene pameti, vrati (jmeno, shape, dtype) pro worker
+        """
+        if self.shm is None or self.shm.size < image.nbytes:
+            self.close()
+            self.shm = shared_memory.SharedMemory(create=True, size=image.nbytes)
+        dst = np.ndarray(image.shape, dtype=image.dtype, buffer=self.shm.buf)
+        np.copyto(dst, image)
+        del dst
+        return self.shm.name, image.shape, image.dtype.str
+
+    def close(self):
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+class ProcessPoolWorker(ProcessingWorker):
+    """
+        Stejne rozhrani jako ProcessingWorker, CameraImg se pocita v pool procesu
+        Thread _processingWork posila snimky do poolu, thread _collectingWork prebira vysledky v poradi
+    """
+    def __init__(self, camera, config, recorder=None):
+        super().__init__(camera, config, recorder)
+        self.workers = config["PROCESSING"]["EXECUTION"]["WORKERS"]
+        self.pool = None
+        self.slots = []
+        self.freeSlots = queue.Queue()
+        # odeslane snimky v poradi: (future, slot, seq, frameTimestamp)
+        self.pending = queue.Queue()
+        self.collectThread = None
+
+    def start(self, pixelSize):
+        if self.isRunning():
+            self.stop()
+
+        settings = {
+            "pixelSize" : pixelSize,
+            "processing" : self.config["PROCESSING"],
+            "maxWidth" : self.config["IMAGE_MAX_W"],
+            "maxHeight" : self.config["IMAGE_MAX_H"],
+            "palette" : self.config["PALETTE"],
+            "encodings" : {kind : Encoding.fromConfig(self.config, kind) for kind in STREAM_KINDS},
+            "slots" : self.workers,
+        }
+        # spawn - worker nededi thready a zamky serveru
+        self.pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initWorker,
+            initargs=(settings,)
+        )
+        # nastartovat procesy hned, ne az s prvnim snimkem
+        for i in range(self.workers):
+            self.pool.submit(_ping)
+
+        self.slots = [SharedSlot() for i in range(self.workers)]
+        self.freeSlots = queue.Queue()
+        for slot in self.slots:
+            self.freeSlots.put(slot)
+        self.pending = queue.Queue()
+
+        super().start(pixelSize)
+        self.collectThread = threading.Thread(target=self._collectingWork, name="processCollect")
+        self.collectThread.daemon = True
+        self.collectThread.start()
+        logging.info(f"Processing in {self.workers} processes")
+
+    def stop(self):
+        # nejdriv zastavit odesilani a prebirani vysledku - po resetu v ProcessingWorker.stop
+        # uz nesmi byt zverejnen zadny rozpracovany snimek
+        self.stoppedEvent.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        if self.collectThread is not None:
+            self.collectThread.join()
+            self.collectThread = None
+        if self.pool is not None:
+            self.pool.shutdown(wait=True, cancel_futures=True)
+            self.pool = None
+        super().stop()
+        for slot in self.slots:
+            slot.close()
+        self.slots = []
+
+    def _processingWork(self):
+        lastSeq = 0
+        while not self.stoppedEvent.is_set():
+            # az je volny worker, vezme se nejnovejsi snimek - starsi se preskoci
+            try:
+                slot = self.freeSlots.get(timeout=self.WAIT_TIMEOUT)
+            except queue.Empty:
+                continue
+            frame = self.camera.acquireImage(lastSeq, self.WAIT_TIMEOUT)
+            if frame is None:
+                self.freeSlots.put(slot)
+                continue
+            lastSeq = frame.seq
+
+            try:
+                t = self.metrics.since("queue", frame.timestamp)
+                with frame:
+                    # kalibrace a prumerovani v tomto threadu - prumer zavisi na poradi snimku
+                    image = self._prepareImage(frame.image)
+                    t = time.perf_counter()
+                    (name, shape, dtype) = slot.write(image)
+                self.metrics.since("copy", t)
+                if frame.overwritten:
+                    logging.warning(f"Frame {frame.seq} overwritten during copy, frame dropped")
+                    self.resetAveraging()
+                    self.freeSlots.put(slot)
+                    continue
+                # tracker ze stavu po poslednim prevzatem vysledku
+                future = self.pool.submit(processFrame, name, shape, dtype, self.tracker, self.getStreams(), self.isSendingProfiles(), self.getSurfaceSizes())
+                self.pending.put((future, slot, frame.seq, frame.timestamp))
+            except Exception as e:
+                logging.exception("Exception during sending frame to processing")
+                self.freeSlots.put(slot)
+
+    def _collectingWork(self):
+        while not self.stoppedEvent.is_set():
+            try:
+                (future, slot, seq, frameTimestamp) = self.pending.get(timeout=self.WAIT_TIMEOUT)
+            except queue.Empty:
+                continue
+            try:
+                res = future.result()
+            except Exception as e:
+                if not self.stoppedEvent.is_set():
+                    logging.exception("Exception during processing image")
+                continue
+            finally:
+                self.freeSlots.put(slot)
+
+            if self.stoppedEvent.is_set():
+                break
+            self.metrics.addAll(res["stages"])
+            self.metrics.add("process", res["processMs"])
+            if self.tracker is not None:
+                self.tracker = res["tracker"]
+            self._publish(ProcessedFrame(seq, time.time(), None, frameTimestamp,
+                res["measData"], res["encoded"], res["profileData"], res["surfaceData"]))
@@ -0,0 +1,287 @@
+import logging
+import threading
+import time
+import cv2
+import numpy as np
+
+from cameraImg import CameraImg
+from encoders import STREAM_KINDS
+from beamTracker import BeamTracker
+from frameAveraging import FrameAverager
+from metrics import METRICS
+from measurementHistory import MeasurementHistory
+
+class ProcessedFrame():
+    """
+        Vysledek zpracovani jednoho snimku - sdileny vsemi odberateli,
+        nesmi se po vytvoreni menit
+    """
+    def __init__(self, seq, timestamp, image : CameraImg, frameTimestamp=None, measData=None, encoded=None, profileData=None, surfaceData=None):
+        self.seq = seq
+        self.timestamp = timestamp
+        # cas prichodu snimku z kamery (time.perf_counter) pro mereni latence
+        self.frameTimestamp = frameTimestamp
+        # pri zpracovani v procesech (processPool) neni CameraImg, jen mereni a zakodovane obrazy
+        self.image = image
+        self.measData = image.get_calculated_data() if measData is None else measData
+        # profily rezu pro PROFILE_DATA, None pokud je nikdo neodebiral
+        self.profileData = profileData
+        # mrizky pro 3D graf (SURFACE_DATA): velikost -> CameraImg.get_surface_data, jen odebirane velikosti
+        self.surfaceData = surfaceData if surfaceData is not None else {}
+        # (stream, velikost, kvalita) -> zakodovany obraz (bytes), varianty odebirane klienty streamu
+        self.encoded = encoded
+        # poradi zverejneni (nastavi ProcessingWorker._publish), podle nej se pocitaji vynechane vysledky
+        self.index = 0
+        # obrazy dekodovane z encoded (jen kdyz klient chce jinou velikost/kvalitu)
+        self.decoded = {}
+        self.decodeLock = threading.Lock()
+
+    def getImage(self, kind):
+        """
+            Obraz pro stream kind ("main", "cut_horizontal", "cut_vertical")
+            Pokud je jen zakodovany, dekoduje se jednou pro vsechny klienty
+        """
+        if self.image is not None:
+            return self.image.img_dst if kind == "main" else getattr(self.image, kind)
+        encoded = self.getEncoded(kind)
+        if encoded is None:
+            return None
+        with self.decodeLock:
+            if kind not in self.decoded:
+                self.decoded[kind] = cv2.imdecode(np.frombuffer(encoded, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+            return self.decoded[kind]
+
+    def hasImage(self, kind, size=None, quality=None):
+        """
+            Obraz a rezy (cut_*) se renderuji jen pokud je pripojeny klient jejich streamu,
+            v procesech se koduje jen varianta (size, quality) pripojenych klientu
+        """
+        if self.image is not None:
+            return (self.image.img_dst if kind == "main" else getattr(self.image, kind)) is not None
+        return self.getEncoded(kind, size, quality) is not None
+
+    def getEncoded(self, kind, size=None, quality=None):
+        """
+            Obraz zakodovany pri zpracovani, size = (maxWidth, maxHeight), quality = ?q= klienta
+            None pokud varianta nebyla zakodovana
+        """
+        return self.encoded.get((kind, size, quality)) if self.encoded is not None else None
+
+class ProcessingWorker():
+    """
+        Jeden zpracovavaci thread na kameru
+        Kazdy novy snimek (podle seq z kamery) zpracuje prave jednou do ProcessedFrame
+        a ten rozesle vsem odberatelum (streamy, MEAS_DATA)
+        Mereni kazdeho zpracovaneho snimku se uklada do history
+    """
+    WAIT_TIMEOUT = 1.0
+
+    def __init__(self, camera, config, recorder=None):
+        self.camera = camera
+        self.config = config
+        # volitelny trvaly zapis vsech mereni (MeasurementRecorder)
+        self.recorder = recorder
+        self.pixelSize = None
+
+        # volitelne mereni jen v okoli posledniho centroidu
+        trackingConfig = self.config["PROCESSING"]["TRACKING"]
+        self.tracker = None
+        if trackingConfig["ENABLED"]:
+            self.tracker = BeamTracker(trackingConfig["WINDOW_FACTOR"], trackingConfig["MIN_WINDOW"])
+
+        # volitelne casove prumerovani snimku pred zpracovanim
+        self.averager = FrameAverager.fromConfig(self.config["PROCESSING"]["AVERAGING"])
+        # dark/flat kalibrace snimku (FrameCalibration, nastavi CameraPipeline)
+        self.calibration = None
+        # casy kroku zpracovani (Metrics kamery, nastavi CameraPipeline)
+        self.metrics = METRICS
+
+        self.thread = None
+        self.stoppedEvent = threading.Event()
+
+        # posledni vysledek + notifikace odberatelu
+        self.resultCondition = threading.Condition()
+        self.result : ProcessedFrame = None
+        # pocet zverejnenych vysledku
+        self.published = 0
+
+        # historie mereni pro grafy trendu
+        self.history = MeasurementHistory(self.config["MEAS_HISTORY_SIZE"])
+
+        # pocet pripojenych klientu jednotlivych streamu podle varianty (size, quality) - rezy bez klientu
+        # se nerenderuji (profily jdou pres PROFILE_DATA), v procesech se koduji jen varianty s klienty
+        self.streamClients = {kind : {} for kind in STREAM_KINDS}
+        self.streamClientsLock = threading.Lock()
+
+        # velikosti mrizky SURFACE_DATA, ktere nekdo odebira: funkce () -> mnozina (nastavi CameraPipeline)
+        self.surfaceSizesFunc = None
+        # odebira nekdo PROFILE_DATA: funkce () -> bool (nastavi CameraPipeline)
+        self.profilesFunc = None
+
+    def getSurfaceSizes(self):
+        return self.surfaceSizesFunc() if self.surfaceSizesFunc is not None else set()
+
+    def isSendingProfiles(self):
+        return self.profilesFunc() if self.profilesFunc is not None else True
+
+    def addStreamClient(self, kind, delta=1, variant=(None, None)):
+        """
+            variant = (size, quality) pozadovane klientem (StreamParams), None = vychozi hodnota streamu
+        """
+        with self.streamClientsLock:
+            clients = self.streamClients[kind]
+            clients[variant] = clients.get(variant, 0) + delta
+            if clients[variant] <= 0:
+                del clients[variant]
+
+    def getStreams(self):
+        """
+            Streamy ktere nekdo odebira: stream -> mnozina variant (size, quality)
+        """
+        with self.streamClientsLock:
+            return {kind : set(clients) for (kind, clients) in self.streamClients.items() if len(clients) > 0}
+
+    def isRenderingCuts(self):
+        return any(kind != "main" for kind in self.getStreams())
+
+    def resetAveraging(self):
+        """
+            Zahodi casovy prumer snimku (zmena expozice, gainu, ...)
+        """
+        if self.averager is not None:
+            self.averager.reset()
+
+    def _prepareImage(self, image):
+        """
+            Snimek pro zpracovani: kalibrace (dark/flat) a casovy prumer
+            S kalibraci nebo prumerovanim vraci vlastni buffer (platny do dalsiho volani)
+        """
+        if self.calibration is not None and self.calibration.isActive():
+            t = time.perf_counter()
+            image = self.calibration.apply(image)
+            self.metrics.since("calibrate", t)
+        if self.averager is not None:
+            t = time.perf_counter()
+            image = self.averager.add(image)
+            self.metrics.since("average", t)
+        return image
+
+    def isRunning(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self, pixelSize):
+        if self.isRunning():
+            self.stop()
+
+        self.pixelSize = pixelSize
+        self.history.clear()
+        self.published = 0
+        if self.tracker is not None:
+            self.tracker.reset()
+        self.resetAveraging()
+        self.stoppedEvent.clear()
+        self.thread = threading.Thread(target=self._processingWork, name="processing")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        self.stoppedEvent.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+        with self.resultCondition:
+            self.result = None
+            self.resultCondition.notify_all()
+
+    def getResult(self):
+        return self.result
+
+    def waitForResult(self, lastSeq, timeout=None):
+        """
+            Ceka na vysledek novejsi nez lastSeq
+            Vrati None pokud do timeoutu nic noveho neprislo
+        """
+        with self.resultCondition:
+            self.resultCondition.wait_for(lambda: self.result is not None and self.result.seq > lastSeq, timeout)
+            if self.result is not None and self.result.seq > lastSeq:
+                return self.result
+            return None
+
+    def subscribe(self):
+        """
+            Generator novych vysledku pro jednoho odberatele
+            Pomaly odberatel dostane vzdy jen posledni vysledek, mezilehle preskoci
+            Konci po zastaveni zpracovani
+        """
+        lastSeq = 0
+        while not self.stoppedEvent.is_set():
+            result = self.waitForResult(lastSeq, self.WAIT_TIMEOUT)
+            if result is None:
+                continue
+            lastSeq = result.seq
+            yield result
+
+    def _processingWork(self):
+        lastSeq = 0
+        while not self.stoppedEvent.is_set():
+            # spi dokud kamera nema novy snimek - stejny snimek se nezpracovava znovu
+            # snimek je pujceny z ringu kamery bez kopie, CameraImg ho jen cte
+            frame = self.camera.acquireImage(lastSeq, self.WAIT_TIMEOUT)
+            if frame is None:
+                continue
+            lastSeq = frame.seq
+
+            try:
+                t = self.metrics.since("queue", frame.timestamp)
+                # obraz zobrazeni a profily jen pokud je nekdo odebira
+                streams = self.getStreams()
+                profiles = self.isSendingProfiles()
+                surfaceSizes = self.getSurfaceSizes()
+                with frame:
+                    cameraImg = CameraImg(
+                        self._prepareImage(frame.image),
+                        self.pixelSize,
+                        self.config["PROCESSING"]["THRESHOLD_PERC"],
+                        self.config['IMAGE_MAX_W'],
+                        self.config['IMAGE_MAX_H'],
+                        tracker=self.tracker,
+                        profile_band=self.config["PROCESSING"]["PROFILE_BAND"],
+                        smoothing=self.config["PROCESSING"]["SMOOTHING"]["TYPE"],
+                        smoothing_kernel=self.config["PROCESSING"]["SMOOTHING"]["KERNEL"],
+                        moments_iterations=self.config["PROCESSING"]["MOMENTS"]["ROI_ITERATIONS"],
+                        moments_roi_factor=self.config["PROCESSING"]["MOMENTS"]["ROI_FACTOR"],
+                        palette=self.config["PALETTE"],
+                        render=len(streams) > 0,
+                        render_cuts=self.isRenderingCuts(),
+                        display_data=profiles or len(surfaceSizes) > 0,
+                        metrics=self.metrics
+                    )
+                profileData = cameraImg.get_profile_data() if profiles else None
+                surfaceData = {size : cameraImg.get_surface_data(size) for size in surfaceSizes}
+                self.metrics.since("process", t)
+                if frame.overwritten:
+                    logging.warning(f"Frame {frame.seq} overwritten during processing, result dropped")
+                    # prumer muze obsahovat poskozeny snimek
+                    self.resetAveraging()
+                    continue
+                result = ProcessedFrame(frame.seq, time.time(), cameraImg, frame.timestamp, profileData=profileData, surfaceData=surfaceData)
+            except Exception as e:
+                logging.exception("Exception during processing image")
+                continue
+
+            self._publish(result)
+
+    def _publish(self, result : ProcessedFrame):
+        """
+            Zapise vysledek do historie a zaznamu a preda ho odberatelum
+        """
+        self.history.add(result.seq, result.timestamp, result.measData)
+        if self.recorder is not None:
+            self.recorder.add(result.seq, result.timestamp, result.measData)
+
+        with self.resultCondition:
+            self.published += 1
+            result.index = self.published
+            self.result = result
+            self.resultCondition.notify_all()
@@ -1,14 +1,17 @@
-from flask import Flask, render_template, Response
+from flask import Flask, render_template, Response, request
 from flask_socketio import SocketIO
 from engineio.async_drivers import threading #kvuli pyinstalleru
 
 import hjson
 import logging
+import multiprocessing
 import os
 import sys
 from logs import ConfigureLogging
 from app import App
 from harvesterWrapper import HarvesterWrapper
+from simulatedCamera import SimulatedCamera
+from streamClients import StreamParams, limitSendBuffer
 
 config = None
 configCamera = None
@@ -17,10 +20,6 @@ with open("config.hjson", "r") as f:
 with open("cameraConfig.hjson", "r") as f:
     configCamera = hjson.load(f)
 
-ConfigureLogging(config["LOG_LEVEL"])
-
-cam = HarvesterWrapper(configCamera)
-
 # nastartovat flask app se socket io
 # static folder pres cwd jinak nefunguje zapakovane do exe
 flaskApp = Flask(__name__, static_folder=os.getcwd() + "/www/public", static_url_path="")
@@ -30,36 +29,86 @@ flaskApp.config['SECRET_KEY'] = 'manufacturingCameraReader'
 #aby fungovaly v socket io websockety, musi byt nainstalovane simple-websocket
 socketio = SocketIO(flaskApp, ping_timeout=60, logger=True, async_mode="threading") 
 
-app = App(socketio, config, cam)
+# vytvari se v init() - pri PROCESSING.EXECUTION.MODE = "process" se server.py importuje i ve worker procesech
+app = None
 
 # zpracovani web requestu
 @flaskApp.route('/', methods = ['GET', 'POST'])
 def index():
     return flaskApp.send_static_file("index.html")
 
+def streamResponse(kind, serial):
+    # ?fps=&w=&h=&q= omezeni frekvence, velikosti a kvality streamu pro klienta (viz StreamParams)
+    try:
+        params = StreamParams.fromArgs(request.args)
+    except Exception as e:
+        return Response(str(e), status=400, mimetype="text/plain")
+    # socket predava werkzeug server (socketio.run v threading mode)
+    limitSendBuffer(request.environ.get("werkzeug.socket"), config["STREAM_SEND_BUFFER_KB"])
+    return Response(app.getStream(kind, serial, params, request.remote_addr), mimetype="multipart/x-mixed-replace; boundary=frame")
+
+# streamy bez serial = prvni spustena kamera, /<serial>/... = konkretni kamera
 @flaskApp.route('/main')
-def main():
-    return Response(app.getImage(), mimetype="multipart/x-mixed-replace; boundary=frame")
+@flaskApp.route('/<serial>/main')
+def main(serial=None):
+    return streamResponse("main", serial)
 
 @flaskApp.route('/cut_vertical')
-def cutve_rtical():
-    return Response(app.getCutImage("vertical"), mimetype="multipart/x-mixed-replace; boundary=frame")
+@flaskApp.route('/<serial>/cut_vertical')
+def cutve_rtical(serial=None):
+    return streamResponse("cut_vertical", serial)
 
 @flaskApp.route('/cut_horizontal')
-def cut_horizontal():
-    return Response(app.getCutImage("horizontal"), mimetype="multipart/x-mixed-replace; boundary=frame")
+@flaskApp.route('/<serial>/cut_horizontal')
+def cut_horizontal(serial=None):
+    return streamResponse("cut_horizontal", serial)
+
+@flaskApp.route('/metrics')
+def metrics():
+    return Response(app.getMetricsText(), mimetype="text/plain")
 
 @socketio.on_error_default
 def handlerError(e):
     socketio.emit("SOCKET_IO_ERROR", str(e))
 
-socketio.on_event("GET_CONFIG",  app.getConfig)
-socketio.on_event("GET_DEVICES",  app.getDevices)
-socketio.on_event("GET_INIT_STATE",  app.getInitState)
-socketio.on_event("START_CAPTURE",  app.startCapture)
-socketio.on_event("STOP_CAPTURE",  app.stopCapture)
-socketio.on_event("UPDATE_NODE",  app.updateNode)
-socketio.on_event("GET_MEAS_DATA",  app.getMeasuringData)
+def init():
+    """
+        Kamera, App a socket io eventy - jen v hlavnim procesu
+    """
+    global app
+    ConfigureLogging(config["LOG_LEVEL"])
+
+    # simulovana kamera pro vyvoj a zatezove testy bez HW
+    if configCamera["SIMULATION"]["ENABLED"] or "--simulate" in sys.argv:
+        cam = SimulatedCamera(configCamera)
+    else:
+        cam = HarvesterWrapper(configCamera)
+
+    app = App(socketio, config, cam)
+
+    socketio.on_event("GET_CONFIG",  app.getConfig)
+    socketio.on_event("GET_DEVICES",  app.getDevices)
+    socketio.on_event("GET_INIT_STATE",  app.getInitState)
+    socketio.on_event("START_CAPTURE",  app.startCapture)
+    socketio.on_event("STOP_CAPTURE",  app.stopCapture)
+    socketio.on_event("UPDATE_NODE",  app.updateNode)
+    socketio.on_event("GET_MEAS_DATA",  app.getMeasuringData)
+    socketio.on_event("SUBSCRIBE_MEAS_DATA",  app.subscribeMeasData)
+    socketio.on_event("UNSUBSCRIBE_MEAS_DATA",  app.unsubscribeMeasData)
+    socketio.on_event("SUBSCRIBE_PROFILES",  app.subscribeProfiles)
+    socketio.on_event("UNSUBSCRIBE_PROFILES",  app.unsubscribeProfiles)
+    socketio.on_event("SUBSCRIBE_SURFACE",  app.subscribeSurface)
+    socketio.on_event("UNSUBSCRIBE_SURFACE",  app.unsubscribeSurface)
+    socketio.on_event("GET_MEAS_HISTORY",  app.getMeasuringHistory)
+    socketio.on_event("GET_RECORDED_DATA",  app.getRecordedData)
+    socketio.on_event("START_FRAME_RECORDING",  app.startFrameRecording)
+    socketio.on_event("STOP_FRAME_RECORDING",  app.stopFrameRecording)
+    socketio.on_event("CAPTURE_DARK_FRAME",  app.captureDarkFrame)
+    socketio.on_event("CAPTURE_FLAT_FIELD",  app.captureFlatField)
+    socketio.on_event("CLEAR_CALIBRATION",  app.clearCalibration)
+    socketio.on_event("GET_CALIBRATION",  app.getCalibration)
+    socketio.on_event("GET_METRICS",  app.getMetrics)
+    socketio.on_event("GET_STREAM_CLIENTS",  app.getStreamClients)
 
 
 @socketio.on('connect')
@@ -69,8 +118,12 @@ def test_connect(auth):
 @socketio.on('disconnect')
 def test_disconnect():
     logging.info("Disonnected")
+    app.clientDisconnected(request.sid)
 
 
 if __name__ == '__main__':
+    # zapakovane do exe - worker procesy spousti stejny exe
+    multiprocessing.freeze_support()
+    init()
     print(f"Starting: http://{config['HOST']}:{config['PORT']}")
     socketio.run(flaskApp, config['HOST'], config['PORT'])
\ No newline at end of file
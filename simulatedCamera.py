@@ -0,0 +1,287 @@
+import glob
+import logging
+import os
+import threading
+import time
+import cv2
+import numpy as np
+from pyee.asyncio import AsyncIOEventEmitter
+
+from harvesterWrapper import HarvesterWrapper
+from frameRing import FrameRing
+from frameRecorder import FrameRecording
+from syntheticBeam import beam_image
+
+# simulovane nodes ve stejnem tvaru jako HarvesterWrapper._harvestNodesToPython
+SIMULATED_NODES = {
+    "ExposureAuto" : {"display_name" : "Exposure Auto", "tooltip" : "Simulated", "type" : "select", "value" : "Off",
+        "options" : [{"display_name" : "Off", "value" : "Off"}, {"display_name" : "Continuous", "value" : "Continuous"}]},
+    "ExposureTime" : {"display_name" : "Exposure Time", "tooltip" : "Simulated", "type" : "number", "value" : 4000.0,
+        "min" : 10.0, "max" : 1000000.0, "unit" : "us"},
+    "GainAuto" : {"display_name" : "Gain Auto", "tooltip" : "Simulated", "type" : "select", "value" : "Off",
+        "options" : [{"display_name" : "Off", "value" : "Off"}, {"display_name" : "Continuous", "value" : "Continuous"}]},
+    "Gain" : {"display_name" : "Gain", "tooltip" : "Simulated", "type" : "number", "value" : 0.0,
+        "min" : 0.0, "max" : 24.0, "unit" : "dB"},
+    "AcquisitionFrameRate" : {"display_name" : "Acquisition Frame Rate", "tooltip" : "Simulated", "type" : "number", "value" : 100.0,
+        "min" : 1.0, "max" : 1000.0, "unit" : "Hz"},
+}
+
+# nodes ktere meni jas snimku - pri zmene se pregeneruji snimky
+BRIGHTNESS_NODES = ("ExposureTime", "Gain")
+# expozice pri ktere ma paprsek jas podle syntheticBeam
+REFERENCE_EXPOSURE = 4000.0
+
+BAYER_OFFSETS = {
+    # (radek, sloupec) pixelu R v mozaice 2x2
+    "BayerRG8" : (0, 0),
+    "BayerGR8" : (0, 1),
+    "BayerGB8" : (1, 0),
+    "BayerBG8" : (1, 1),
+}
+
+def toRawFormat(bgr, pixelFormat):
+    """
+        3 kanalovy BGR snimek -> raw data jak je posila kamera v pixelFormat
+        Vrati (data, num_components_per_pixel)
+    """
+    if pixelFormat in ("Mono8", "Mono10", "Mono12", "Mono16"):
+        return cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY).ravel(), 1
+    if pixelFormat in ("RGB8", "RGB16"):
+        return bgr[:, :, ::-1].ravel(), 3
+    if pixelFormat in ("BGR8", "BGR16"):
+        return np.ascontiguousarray(bgr).ravel(), 3
+    if pixelFormat in BAYER_OFFSETS:
+        (ry, rx) = BAYER_OFFSETS[pixelFormat]
+        raw = np.empty(bgr.shape[:2], bgr.dtype)
+        raw[:, :] = bgr[:, :, 1]
+        raw[ry::2, rx::2] = bgr[ry::2, rx::2, 2]
+        raw[1-ry::2, 1-rx::2] = bgr[1-ry::2, 1-rx::2, 0]
+        return raw.ravel(), 1
+    raise Exception(f"Simulated pixel format not supported: {pixelFormat}")
+
+class SimulatedCamera(HarvesterWrapper):
+    """
+        Kamera bez HW se stejnym rozhranim jako HarvesterWrapper
+        Snimky (umely paprsek, prehravane obrazky nebo zaznam FrameRecorder) jdou stejnou konverzi pixel formatu (_storeFrame)
+        Nastaveni v cameraConfig.hjson SIMULATION
+    """
+    def __init__(self, config):
+        AsyncIOEventEmitter.__init__(self)
+
+        self.config = config
+        self.simConfig = config["SIMULATION"]
+        self.ring = FrameRing(self.config["FRAME_RING_SIZE"])
+        self.grabStoppedEvent = threading.Event()
+        self.capturing = False
+
+        self.nodes = {name : dict(node) for name, node in SIMULATED_NODES.items()}
+        self.nodes["AcquisitionFrameRate"]["value"] = float(self.simConfig["FPS"])
+        self.nodesLock = threading.Lock()
+        self.framesDirty = True
+
+        logging.info(f"Simulated camera: {self.simConfig}")
+
+    def newDevice(self):
+        return SimulatedCamera(self.config)
+
+    def isCapturing(self):
+        return self.capturing
+
+    def getDevices(self):
+        return [{
+            "model" : self.simConfig["MODEL"],
+            "serial_number" : f"SIM{i:04d}",
+            "display_name" : f"Simulated camera {i}",
+            "access_status" : "READY",
+            "vendor" : "Simulation",
+        } for i in range(self.simConfig["DEVICES"])]
+
+    def updateNode(self, nodeName, value):
+        self._setNode(nodeName, value, throw=True)
+        return self.getUserConfigNodes()
+
+    def getUserConfigNodes(self):
+        userNodes = []
+        with self.nodesLock:
+            for prop in self.config["USER_NODES"]:
+                if prop not in self.nodes:
+                    logging.warning(f"Can not get node: {prop}")
+                    continue
+                node = dict(self.nodes[prop])
+                node["name"] = prop
+                userNodes.append(node)
+        return userNodes
+
+    def startGrab(self, deviceInfo, userConfig=None):
+        logging.info(f"StartGrab (simulated) deviceInfo={deviceInfo} userConfig={userConfig}")
+
+        self.grabStoppedEvent.clear()
+        for prop in self.config["DEFAULT_CONFIG"]:
+            self._setNode(prop, self.config["DEFAULT_CONFIG"][prop], throw=False)
+        # pro zatezove testy ma prednost FPS simulace pred DEFAULT_CONFIG
+        self._setNode("AcquisitionFrameRate", self.simConfig["FPS"])
+        if userConfig is not None:
+            for prop in userConfig:
+                self._setNode(prop, userConfig[prop], throw=False)
+
+        userNodes = self.getUserConfigNodes()
+
+        self.capturing = True
+        self.grabThread = threading.Thread(target=self._grabbingWork, name=f"simGrab_{deviceInfo.get('serial_number', '')}")
+        self.grabThread.daemon = True
+        self.grabThread.start()
+
+        return userNodes
+
+    def stopGrab(self):
+        self.grabStoppedEvent.set()
+        if self.grabThread is not None:
+            self.grabThread.join()
+        self.capturing = False
+
+        self.ring.clear()
+
+    def _setNode(self, propName, value, throw=False):
+        with self.nodesLock:
+            node = self.nodes.get(propName)
+            if node is None:
+                msg = f"Can not get node: {propName}"
+                logging.debug(msg)
+                if throw:
+                    raise Exception(msg)
+                return
+            if node["type"] == "number":
+                try:
+                    value = float(value)
+                except (TypeError, ValueError):
+                    msg = f"Can not set value: {value} to node: {propName}"
+                    logging.warning(msg)
+                    if throw:
+                        raise Exception(msg)
+                    return
+                value = min(max(value, node["min"]), node["max"])
+            node["value"] = value
+            if propName in BRIGHTNESS_NODES:
+                self.framesDirty = True
+
+    def _getNodeValue(self, propName):
+        with self.nodesLock:
+            return self.nodes[propName]["value"]
+
+    def _brightness(self):
+        return self._getNodeValue("ExposureTime") / REFERENCE_EXPOSURE * 10 ** (self._getNodeValue("Gain") / 20)
+
+    def _loadReplayImages(self):
+        replay = self.simConfig["REPLAY"]
+        paths = replay if isinstance(replay, list) else [replay]
+        files = []
+        for path in paths:
+            if os.path.isdir(path):
+                files += sorted(glob.glob(os.path.join(path, "*.*")))
+            else:
+                files.append(path)
+        images = []
+        for file in files:
+            img = cv2.imread(file, cv2.IMREAD_UNCHANGED)
+            if img is None:
+                continue
+            if img.ndim == 2:
+                img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+            images.append(img[:, :, :3])
+        if len(images) == 0:
+            raise Exception(f"No replay images in: {replay}")
+        return images
+
+    def _generateFrames(self):
+        """
+            Predgenerovane raw snimky - generovani kazdeho snimku zvlast by nestihalo 100+ fps
+        """
+        pixelFormat = self.simConfig["PIXEL_FORMAT"]
+        brightness = self._brightness()
+        if self.simConfig["REPLAY"]:
+            sources = [cv2.convertScaleAbs(img, alpha=brightness) if img.dtype == np.uint8 else img
+                for img in self._loadReplayImages()]
+        else:
+            w = self.simConfig["WIDTH"]
+            h = self.simConfig["HEIGHT"]
+            depth = "mono16" if pixelFormat in ("Mono10", "Mono12", "Mono16", "RGB16", "BGR16") else "mono8"
+            count = self.simConfig["FRAMES"]
+            sources = []
+            for i in range(count):
+                # paprsek krouzi okolo stredu
+                a = 2 * np.pi * i / count
+                sources.append(beam_image(w, h, self.simConfig["BEAM"], depth,
+                    peak=min(0.85 * brightness, 1.0), seed=i,
+                    cx=w/2 + w/40*np.cos(a), cy=h/2 + h/40*np.sin(a), sigma=w/20, angle=30))
+        frames = []
+        for src in sources:
+            data, components = toRawFormat(src, pixelFormat)
+            frames.append((data, src.shape[1], src.shape[0], components))
+        return frames
+
+    def _replayRecording(self):
+        """
+            Prehrava zaznam raw snimku dokola - v puvodnim tempu podle casu snimku
+            nebo (RECORDING_PACING = "fps") podle AcquisitionFrameRate
+        """
+        recording = FrameRecording(self.simConfig["RECORDING"])
+        if len(recording) == 0:
+            raise Exception(f"Empty frame recording: {self.simConfig['RECORDING']}")
+        original = self.simConfig["RECORDING_PACING"] == "original"
+        # prodleva pri preskoku z konce zaznamu na zacatek
+        wrapPeriod = float(np.median(np.diff(recording.timestamps))) if len(recording) > 1 else 0.1
+        logging.info(f"Replaying {len(recording)} frames from {recording.path}")
+
+        index = 0
+        nextTime = time.perf_counter()
+        while not self.grabStoppedEvent.is_set():
+            try:
+                i = index % len(recording)
+                if original:
+                    period = recording.timestamps[i] - recording.timestamps[i - 1] if i > 0 else wrapPeriod
+                else:
+                    period = 1.0 / self._getNodeValue("AcquisitionFrameRate")
+                nextTime += period
+                delay = nextTime - time.perf_counter()
+                if delay > 0:
+                    self.grabStoppedEvent.wait(delay)
+                else:
+                    nextTime = time.perf_counter()
+
+                (timestamp, data, width, height, pixelFormat, components) = recording[i]
+                index += 1
+                self._storeFrame(data, width, height, pixelFormat, components)
+            except Exception as e:
+                logging.exception("Exception during replaying frame recording")
+                self.grabStoppedEvent.wait(1)
+
+    def _grabbingWork(self):
+        if self.simConfig["RECORDING"]:
+            self._replayRecording()
+            return
+
+        pixelFormat = self.simConfig["PIXEL_FORMAT"]
+        frames = []
+        index = 0
+        nextTime = time.perf_counter()
+        while not self.grabStoppedEvent.is_set():
+            try:
+                if self.framesDirty:
+                    self.framesDirty = False
+                    frames = self._generateFrames()
+
+                period = 1.0 / self._getNodeValue("AcquisitionFrameRate")
+                nextTime += period
+                delay = nextTime - time.perf_counter()
+                if delay > 0:
+                    self.grabStoppedEvent.wait(delay)
+                else:
+                    # nestiha - nedohanet zpozdeni davkou snimku
+                    nextTime = time.perf_counter()
+
+                (data, width, height, components) = frames[index % len(frames)]
+                index += 1
+                self._storeFrame(data, width, height, pixelFormat, components)
+            except Exception as e:
+                logging.exception("Exception during simulated acquiring image")
+                self.grabStoppedEvent.wait(1)
@@ -0,0 +1,129 @@
+import itertools
+import logging
+import socket
+import threading
+import time
+
+def limitSendBuffer(sock, sizeKb):
+    """
+        Omezi send buffer socketu streamu, aby pomaly klient blokoval odesilani a dostaval posledni snimky
+        misto fronty starych snimku v systemovem bufferu
+    """
+    if sock is None or sizeKb <= 0:
+        return
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, sizeKb * 1024)
+    except Exception as e:
+        logging.warning(f"Can not limit stream send buffer: {e}")
+
+class StreamParams():
+    """
+        Pozadavky klienta na stream z query parametru: ?fps=&w=&h=&q=
+        fps = maximalni snimkova frekvence, w/h = maximalni rozmery (pomer stran se zachova),
+        q = kvalita jpg/webp; None = vychozi hodnota streamu
+    """
+    def __init__(self, fps=None, width=None, height=None, quality=None):
+        self.fps = fps
+        self.width = width
+        self.height = height
+        self.quality = quality
+
+    @staticmethod
+    def fromArgs(args):
+        """
+            args = request.args, chybna hodnota vyhodi Exception
+        """
+        def get(name, type, minValue, maxValue):
+            value = args.get(name)
+            if value is None or value == "":
+                return None
+            try:
+                value = type(value)
+            except ValueError:
+                raise Exception(f"Invalid stream parameter {name}: {value}")
+            if value < minValue or value > maxValue:
+                raise Exception(f"Stream parameter {name} out of range <{minValue}, {maxValue}>: {value}")
+            return value
+
+        return StreamParams(
+            get("fps", float, 0.1, 1000),
+            get("w", int, 16, 10000),
+            get("h", int, 16, 10000),
+            get("q", int, 1, 100),
+        )
+
+    def getSize(self):
+        """
+            Maximalni rozmery (w, h) nebo None pro puvodni velikost
+        """
+        if self.width is None and self.height is None:
+            return None
+        return (self.width, self.height)
+
+    def toDict(self):
+        return {"fps" : self.fps, "w" : self.width, "h" : self.height, "q" : self.quality}
+
+class StreamClient():
+    """
+        Statistika jednoho pripojeneho streamu
+        dropped = vysledky ktere klient nestihl (odesilani predchoziho dilu trvalo dele)
+        throttled = vysledky preskocene kvuli omezeni fps
+    """
+    def __init__(self, id, serial, kind, params : StreamParams, remote=None):
+        self.id = id
+        self.serial = serial
+        self.kind = kind
+        self.params = params
+        self.remote = remote
+        self.started = time.time()
+        self.sent = 0
+        self.sentBytes = 0
+        self.dropped = 0
+        self.throttled = 0
+        # cas odeslani posledniho dilu v ms a kdy skoncilo (time.time) - zaseknuty klient ma stary lastSent
+        self.lastSendMs = 0.0
+        self.lastSent = None
+
+    def toDict(self):
+        duration = max(time.time() - self.started, 1e-6)
+        total = self.sent + self.dropped
+        return {
+            "id" : self.id,
+            "serial" : self.serial,
+            "kind" : self.kind,
+            "params" : self.params.toDict(),
+            "remote" : self.remote,
+            "started" : self.started,
+            "sent" : self.sent,
+            "sentBytes" : self.sentBytes,
+            "dropped" : self.dropped,
+            "throttled" : self.throttled,
+            "dropRatio" : self.dropped / total if total > 0 else 0.0,
+            "fps" : self.sent / duration,
+            "lastSendMs" : self.lastSendMs,
+            "lastSent" : self.lastSent,
+        }
+
+class StreamClients():
+    """
+        Registr pripojenych streamu vsech kamer
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clients = {}
+        self.ids = itertools.count(1)
+
+    def add(self, serial, kind, params : StreamParams, remote=None) -> StreamClient:
+        with self.lock:
+            client = StreamClient(next(self.ids), serial, kind, params, remote)
+            self.clients[client.id] = client
+        return client
+
+    def remove(self, client : StreamClient):
+        with self.lock:
+            self.clients.pop(client.id, None)
+
+    def snapshot(self):
+        with self.lock:
+            clients = list(self.clients.values())
+        return [c.toDict() for c in clients]
@@ -0,0 +1,63 @@
+import cv2
+import numpy as np
+
+# Generovani umelych snimku paprsku - benchmark a simulovana kamera
+
+SENSOR_SIZES = {
+    "VGA" : (640, 480),
+    "2MP" : (1600, 1200),
+    "4MP" : (2048, 2048),
+    "12MP" : (4000, 3000),
+}
+
+BEAM_SHAPES = ("gaussian", "elliptical", "tophat")
+
+def beam_profile( width, height, shape="gaussian", cx=None, cy=None, sigma=None, angle=0.0 ):
+    """
+        Intenzita paprsku 0-1 jako float32 (height, width)
+        sigma v px (default 1/20 sirky), elliptical ma osu y 0.5x a je natoceny o angle stupnu
+    """
+    cx = width / 2 if cx is None else cx
+    cy = height / 2 if cy is None else cy
+    sigma = width / 20 if sigma is None else sigma
+
+    x = np.arange(width, dtype=np.float32) - np.float32(cx)
+    y = np.arange(height, dtype=np.float32) - np.float32(cy)
+    if shape == "gaussian":
+        # separabilni - jen dva 1D vektory
+        gx = np.exp(-0.5 * (x / sigma) ** 2)
+        gy = np.exp(-0.5 * (y / sigma) ** 2)
+        return np.outer(gy, gx).astype(np.float32)
+
+    xx, yy = np.meshgrid(x, y)
+    if shape == "elliptical":
+        a = np.deg2rad(angle)
+        u = xx * np.cos(a) + yy * np.sin(a)
+        v = -xx * np.sin(a) + yy * np.cos(a)
+        return np.exp(-0.5 * ((u / sigma) ** 2 + (v / (sigma * 0.5)) ** 2)).astype(np.float32)
+    if shape == "tophat":
+        r = np.sqrt(xx ** 2 + yy ** 2) / (2 * sigma)
+        # super-gauss radu 10 = plochy vrchol se strmymi hranami
+        return np.exp(-2 * r ** 10).astype(np.float32)
+    raise Exception(f"Unknown beam shape: {shape}")
+
+def beam_image( width, height, shape="gaussian", depth="mono8", noise=2.0, background=8.0, peak=0.85, seed=None, **kwargs ):
+    """
+        Snimek paprsku ve formatu jaky dava HarvesterWrapper (3 kanaly)
+        depth: "mono8" (sedy ve 3 kanalech), "bgr8" (barevny paprsek), "mono16" (uint16, 12bit rozsah)
+        noise/background/peak relativne k rozsahu 8bit (255)
+    """
+    rng = np.random.default_rng(seed)
+    fullScale = 4095.0 if depth == "mono16" else 255.0
+    scale = fullScale / 255.0
+    img = beam_profile(width, height, shape, **kwargs) * np.float32(peak * fullScale)
+    img += np.float32(background * scale)
+    if noise > 0:
+        img += rng.standard_normal((height, width), dtype=np.float32) * np.float32(noise * scale)
+
+    dtype = np.uint16 if depth == "mono16" else np.uint8
+    gray = np.clip(img, 0, fullScale).astype(dtype)
+    if depth == "bgr8":
+        # cerveny laser - B a G slabsi
+        return cv2.merge([(gray * 0.2).astype(dtype), (gray * 0.5).astype(dtype), gray])
+    return cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
@@ -0,0 +1,30 @@
+import cv2
+import pytest
+
+from beamMoments import measure_moments
+from syntheticBeam import beam_image
+
+def gray_image(**kwargs):
+    return cv2.cvtColor(beam_image(640, 480, seed=1, **kwargs), cv2.COLOR_BGR2GRAY)
+
+def test_d4s_gaussian():
+    # D4sigma gaussovskeho paprsku = 4 sigma
+    m = measure_moments(gray_image(shape="gaussian", sigma=30, cx=300, cy=250))
+    assert m is not None
+    assert m["width"] == pytest.approx(120, rel=0.03)
+    assert m["height"] == pytest.approx(120, rel=0.03)
+    assert m["centroid_x"] == pytest.approx(300, abs=0.5)
+    assert m["centroid_y"] == pytest.approx(250, abs=0.5)
+    assert not m["truncated"]
+
+def test_d4s_elliptical():
+    # osa y elliptical je 0.5x sigma, natoceni o angle
+    m = measure_moments(gray_image(shape="elliptical", sigma=30, angle=30.0))
+    assert m["major"] == pytest.approx(120, rel=0.03)
+    assert m["minor"] == pytest.approx(60, rel=0.03)
+    assert m["ellipticity"] == pytest.approx(0.5, abs=0.02)
+    assert m["orientation_deg"] == pytest.approx(30.0, abs=1.0)
+
+def test_no_beam():
+    gray = cv2.cvtColor(beam_image(64, 64, peak=0.0, noise=0.0, seed=1), cv2.COLOR_BGR2GRAY)
+    assert measure_moments(gray) is None
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from beamProfile import find_edges, profile_width
+
+def test_find_edges_subpixel():
+    # linearni hrany - interpolace je presna
+    profile = np.array([0, 10, 20, 30, 40, 30, 20, 10, 0], dtype=np.uint8)
+    (left, right) = find_edges(profile, 4, 15)
+    assert left == pytest.approx(1.5)
+    assert right == pytest.approx(6.5)
+
+def test_profile_width_gaussian():
+    # FWHM gaussovskeho profilu = 2 sqrt(2 ln 2) sigma
+    sigma = 12.3
+    x = np.arange(200, dtype=np.float32)
+    profile = np.exp(-0.5 * ((x - 97.4) / sigma) ** 2).astype(np.float32)
+    (start, width) = profile_width(profile, 97, 0.5)
+    assert isinstance(width, float)
+    assert width == pytest.approx(2 * np.sqrt(2 * np.log(2)) * sigma, abs=0.05)
+    assert start == int(np.ceil(97.4 - np.sqrt(2 * np.log(2)) * sigma))
+
+def test_missing_edge():
+    profile = np.array([50, 40, 30, 20, 10, 0], dtype=np.uint8)
+    assert find_edges(profile, 0, 15)[0] is None
+    (start, width) = profile_width(profile, 0, 15)
+    assert start is None
+    assert width == 0.0 and isinstance(width, float)
+    # chybi jen prava hrana
+    assert profile_width(profile[::-1], 5, 15) == (2, 0.0)
+    # centrum pod level - zadny paprsek
+    assert find_edges(profile, 5, 15) == (None, None)
+    assert profile_width(profile, 5, 15) == (None, 0.0)
@@ -0,0 +1,45 @@
+import numpy as np
+
+from frameRing import FrameRing
+
+def write(ring, value):
+    buffer = ring.beginWrite((4, 4), np.uint8)
+    buffer[:] = value
+    return ring.commitWrite()
+
+def test_borrow_without_copy():
+    ring = FrameRing(2)
+    seq = write(ring, 1)
+    frame = ring.waitForFrame(0, 0)
+    assert frame.seq == seq
+    assert np.all(frame.image == 1)
+    # zadny novejsi snimek
+    assert ring.waitForFrame(seq, 0) is None
+    assert frame.release()
+    assert ring.overwrites == 0
+
+def test_overwrite_detection():
+    ring = FrameRing(2)
+    write(ring, 1)
+    first = ring.waitForFrame(0, 0)
+    write(ring, 2)
+    second = ring.waitForFrame(first.seq, 0)
+    # oba sloty drzi ctenari - dalsi snimek prepise nejstarsi
+    write(ring, 3)
+    assert ring.overwrites == 1
+    assert np.all(first.image == 3)
+    assert not first.release()
+    assert first.overwritten
+    assert second.release()
+    assert not second.overwritten
+
+def test_free_slot_preferred():
+    ring = FrameRing(3)
+    write(ring, 1)
+    frame = ring.waitForFrame(0, 0)
+    # ctenar drzi slot - zapisuje se do volnych slotu
+    for value in range(2, 6):
+        write(ring, value)
+    assert ring.overwrites == 0
+    assert np.all(frame.image == 1)
+    assert frame.release()
@@ -0,0 +1,64 @@
+import numpy as np
+
+from measurementRecorder import MeasurementRecorder, RECORD_FIELDS, openRecords, readRange
+
+def make_config(directory):
+    return {
+        "DIRECTORY" : str(directory),
+        "MAX_FILE_MB" : 10,
+        "MAX_FILE_MINUTES" : 60,
+        "BATCH_SIZE" : 8,
+        "FLUSH_SECONDS" : 0.1,
+    }
+
+def record(recorder, serial, timestamps):
+    recorder.start(serial)
+    for (i, timestamp) in enumerate(timestamps):
+        measData = {name : float(i) for name in RECORD_FIELDS}
+        recorder.add(i + 1, timestamp, measData)
+    recorder.stop()
+
+def test_write_read_range(tmp_path):
+    recorder = MeasurementRecorder(make_config(tmp_path))
+    timestamps = 1000.0 + np.arange(50) * 0.1
+    record(recorder, "CAM1", timestamps)
+
+    files = list(tmp_path.glob("meas_CAM1_*.bin"))
+    assert len(files) == 1
+    (header, records) = openRecords(str(files[0]))
+    assert header["serial"] == "CAM1"
+    assert records.shape[0] == 50
+
+    records = readRange(str(tmp_path))
+    np.testing.assert_array_equal(records["timestamp"], timestamps)
+    np.testing.assert_array_equal(records["seq"], np.arange(1, 51))
+    np.testing.assert_array_equal(records["beam_width_px"], np.arange(50, dtype=np.float32))
+
+    # interval <start, end)
+    records = readRange(str(tmp_path), timestamps[10], timestamps[20])
+    np.testing.assert_array_equal(records["seq"], np.arange(11, 21))
+    assert readRange(str(tmp_path), 2000.0).shape[0] == 0
+
+def test_read_range_merges_cameras(tmp_path):
+    record(MeasurementRecorder(make_config(tmp_path)), "CAM1", 1000.0 + np.arange(10) * 0.2)
+    record(MeasurementRecorder(make_config(tmp_path)), "CAM2", 1000.1 + np.arange(10) * 0.2)
+
+    records = readRange(str(tmp_path))
+    assert records.shape[0] == 20
+    assert np.all(np.diff(records["timestamp"]) > 0)
+    assert readRange(str(tmp_path), serial="CAM2").shape[0] == 10
+
+def test_stop_after_writer_failure(tmp_path):
+    recorder = MeasurementRecorder(make_config(tmp_path))
+    def fail(records):
+        raise IOError("disk full")
+    recorder._writeBatch = fail
+    recorder.start("CAM1")
+    measData = dict.fromkeys(RECORD_FIELDS, 0.0)
+    # zaplnit frontu i po skonceni zapisovaciho threadu
+    for i in range(recorder.batchSize * 100):
+        recorder.add(i + 1, 1000.0 + i, measData)
+    recorder.thread.join(5)
+    recorder.add(0, 0.0, measData)
+    recorder.stop()
+    assert recorder.thread is None
@@ -24,16 +24,17 @@ function actionCreator(socket, msgConstant, emitData){
     })
 }
 
-export async function updateNode (socket, node, value){
-    return actionCreator(socket, "UPDATE_NODE", {node, value})
+// serial = serial number spustene kamery (vice kamer najednou), bez serial prvni spustena
+export async function updateNode (socket, node, value, serial){
+    return actionCreator(socket, "UPDATE_NODE", {node, value, serial})
 }
 
 export async function startCapture (socket, deviceInfo){
     return actionCreator(socket, "START_CAPTURE", deviceInfo)
 }
 
-export async function stopCapture (socket){
-    return actionCreator(socket, "STOP_CAPTURE")
+export async function stopCapture (socket, serial){
+    return actionCreator(socket, "STOP_CAPTURE", {serial})
 }
 
 export async function getDevices (socket){
@@ -44,10 +45,59 @@ export async function getConfig (socket){
     return actionCreator(socket, "GET_CONFIG")
 }
 
-export async function getMeasData (socket){
-    return actionCreator(socket, "GET_MEAS_DATA")
+export async function getMeasData (socket, serial){
+    return actionCreator(socket, "GET_MEAS_DATA", {serial})
+}
+
+// server posila MEAS_DATA z kazdeho decimation-teho zpracovaneho snimku
+export async function subscribeMeasData (socket, decimation, serial){
+    return actionCreator(socket, "SUBSCRIBE_MEAS_DATA", {decimation, serial})
+}
+
+export async function unsubscribeMeasData (socket, serial){
+    return actionCreator(socket, "UNSUBSCRIBE_MEAS_DATA", {serial})
+}
+
+// server posila PROFILE_DATA (profily rezu centroidem jako ArrayBuffer) z kazdeho decimation-teho snimku
+export async function subscribeProfiles (socket, decimation, serial){
+    return actionCreator(socket, "SUBSCRIBE_PROFILES", {decimation, serial})
+}
+
+export async function unsubscribeProfiles (socket, serial){
+    return actionCreator(socket, "UNSUBSCRIBE_PROFILES", {serial})
+}
+
+// mrizka size x size pro 3D graf (event SURFACE_DATA, data jako ArrayBuffer), fps = maximalni frekvence
+export async function subscribeSurface (socket, size, fps, serial){
+    return actionCreator(socket, "SUBSCRIBE_SURFACE", {size, fps, serial})
+}
+
+export async function unsubscribeSurface (socket, serial){
+    return actionCreator(socket, "UNSUBSCRIBE_SURFACE", {serial})
+}
+
+// historie mereni jako sloupce {timestamp: [...], seq: [...], centroid_x_px: [...], ...}
+export async function getMeasHistory (socket, seconds, serial){
+    return actionCreator(socket, "GET_MEAS_HISTORY", {seconds, serial})
 }
 
 export async function getInitState (socket){
     return actionCreator(socket, "GET_INIT_STATE")
-}
\ No newline at end of file
+}
+
+// kalibrace aktualni expozice kamery: kind = "dark" / "flat" (bez kind u clear obe)
+export async function captureDarkFrame (socket, frames, serial){
+    return actionCreator(socket, "CAPTURE_DARK_FRAME", {frames, serial})
+}
+
+export async function captureFlatField (socket, frames, serial){
+    return actionCreator(socket, "CAPTURE_FLAT_FIELD", {frames, serial})
+}
+
+export async function clearCalibration (socket, kind, serial){
+    return actionCreator(socket, "CLEAR_CALIBRATION", {kind, serial})
+}
+
+export async function getCalibration (socket, serial){
+    return actionCreator(socket, "GET_CALIBRATION", {serial})
+}
@@ -1,12 +1,13 @@
 import React, { useEffect, useRef, useState } from "react"
 import Loader from "./Loader"
 import { io } from "socket.io-client"
-import { startCapture, stopCapture, getDevices, getConfig, updateNode, getMeasData, getInitState } from "../apiFunctions"
+import { startCapture, stopCapture, getDevices, getConfig, updateNode, subscribeMeasData, unsubscribeMeasData, subscribeProfiles, unsubscribeProfiles, getInitState } from "../apiFunctions"
 import Video from "./Video"
 import VideoControls from "./VideoControls"
 import ErrorBoundary from "./ErrorBoundary"
 import CameraConnect from "./CameraConnect"
 import MeasData from "./MeasData"
+import ProfileChart from "./ProfileChart"
 
 
 const socket = io();
@@ -22,13 +23,44 @@ export default function App(props){
     const [capturing, setCapturing] = useState(false)
     const capturingRef = useRef(false)
     const [measuringData, setMeasuringData] = useState(null)
+    const [profileData, setProfileData] = useState(null)
+    const decimationRef = useRef(1)
+    const profileDecimationRef = useRef(1)
+    // serial number kamery kterou GUI zobrazuje
+    const [serial, setSerial] = useState(null)
+    const serialRef = useRef(null)
 
     useEffect(() => {
         capturingRef.current = capturing
     }, [capturing])
 
     useEffect(() => {
+        serialRef.current = serial
+    }, [serial])
+
+    useEffect(() => {
+        // mereni posila server sam po zpracovani snimku
+        socket.on("MEAS_DATA", (data) => {
+            if (capturingRef.current && data.serial === serialRef.current){
+                setMeasuringData(data)
+            }
+        })
+        // profily rezu centroidem - graf kresli prohlizec
+        socket.on("PROFILE_DATA", (data) => {
+            if (capturingRef.current && data.serial === serialRef.current){
+                setProfileData(data)
+            }
+        })
+        // po znovupripojeni ma klient nove sid - prihlasit znovu
+        socket.on("connect", () => {
+            if (capturingRef.current){
+                subscribeMeasuringData(serialRef.current)
+            }
+        })
+
         getConfig(socket).then((config) => {
+            decimationRef.current = config.MEAS_PUSH_DECIMATION
+            profileDecimationRef.current = config.PROFILE_PUSH_DECIMATION
             setConfig(config)
         }).catch((data) => {
             console.error(data)
@@ -39,38 +71,42 @@ export default function App(props){
             setCapturing(state.capturing)
             setDevices(state.devices)
             if (state.capturing){
+                setSerial(state.serial)
+                serialRef.current = state.serial
                 setControlNodes(state.nodes)
-                getMeasuringDataStream()
+                subscribeMeasuringData(state.serial)
             }
         }).catch((data) => {
             console.error(data)
             alertify.error("Error while getting app state")
         })        
-        
+
+        return () => {
+            socket.off("MEAS_DATA")
+            socket.off("PROFILE_DATA")
+            socket.off("connect")
+        }
     }, [])
 
-    function getMeasuringDataStream(){
-        getMeasData(socket).then((data) => {
-            console.log(data)
-            setMeasuringData(data)
-        }).catch((data) => {
+    function subscribeMeasuringData(serial){
+        subscribeMeasData(socket, decimationRef.current, serial).catch((data) => {
             console.error(data)
-            alertify.error("Error while getting measuring data")
-        }).finally(() => {
-            setTimeout(() => {
-                if (capturingRef.current){
-                    getMeasuringDataStream()
-                }
-            }, 20)
+            alertify.error("Error while subscribing measuring data")
+        })
+        subscribeProfiles(socket, profileDecimationRef.current, serial).catch((data) => {
+            console.error(data)
+            alertify.error("Error while subscribing profiles")
         })
     }
     
     function onStartCaputure(device){
         setWorking(true)
         startCapture(socket, device).then((controlNodes)=>{
+            setSerial(device.serial_number)
+            serialRef.current = device.serial_number
             setCapturing(true)
             setControlNodes(controlNodes)
-            getMeasuringDataStream()
+            subscribeMeasuringData(device.serial_number)
         }).catch((err) => {
             alertify.error("Can not start capture: " + err)
             console.log(err)
@@ -83,10 +119,13 @@ export default function App(props){
 
     function onStopCaputure(device){
         setWorking(true)
-        stopCapture(socket).then(()=>{
+        unsubscribeMeasData(socket, serial).catch((data) => console.error(data))
+        unsubscribeProfiles(socket, serial).catch((data) => console.error(data))
+        stopCapture(socket, serial).then(()=>{
             setCapturing(false)
             setControlNodes(null)
             setMeasuringData(null)
+            setProfileData(null)
         }).catch((err) => {
             alertify.error("Can not stop capture: " + err)
             console.log(err)
@@ -97,7 +136,7 @@ export default function App(props){
 
     function onNodeChange(node, value){
         setWorking(true)
-        updateNode(socket, node, value).then((nodes)=>{
+        updateNode(socket, node, value, serial).then((nodes)=>{
             setWorking(false)
             setControlNodes(nodes)
         }).catch((err) => {
@@ -150,7 +189,7 @@ export default function App(props){
                         <div className="sixteen wide column">
                             {   capturing ? 
                                     <div>
-                                        <img src="/main" />
+                                        <img src={"/" + serial + "/main"} />
                                     </div>
                                     :
                                     null
@@ -160,7 +199,7 @@ export default function App(props){
                             {   capturing ? 
                                     <React.Fragment>
                                         <h3>Horizontal centroid</h3>
-                                        <img src="/cut_horizontal" />
+                                        <ProfileChart data={profileData} axis="horizontal" />
                                     </React.Fragment>
                                     :
                                     null
@@ -170,7 +209,7 @@ export default function App(props){
                             {   capturing ?
                                     <React.Fragment>
                                         <h3>Vertical centroid</h3>
-                                        <img src="/cut_vertical" />
+                                        <ProfileChart data={profileData} axis="vertical" />
                                     </React.Fragment>
                                     :
                                     null
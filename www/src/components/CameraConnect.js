@@ -42,8 +42,8 @@ export default function CameraConnect(props){
     }
 
     function onChangeDevice(event){
-        const selectedModel = event.currentTarget.value
-        const device = devices.find(val => val.model===selectedModel)
+        const selectedSerial = event.currentTarget.value
+        const device = devices.find(val => val.serial_number===selectedSerial)
         setSelectedDevice({"model" : device.model, "serial_number" : device.serial_number})
     }
     
@@ -71,13 +71,13 @@ export default function CameraConnect(props){
     return <div className="ui form">
             <select
                 className="ui dropdown"
-                value={selectedDevice ? selectedDevice.model : ""}
+                value={selectedDevice ? selectedDevice.serial_number : ""}
                 onChange={onChangeDevice} 
                 ref={dropdownEl}
             >
                 {(devices ? devices : []).map((dev) => {
-                    return <option value={dev.model} key={dev.model} disabled={dev.access_status !== "READY"}>
-                        {dev.model} [{dev.access_status}]
+                    return <option value={dev.serial_number} key={dev.serial_number} disabled={dev.access_status !== "READY"}>
+                        {dev.model} {dev.serial_number} [{dev.access_status}]
                     </option>
                 })}
             </select>
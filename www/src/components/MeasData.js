@@ -31,6 +31,10 @@ export default function MeasData(props){
         <h2>Width Y</h2>
         <h1 style={{fontSize:"55px", marginTop: "0.3em"}}>{data.beam_height_um}&nbsp;&micro;m</h1>
 
+        <h2>D4&sigma; X / Y</h2>
+        <h1 style={{fontSize:"35px", marginTop: "0.3em"}}>{data.d4s_width_um}&nbsp;/&nbsp;{data.d4s_height_um}&nbsp;&micro;m</h1>
+        <h2>Ellipticity {Number(data.ellipticity || 0).toFixed(2)}, angle {Number(data.orientation_deg || 0).toFixed(1)}&deg;</h2>
+
         
     </div>
 }
\ No newline at end of file
@@ -0,0 +1,92 @@
+import React, { useEffect, useRef } from "react"
+
+const HEIGHT = 280
+const GRID_COLOR = "rgb(90, 90, 90)"
+const FONT = "10px sans-serif"
+
+// profil z PROFILE_DATA (ArrayBuffer) jako typed array
+function profileArray(data, axis){
+    const buffer = data[axis]
+    return data.dtype === "float32" ? new Float32Array(buffer) : new Uint8Array(buffer)
+}
+
+// stejny graf jako puvodni serverovy rez (CameraImg.draw_centroid_cut):
+// osa x v mikronech od stredu, osa y intenzita, signal bile
+function drawProfile(canvas, data, axis){
+    const ctx = canvas.getContext("2d")
+    const w = canvas.width
+    const h = canvas.height
+    ctx.fillStyle = "black"
+    ctx.fillRect(0, 0, w, h)
+    if (!data || !data.found){
+        return
+    }
+    const profile = profileArray(data, axis)
+    let maxValue = 255
+    if (data.dtype !== "uint8"){
+        for (let i = 0; i < profile.length; i++){
+            maxValue = Math.max(maxValue, profile[i])
+        }
+    }
+    const scaleY = 255 / maxValue
+
+    ctx.strokeStyle = GRID_COLOR
+    ctx.fillStyle = GRID_COLOR
+    ctx.font = FONT
+    ctx.lineWidth = 1
+
+    // svisle carky po 1000 um, nula ve stredu + posun center_x_um
+    const center = axis === "horizontal" ? data.center_x_um : data.center_y_um
+    const bigStep = 1000 / data.um_per_px
+    const zero = w / 2 - center / data.um_per_px
+    const first = Math.ceil(-zero / bigStep)
+    for (let i = first; zero + i * bigStep < w; i++){
+        const x = Math.round(zero + i * bigStep) + 0.5
+        ctx.beginPath()
+        ctx.moveTo(x, 0)
+        ctx.lineTo(x, h)
+        ctx.stroke()
+        ctx.fillText(String(i * 1000), x + 3, h - 5)
+    }
+    // vodorovne carky intenzity po 50
+    for (let y = 0; y < 255; y += 50){
+        const py = Math.round(h - y) + 0.5
+        ctx.beginPath()
+        ctx.moveTo(0, py)
+        ctx.lineTo(w, py)
+        ctx.stroke()
+        ctx.fillText(String(Math.round(y / scaleY)), 2, py - 2)
+    }
+
+    ctx.strokeStyle = "white"
+    ctx.beginPath()
+    for (let i = 0; i < profile.length; i++){
+        const y = h - profile[i] * scaleY
+        if (i === 0){
+            ctx.moveTo(i, y)
+        }else{
+            ctx.lineTo(i, y)
+        }
+    }
+    ctx.stroke()
+}
+
+// graf rezu centroidem kresleny v prohlizeci z PROFILE_DATA
+// axis = "horizontal" (delka = sirka obrazu) nebo "vertical" (delka = vyska obrazu)
+export default function ProfileChart(props){
+    const { data, axis } = props
+    const canvasRef = useRef(null)
+
+    const length = data ? (axis === "horizontal" ? data.width : data.height) : 0
+
+    useEffect(() => {
+        if (canvasRef.current){
+            drawProfile(canvasRef.current, data, axis)
+        }
+    }, [data, axis])
+
+    if (!length){
+        return null
+    }
+    return <canvas ref={canvasRef} width={length} height={HEIGHT} />
+}